@@ -82,7 +82,7 @@ setup(
     install_requires=[
         "bleach[css]>=5",
         "cryptography>=2.4",
-        "dash>=2.0",
+        "dash>=2.5",
         "dash-pivottable>=0.0.2",
         "flask>=2.0",
         "flask-caching>=1.4",
@@ -112,6 +112,8 @@ setup(
             "azure-mgmt-subscription",
             "azure-storage-blob",
         ],
+        "metrics": ["prometheus-client>=0.14"],
+        "watch": ["watchdog>=2.0"],
     },
     setup_requires=["setuptools_scm>=7,<10"],
     python_requires=">=3.10",
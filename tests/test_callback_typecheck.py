@@ -194,3 +194,20 @@ def test_callback_typecheck() -> None:
 
     assert callback_typecheck(expect_optional_dict_with_any)({"1": "1"}) == {"1": "1"}
     assert callback_typecheck(expect_optional_dict_with_any)(None) is None
+
+    ############################################################
+
+    def expect_list_of_dicts(arg: List[Dict[str, int]]) -> List[Dict[str, int]]:
+        return arg
+
+    data = [{"x": 1}, {"y": 2}]
+    assert callback_typecheck(expect_list_of_dicts)(data) is data
+    assert callback_typecheck(expect_list_of_dicts)([{"x": "1"}]) == [{"x": 1}]
+
+    ############################################################
+
+    # Equal to `Union[str, int]` above, but conversions are tried in another order
+    def expect_reversed_union(arg: Union[int, str]) -> Union[int, str]:
+        return arg
+
+    assert callback_typecheck(expect_reversed_union)(1.5) == 1
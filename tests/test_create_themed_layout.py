@@ -2,6 +2,7 @@ from pathlib import Path
 from unittest import mock
 
 import dash
+import plotly.io as pio
 
 from webviz_config import WebvizConfigTheme
 from webviz_config.common_cache import CACHE
@@ -119,6 +120,45 @@ def test_create_themed_layout():
     }
 
 
+def test_memoized_themed_layout():
+    test_theme = WebvizConfigTheme(theme_name="test")
+    test_theme.plotly_theme = {"layout": {"font": {"family": "Arial"}}}
+
+    themed_layout = test_theme.create_themed_layout({"font": {"size": 12}})
+    assert themed_layout == {"font": {"family": "Arial", "size": 12}}
+
+    # Memoized layouts are returned as independent, mutable copies
+    themed_layout["font"]["size"] = 14
+    assert test_theme.create_themed_layout({"font": {"size": 12}}) == {
+        "font": {"family": "Arial", "size": 12}
+    }
+
+    # Changing the plotly theme invalidates memoized layouts
+    test_theme.plotly_theme_layout_update({"font": {"color": "red"}})
+    assert test_theme.create_themed_layout({"font": {"size": 12}}) == {
+        "font": {"family": "Arial", "color": "red", "size": 12}
+    }
+
+
+def test_plotly_template():
+    test_theme = WebvizConfigTheme(theme_name="test")
+    test_theme.plotly_theme = {"layout": {"font": {"family": "Arial"}}}
+
+    template = test_theme.register_plotly_template()
+    assert pio.templates[template].layout.font.family == "Arial"
+    assert test_theme.frozen().plotly_template == template
+
+    test_theme.plotly_theme_layout_update({"font": {"color": "red"}})
+    assert test_theme.plotly_template != template
+    assert pio.templates[test_theme.plotly_template].layout.font.color == "red"
+
+    # The template can also be registered from a read-only theme
+    frozen_theme = WebvizConfigTheme(theme_name="frozen")
+    frozen_theme.plotly_theme = {"layout": {"font": {"family": "Courier"}}}
+    frozen_template = frozen_theme.frozen().plotly_template
+    assert pio.templates[frozen_template].layout.font.family == "Courier"
+
+
 def test_create_themed_layout_on_app(dash_duo):
     # Test themed with a running app
     app = dash.Dash(__name__)
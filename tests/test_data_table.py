@@ -1,6 +1,7 @@
 from unittest import mock
 
 import pandas as pd
+import pytest
 import dash
 
 from webviz_config.common_cache import CACHE
@@ -38,3 +39,80 @@ def test_data_table_with_settings(dash_duo):
         app.layout = page.layout
         dash_duo.start_server(app)
         assert not dash_duo.get_logs(), "browser console should contain no error"
+
+
+def test_data_table_server_side_query():
+    app = dash.Dash(__name__)
+    CACHE.init_app(app.server)
+    code_file = "./tests/data/example_data.csv"
+    with mock.patch(GET_DATA) as mock_path:
+        mock_path.return_value = pd.read_csv(code_file)
+        page = _data_table.DataTable(app, csv_file=code_file, server_side=True)
+
+    page_data, page_count = page.query(0, 2, [], "")
+    assert page_count == 3
+    assert page_data["Well"].to_list() == ["A-1H", "A-2H"]
+
+    page_data, page_count = page.query(
+        0,
+        2,
+        [{"column_id": "Initial reservoir pressure (bar)", "direction": "desc"}],
+        "",
+    )
+    assert page_data["Well"].to_list() == ["C-1H", "A-1H"]
+
+    page_data, page_count = page.query(
+        0,
+        2,
+        [{"column_id": "Average permeability (D)", "direction": "asc"}],
+        "{Segment} = A && {Initial reservoir pressure (bar)} > 300",
+    )
+    assert page_count == 1
+    assert page_data["Well"].to_list() == ["A-1H", "A-2H"]
+
+    page_data, _ = page.query(0, 10, [], '{Well} contains "B"')
+    assert page_data["Well"].to_list() == ["B-1H"]
+
+    # The page size given by the browser is limited
+    page.df = pd.concat([page.df] * 300, ignore_index=True)
+    page_data, page_count = page.query(0, 10**9, [], "")
+    assert len(page_data) == _data_table.MAX_PAGE_SIZE
+    assert page_count == 2
+
+
+def test_data_table_filter_mask():
+    dframe = pd.read_csv("./tests/data/example_data.csv")
+    dframe.loc[1, "Segment"] = None
+
+    def wells(filter_query):
+        return dframe["Well"][_data_table.filter_mask(dframe, filter_query)].to_list()
+
+    assert not wells("{Initial reservoir pressure (bar)} > abc")
+    assert len(wells("{Initial reservoir pressure (bar)} != abc")) == len(dframe)
+    assert wells("{Well} icontains b") == ["B-1H"]
+    assert not wells("{Well} scontains b")
+    assert wells("{Segment} is blank") == ["A-2H"]
+    assert wells("{Initial reservoir pressure (bar)} is even") == [
+        "A-1H",
+        "A-2H",
+        "A-3H",
+        "B-1H",
+        "C-1H",
+    ]
+    assert wells("{Well} is str && {Segment} = C") == ["C-1H"]
+
+    dframe.loc[0, "Well"] = "A && B"
+    assert wells('{Well} = "A && B" && {Segment} != C') == ["A && B"]
+    assert _data_table.split_filter_query("{A && B} = 'it\\'s && x' && {C} > 1") == [
+        "{A && B} = 'it\\'s && x'",
+        "{C} > 1",
+    ]
+
+    for filter_query in [
+        "{Well} is prime",
+        "{Well} contains A || {Well} contains B",
+        "!({Well} contains A)",
+        "{Unknown} = 1",
+    ]:
+        with pytest.raises(ValueError):
+            _data_table.filter_mask(dframe, filter_query)
@@ -0,0 +1,60 @@
+import dash
+import pandas as pd
+import pytest
+
+from webviz_config.common_cache import CACHE
+from webviz_config.generic_plugins._pivot_table import PivotTable, pivot_dataframe
+
+
+def test_server_side_pivot():
+    dframe = pd.read_csv("./tests/data/example_data.csv")
+
+    table = pivot_dataframe(dframe, ["Segment"], [], "Count")
+    assert table.columns.to_list() == ["Segment", "Count"]
+    assert table["Count"].sum() == len(dframe)
+
+    table = pivot_dataframe(
+        dframe, ["Segment"], ["Well"], "Sum", "Initial reservoir pressure (bar)"
+    )
+    expected = pd.pivot_table(
+        dframe,
+        index="Segment",
+        columns="Well",
+        values="Initial reservoir pressure (bar)",
+        aggfunc="sum",
+    )
+    assert table.columns.to_list() == ["Segment"] + expected.columns.to_list()
+    pd.testing.assert_frame_equal(
+        table.set_index("Segment"), expected, check_names=False
+    )
+
+    with pytest.raises(ValueError):
+        pivot_dataframe(dframe, ["Segment"], [], "Sum over Sum", "Well")
+
+    with pytest.raises(ValueError, match="numeric"):
+        pivot_dataframe(dframe, ["Segment"], [], "Average", "Well")
+    with pytest.raises(ValueError, match="Unknown columns"):
+        pivot_dataframe(dframe, ["Segment"], ["Unknown"], "Sum", "Well")
+    with pytest.raises(ValueError, match="Unknown columns"):
+        pivot_dataframe(dframe, ["Segment"], [], "Count Unique Values", "Unknown")
+
+
+def test_server_side_pivot_aggregators():
+    app = dash.Dash(__name__)
+    CACHE.init_app(app.server)
+    csv_file = "./tests/data/example_data.csv"
+
+    plugin = PivotTable(app, csv_file, server_side=True)
+    assert plugin.value_columns("Sum") == [
+        "Average permeability (D)",
+        "Initial reservoir pressure (bar)",
+    ]
+    assert "Well" in plugin.value_columns("Count Unique Values")
+
+    with pytest.raises(ValueError, match="not supported"):
+        PivotTable(
+            app,
+            csv_file,
+            options={"aggregatorName": "Sum over Sum"},
+            server_side=True,
+        )
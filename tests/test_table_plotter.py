@@ -2,6 +2,8 @@ import time
 from pathlib import Path
 
 import dash
+import numpy as np
+import pandas as pd
 from dash.testing.composite import DashComposite
 
 from webviz_config import WebvizSettings
@@ -104,3 +106,23 @@ def test_initialized_table_plotter(dash_duo: DashComposite) -> None:
     # Checking that plot options are defined
     assert page.plot_options == plot_options
     assert page.lock
+
+
+def test_aggregated_distribution_plots() -> None:
+    app = dash.Dash(__name__)
+    CACHE.init_app(app.server)
+    webviz_settings = WebvizSettings({}, default_theme)
+    csv_file = Path("./tests/data/example_data.csv")
+    page = _table_plotter.TablePlotter(app, webviz_settings, csv_file, max_points=1000)
+
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame(
+        {"GROUP": rng.choice(["A", "B", "C"], 10000), "Y": rng.normal(size=10000)}
+    )
+    for plot_type in ["box", "violin"]:
+        # The x column is also used as color
+        sketch, _ = page.aggregate(
+            data, plot_type, {"x": "GROUP", "y": "Y", "color": "GROUP"}
+        )
+        assert len(sketch) < len(data)
+        assert set(sketch["GROUP"]) == {"A", "B", "C"}
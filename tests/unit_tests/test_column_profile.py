@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+
+from webviz_config.utils import dataset_profile
+
+
+def test_dataset_profile() -> None:
+    dframe = pd.DataFrame(
+        {
+            "REAL": [0, 1, 2, 3],
+            "ZONE": ["A", "B", None, "A"],
+            "VALUE": [1.0, np.nan, 3.0, 5.0],
+        }
+    )
+    profile = dataset_profile("test_dataset_profile.csv", dframe)
+
+    assert profile.columns == ["REAL", "ZONE", "VALUE"]
+    assert profile.numeric_columns == ["REAL", "VALUE"]
+    assert profile.row_count == 4
+
+    assert profile["ZONE"].unique_values[:2] == ["A", "B"]
+    assert pd.isna(profile["ZONE"].unique_values[2])
+    assert profile["ZONE"].cardinality == 2
+    assert profile["ZONE"].null_count == 1
+    assert profile["ZONE"].minimum is None
+
+    assert profile["VALUE"].null_count == 1
+    assert (profile["VALUE"].minimum, profile["VALUE"].maximum) == (1.0, 5.0)
+    assert profile["VALUE"].mean == 3.0
+
+    # The profile is shared by all users of the same dataset
+    assert dataset_profile("test_dataset_profile.csv", dframe.copy()) is profile
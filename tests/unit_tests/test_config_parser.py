@@ -0,0 +1,12 @@
+import pathlib
+
+from webviz_config._config_parser import _call_signature
+
+
+def test_special_argument_defaults_are_not_given_as_keyword_arguments() -> None:
+    # DataTable has an optional webviz_settings argument
+    call_signature, _ = _call_signature(
+        "DataTable", {"csv_file": "data.csv"}, pathlib.Path("/")
+    )
+    assert call_signature.count("webviz_settings=") == 1
+    assert "'webviz_settings'" not in call_signature
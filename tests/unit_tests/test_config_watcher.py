@@ -0,0 +1,36 @@
+import time
+from pathlib import Path
+
+from webviz_config._config_watcher import ConfigWatcher
+
+
+def _touch(path: Path, content: str) -> None:
+    # Make sure mtime changes also on file systems with coarse timestamps
+    time.sleep(0.05)
+    path.write_text(content)
+
+
+def test_config_and_referenced_files_are_watched(tmp_path: Path) -> None:
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("title: Test")
+    data_file = tmp_path / "data.csv"
+    data_file.write_text("a,b\n1,2")
+    unrelated_file = tmp_path / "unrelated.txt"
+
+    with ConfigWatcher(
+        config_file, [data_file], debounce=0.2, poll_interval=0.05
+    ) as watcher:
+        assert not watcher.wait_for_changes(timeout=0.3)
+
+        _touch(data_file, "a,b\n1,3")
+        _touch(unrelated_file, "Not watched")
+        changed_paths = watcher.wait_for_changes(timeout=5)
+        assert changed_paths == {data_file.resolve()}
+        assert not watcher.config_file_changed(changed_paths)
+
+        # A burst of writes is reported as one change
+        for i in range(3):
+            _touch(config_file, f"title: Test {i}")
+        changed_paths = watcher.wait_for_changes(timeout=5)
+        assert watcher.config_file_changed(changed_paths)
+        assert not watcher.wait_for_changes(timeout=0.5)
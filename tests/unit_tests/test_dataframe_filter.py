@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+
+from webviz_config.utils import DataFrameFilter
+from webviz_config.generic_plugins._table_plotter import filter_dataframe
+
+
+def test_dataframe_filter() -> None:
+    rng = np.random.default_rng(0)
+    dframe = pd.DataFrame(
+        {
+            "REAL": rng.integers(0, 100, 1000),
+            "ZONE": rng.choice(["A", "B", "C", None], 1000),
+            "VALUE": rng.normal(size=1000),
+        }
+    )
+    columns = ["REAL", "ZONE", "VALUE"]
+    data_filter = DataFrameFilter(dframe, columns)
+
+    for column_values in [
+        [[10, 50], ["A", "C"], [-1.0, 1.0]],
+        [[0, 99], ["A", "B", "C"], [-10.0, 10.0]],
+        [42, "B", [0.0, 10.0]],
+        [[60, 40], ["D"], [-1.0, 1.0]],
+    ]:
+        pd.testing.assert_frame_equal(
+            data_filter.filter(column_values),
+            filter_dataframe(dframe, columns, column_values),
+        )
+
+    # No rows removed means no copy
+    assert data_filter.filter([[0, 99], ["A", "B", "C", None], [-10, 10]]) is dframe
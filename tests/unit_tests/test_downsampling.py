@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+
+from webviz_config.utils import (
+    bin_points,
+    downsample_lines,
+    histogram_counts,
+    histogram2d_counts,
+    lttb_indices,
+    quantile_sketch,
+)
+
+
+def test_lttb_keeps_extremes() -> None:
+    y_values = np.zeros(1000)
+    y_values[[100, 500, 900]] = [5, -5, 10]
+    indices = lttb_indices(np.arange(1000), y_values, 20)
+
+    assert len(indices) == 20
+    assert indices[0] == 0 and indices[-1] == 999
+    assert {100, 500, 900}.issubset(indices)
+    assert np.all(np.diff(indices) > 0)
+
+
+def test_downsample_lines_and_bin_points() -> None:
+    rng = np.random.default_rng(0)
+    dframe = pd.DataFrame(
+        {
+            "X": np.tile(np.arange(5000), 2),
+            "Y": rng.normal(size=10000),
+            "SIZE": rng.random(10000),
+            "GROUP": np.repeat(["A", "B"], 5000),
+        }
+    )
+
+    lines = downsample_lines(dframe, "X", "Y", ["GROUP"], 1000)
+    assert len(lines) == 1000
+    assert lines.groupby("GROUP").size().to_dict() == {"A": 500, "B": 500}
+
+    binned = bin_points(dframe, "X", "Y", ["GROUP"], ["SIZE"], 1000)
+    assert len(binned) <= 1000
+    assert list(binned.columns) == ["GROUP", "X", "Y", "SIZE", "points"]
+    assert binned["points"].sum() == len(dframe)
+
+    assert bin_points(dframe, "GROUP", "Y", [], [], 1000) is None
+
+
+def test_histograms_and_quantile_sketch() -> None:
+    rng = np.random.default_rng(0)
+    dframe = pd.DataFrame(
+        {
+            "X": rng.normal(size=10000),
+            "Y": rng.normal(size=10000),
+            "GROUP": rng.choice(["A", "B"], 10000),
+        }
+    )
+
+    counts, edges = histogram_counts(dframe, "X", ["GROUP"], 20)
+    assert len(edges) == 21
+    assert counts["count"].sum() == len(dframe)
+    np.testing.assert_array_equal(
+        counts.groupby("X")["count"].sum().sort_index().to_numpy(),
+        np.histogram(dframe["X"], bins=edges)[0],
+    )
+
+    counts, edges = histogram_counts(dframe, "GROUP", [])
+    assert edges is None
+    assert (
+        counts.set_index("GROUP")["count"].to_dict()
+        == dframe["GROUP"].value_counts().to_dict()
+    )
+
+    counts, _, _ = histogram2d_counts(dframe, "X", "Y", ["GROUP"], 20)
+    assert counts["count"].sum() == len(dframe)
+
+    sketch = quantile_sketch(dframe, "Y", ["GROUP"])
+    assert len(sketch) == 2 * 401
+    pd.testing.assert_series_equal(
+        sketch.groupby("GROUP")["Y"].quantile([0, 0.25, 0.5, 0.75, 1]),
+        dframe.groupby("GROUP")["Y"].quantile([0, 0.25, 0.5, 0.75, 1]),
+    )
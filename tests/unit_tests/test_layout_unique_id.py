@@ -0,0 +1,44 @@
+from dash import html
+
+from webviz_config.webviz_plugin_subclasses import (
+    LayoutUniqueId,
+    ViewABC,
+    ViewElementABC,
+)
+
+
+class Element(ViewElementABC):
+    def inner_layout(self) -> html.Div:
+        return html.Div()
+
+
+def test_string_forms_follow_changes() -> None:
+    unique_id = LayoutUniqueId(plugin_uuid="plugin", view_id="view")
+    assert unique_id.to_string() == "plugin-view"
+    assert unique_id.to_string() is unique_id.to_string()
+
+    unique_id.set_view_element_id("element")
+    assert unique_id.to_string() == "plugin-view-element"
+    assert unique_id.get_view_unique_id() == "plugin-view"
+
+    component_id = LayoutUniqueId(component_id="component", other=unique_id)
+    assert component_id.to_string() == "plugin-view-element-component"
+    assert component_id.get_view_element_unique_id() == "plugin-view-element"
+
+
+def test_view_lookups() -> None:
+    view = ViewABC("View")
+    row = view.add_row("row")
+    elements = {f"element-{i}": Element() for i in range(100)}
+    for element_id, element in elements.items():
+        row.add_view_element(element, element_id)
+
+    assert view.layout_element("row") is row
+    assert view.view_element("element-42") is elements["element-42"]
+    assert view.view_element_unique_id("element-42", "graph").endswith(
+        "element-42-graph"
+    )
+
+    assert view.remove_view_element("element-42")
+    assert len(view.view_elements()) == 99
+    assert not view.remove_view_element("element-42")
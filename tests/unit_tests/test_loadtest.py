@@ -0,0 +1,86 @@
+import threading
+
+import dash
+from dash import Input, Output, dcc, html
+from werkzeug.serving import make_server
+
+from webviz_config._loadtest._app_model import AppModel
+from webviz_config._loadtest._stats import LoadTestStats, percentile
+from webviz_config._loadtest._virtual_user import VirtualUser
+
+
+def _app() -> dash.Dash:
+    app = dash.Dash(__name__)
+    app.layout = html.Div(
+        [
+            dcc.Location(id="location"),
+            html.Div(id="main-menu"),
+            html.Div(id="page"),
+        ]
+    )
+
+    @app.callback(Output("page", "children"), Input("location", "pathname"))
+    def _page(_pathname: str) -> list:
+        return [
+            dcc.Dropdown(id="dropdown", options=["a", "b"], value="a"),
+            html.Div(id="selected"),
+        ]
+
+    @app.callback(Output("selected", "children"), Input("dropdown", "value"))
+    def _selected(value: str) -> str:
+        return value.upper()
+
+    return app
+
+
+def test_app_model() -> None:
+    app = _app()
+    client = app.server.test_client()
+    layout = client.get("/_dash-layout").get_json()
+    # The (webviz-core-components) menu of Webviz applications
+    layout["props"]["children"][1]["props"]["navigationItems"] = [
+        {"type": "section", "content": [{"type": "page", "href": "/page"}]}
+    ]
+    app_model = AppModel.discover(layout, client.get("/_dash-dependencies").get_json())
+
+    assert app_model.pages == ["/page"]
+    assert app_model.page_callback is not None
+    assert [callback.label for callback in app_model.callbacks] == ["selected.children"]
+
+
+def test_virtual_user() -> None:
+    server = make_server("localhost", 0, _app().server, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    app = _app()
+    client = app.server.test_client()
+    app_model = AppModel.discover(
+        client.get("/_dash-layout").get_json(),
+        client.get("/_dash-dependencies").get_json(),
+    )
+
+    stats = LoadTestStats()
+    stop = threading.Event()
+    user = VirtualUser(
+        f"http://localhost:{server.server_port}",
+        app_model,
+        stats,
+        stop,
+        think_time=0.01,
+        interactions_per_page=2,
+    )
+    user.start()
+    threading.Timer(0.5, stop.set).start()
+    user.join()
+    server.shutdown()
+
+    summary = stats.summary(0.5)["per_request"]
+    assert summary["page /"]["count"] > 0
+    assert summary["callback selected.children"]["count"] > 0
+    assert all(request["errors"] == 0 for request in summary.values())
+
+
+def test_percentile() -> None:
+    values = [float(value) for value in range(1, 101)]
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([1.0], 95) == 1
@@ -0,0 +1,86 @@
+import gzip
+
+import flask
+import pytest
+
+from webviz_config.utils import optimize_responses
+
+
+def create_server() -> flask.Flask:
+    server = flask.Flask(__name__)
+
+    @server.route("/_dash-layout")
+    def _layout() -> flask.Response:
+        return flask.jsonify({"children": ["Some text"] * 100})
+
+    @server.route("/small")
+    def _small() -> flask.Response:
+        return flask.jsonify({"children": "Some text"})
+
+    @server.route("/assets/<path:asset_id>")
+    def _asset(asset_id: str) -> str:
+        return asset_id
+
+    @server.route("/_dash-component-suites/bundle.js")
+    def _bundle() -> flask.Response:
+        response = flask.Response("var a = 1;" * 100, mimetype="text/javascript")
+        response.add_etag()
+        return response
+
+    optimize_responses(server)
+    return server
+
+
+def test_compression() -> None:
+    client = create_server().test_client()
+
+    response = client.get("/_dash-layout", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(response.get_data()) == client.get("/_dash-layout").data
+
+    response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in response.headers
+
+    response = client.get("/_dash-layout")
+    assert "Content-Encoding" not in response.headers
+
+
+def test_etag_and_cache_headers() -> None:
+    client = create_server().test_client()
+
+    etag = client.get("/_dash-layout").headers["ETag"]
+    response = client.get("/_dash-layout", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    response = client.get("/assets/image.png?v=abcdef")
+    assert "immutable" in response.headers["Cache-Control"]
+    response = client.get("/assets/image.png")
+    assert "Cache-Control" not in response.headers
+
+
+def test_compressed_static_files(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = create_server().test_client()
+    compressed = []
+    compress = gzip.compress
+
+    def _compress(data: bytes, compresslevel: int) -> bytes:
+        compressed.append(data)
+        return compress(data, compresslevel=compresslevel)
+
+    monkeypatch.setattr(gzip, "compress", _compress)
+
+    etag = client.get("/_dash-component-suites/bundle.js").headers["ETag"]
+    for _ in range(2):
+        response = client.get(
+            "/_dash-component-suites/bundle.js", headers={"Accept-Encoding": "gzip"}
+        )
+        assert gzip.decompress(response.get_data()) == b"var a = 1;" * 100
+    assert len(compressed) == 1
+
+    # The encoded response has its own strong ETag
+    assert response.headers["ETag"] == etag[:-1] + '-gzip"'
+    response = client.get(
+        "/_dash-component-suites/bundle.js",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["ETag"]},
+    )
+    assert response.status_code == 304
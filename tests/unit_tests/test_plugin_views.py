@@ -0,0 +1,97 @@
+import json
+
+import dash
+import webviz_core_components as wcc
+
+from webviz_config import WebvizPluginABC
+from webviz_config._plugin_abc import VIEW_CONTAINER_TYPE
+from webviz_config.generic_plugins._example_wlf_plugin import ExampleWlfPlugin
+
+
+def test_single_callback_switches_views() -> None:
+    app = dash.Dash(__name__)
+    # The callback is registered when the first plugin with views is created,
+    # and only once
+    plugins = [ExampleWlfPlugin(title="first"), ExampleWlfPlugin(title="second")]
+    WebvizPluginABC.set_view_callbacks()
+    app.layout = wcc.WebvizContentManager(
+        id="webviz-content-manager",
+        children=[
+            wcc.WebvizPluginsWrapper(
+                id="plugins-wrapper",
+                children=[el for plugin in plugins for el in plugin.plugin_layout()],
+            )
+        ],
+    )
+
+    client = app.server.test_client()
+    dependencies = [
+        dependency
+        for dependency in client.get("/_dash-dependencies").get_json()
+        if dependency["inputs"][0]["id"] == "webviz-content-manager"
+    ]
+    assert len(dependencies) == 1
+
+    plugin_ids = [plugin.uuid() for plugin in plugins]
+    view = plugins[1].view("table-view")
+    assert view is plugins[1].views()[1][1]
+
+    response = client.post(
+        "/_dash-update-component",
+        json={
+            "output": dependencies[0]["output"],
+            "outputs": [
+                {
+                    "id": {"type": VIEW_CONTAINER_TYPE, "plugin": plugin_id},
+                    "property": "children",
+                }
+                for plugin_id in plugin_ids
+            ],
+            "inputs": [
+                {
+                    "id": "webviz-content-manager",
+                    "property": "activeViewId",
+                    "value": view.unique_id(),
+                },
+                {
+                    "id": "webviz-content-manager",
+                    "property": "activePluginId",
+                    "value": plugin_ids[1],
+                },
+            ],
+            "changedPropIds": ["webviz-content-manager.activeViewId"],
+        },
+    )
+    updated = response.get_json()["response"]
+
+    # Only the container of the active plugin is updated
+    assert list(updated) == [
+        json.dumps(
+            {"plugin": plugin_ids[1], "type": VIEW_CONTAINER_TYPE},
+            separators=(",", ":"),
+        )
+    ]
+    assert next(iter(updated.values()))["children"]["props"]["id"] == view.unique_id()
+
+    # The layout of views with static layout is only created once
+    assert view.outer_layout() is view.outer_layout()
+
+
+def test_view_callback_is_registered_on_each_app() -> None:
+    for _ in range(2):
+        app = dash.Dash(__name__)
+        ExampleWlfPlugin(title="plugin")
+        ExampleWlfPlugin(title="other plugin")
+        app.layout = dash.html.Div()
+        dependencies = app.server.test_client().get("/_dash-dependencies").get_json()
+        assert [
+            dependency["output"]
+            for dependency in dependencies
+            if dependency["inputs"][0]["id"] == "webviz-content-manager"
+        ] == [
+            json.dumps(
+                {"plugin": ["ALL"], "type": VIEW_CONTAINER_TYPE},
+                separators=(",", ":"),
+            )
+            + ".children"
+        ]
@@ -0,0 +1,72 @@
+import time
+
+import flask
+
+from webviz_config._static_auth import StaticRequestAuth
+
+
+def _app() -> flask.Flask:
+    app = flask.Flask(__name__)
+    app.secret_key = "secret"
+    static_auth = StaticRequestAuth.for_app(app)
+    app.full_checks = 0  # type: ignore[attr-defined]
+
+    @app.before_request
+    @static_auth.timed
+    def _check():  # type: ignore[no-untyped-def]
+        if static_auth.is_authorized_static_request():
+            return None
+        app.full_checks += 1  # type: ignore[attr-defined]
+        if flask.request.headers.get("Authorization") != "token":
+            flask.abort(401)
+        static_auth.authorize(time.time() + 60)
+        return None
+
+    app.add_url_rule("/", "page", lambda: "page")
+    app.add_url_rule("/assets/<path:path>", "assets", lambda path: path)
+
+    return app
+
+
+def test_static_requests_are_authorized_by_cookie() -> None:
+    app = _app()
+    client = app.test_client()
+
+    assert client.get("/assets/style.css").status_code == 401
+
+    response = client.get("/", headers={"Authorization": "token"})
+    assert response.status_code == 200
+    assert response.headers["Server-Timing"].startswith("auth;dur=")
+    assert StaticRequestAuth.COOKIE_NAME in response.headers["Set-Cookie"]
+    full_checks = app.full_checks  # type: ignore[attr-defined]
+
+    # Static requests only need the (signed) cookie...
+    assert client.get("/assets/style.css").status_code == 200
+    assert app.full_checks == full_checks  # type: ignore[attr-defined]
+
+    # ...while other requests still go through the full check
+    assert client.get("/").status_code == 401
+    assert app.full_checks == full_checks + 1  # type: ignore[attr-defined]
+
+
+def test_invalid_static_auth_cookie() -> None:
+    app = _app()
+    client = app.test_client()
+
+    client.set_cookie(StaticRequestAuth.COOKIE_NAME, "9999999999.invalid")
+    assert client.get("/assets/style.css").status_code == 401
+
+
+def test_static_requests_skip_session() -> None:
+    app = _app()
+    StaticRequestAuth.for_app(app).skip_static_sessions()
+    app.add_url_rule(
+        "/login", "login", lambda: str(flask.session.setdefault("user", "name"))
+    )
+    for rule in ("/session", "/assets/session"):
+        app.add_url_rule(rule, rule, lambda: str(dict(flask.session)))
+    client = app.test_client()
+
+    client.get("/login", headers={"Authorization": "token"})
+    assert "name" in client.get("/session", headers={"Authorization": "token"}).text
+    assert client.get("/assets/session").text == "{}"
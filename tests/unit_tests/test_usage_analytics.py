@@ -0,0 +1,69 @@
+import logging
+from typing import List
+from unittest import mock
+
+from webviz_config.utils import UsageAnalytics
+
+
+class ListHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: List[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def _logger(name: str) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.addHandler(ListHandler())
+    return logger
+
+
+def _records(logger: logging.Logger) -> List[logging.LogRecord]:
+    return logger.handlers[0].records  # type: ignore[attr-defined]
+
+
+def test_usage_is_aggregated() -> None:
+    logger = _logger("test_usage_is_aggregated")
+    usage_analytics = UsageAnalytics(logger, "user", flush_interval=3600)
+
+    for _ in range(3):
+        usage_analytics.log_plugin_usage("/page", "Plugin")
+    usage_analytics.log_plugin_usage("/other-page", "Plugin")
+
+    # Nothing is emitted before the flush interval has passed, or it is closed
+    assert not _records(logger)
+    usage_analytics.close()
+
+    counts = {
+        (record.wv_path_name, record.wv_plugin_name): record.wv_count  # type: ignore[attr-defined]
+        for record in _records(logger)
+    }
+    assert counts == {("/page", "Plugin"): 3, ("/other-page", "Plugin"): 1}
+    assert "count=3" in _records(logger)[0].getMessage()
+
+
+def test_usage_is_sampled_and_dropped() -> None:
+    logger = _logger("test_usage_is_sampled_and_dropped")
+
+    usage_analytics = UsageAnalytics(logger, "user", sample_rate=0)
+    usage_analytics.log_plugin_usage("/page", "Plugin")
+    usage_analytics.close()
+    assert usage_analytics.sampled_out_events == 1
+    assert not _records(logger)
+
+    # pylint: disable=protected-access
+    usage_analytics = UsageAnalytics(logger, "user", max_queue_size=1)
+    with mock.patch.object(usage_analytics, "_start"):
+        usage_analytics.log_plugin_usage("/page", "Plugin")
+        usage_analytics.log_plugin_usage("/page", "Plugin")
+    assert usage_analytics.dropped_events == 1
+    usage_analytics._start()
+    usage_analytics.close()
+    assert [record.levelno for record in _records(logger)] == [
+        logging.INFO,
+        logging.WARNING,
+    ]
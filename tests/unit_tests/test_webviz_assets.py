@@ -0,0 +1,67 @@
+import json
+import pathlib
+
+import dash
+
+from webviz_config.webviz_assets import WebvizAssets
+
+
+def test_deduplicated_assets(tmp_path: pathlib.Path) -> None:
+    (tmp_path / "first").mkdir()
+    (tmp_path / "second").mkdir()
+    (tmp_path / "first" / "image.png").write_bytes(b"image")
+    (tmp_path / "second" / "copy.png").write_bytes(b"image")
+    (tmp_path / "second" / "image.png").write_bytes(b"other image")
+    (tmp_path / "style.css").write_bytes(b"image")
+
+    assets = WebvizAssets()
+    uri = assets.add(tmp_path / "first" / "image.png")
+    assert uri.startswith("temp/image.png?v=")
+    assert assets.add(tmp_path / "first" / "image.png") == uri
+    assert assets.add(tmp_path / "second" / "copy.png") == uri
+    assert assets.add(tmp_path / "second" / "image.png").startswith(
+        "temp/image.png2?v="
+    )
+    # Same content, but another file type
+    assert assets.add(tmp_path / "style.css").startswith("temp/style.css?v=")
+
+    app = dash.Dash(__name__)
+    app.layout = dash.html.Div()
+    assets.directly_host_assets(app)
+    assert app.config.external_stylesheets == ["./temp/style.css"]
+    response = app.server.test_client().get(f"/{uri}")
+    assert response.status_code == 200
+    assert response.data == b"image"
+
+
+def test_portable_assets(tmp_path: pathlib.Path) -> None:
+    (tmp_path / "image.png").write_bytes(b"image")
+    (tmp_path / "copy.png").write_bytes(b"image")
+    (tmp_path / "other.png").write_bytes(b"other image")
+    asset_folder = tmp_path / "build" / "resources" / "assets"
+
+    assets = WebvizAssets()
+    for filename in ["image.png", "copy.png", "other.png"]:
+        assets.add(tmp_path / filename)
+    assets.make_portable(asset_folder)
+
+    copied_files = sorted(path.name for path in asset_folder.iterdir())
+    assert len(copied_files) == 2
+    assert copied_files[0].startswith("image.") and copied_files[1].startswith("other.")
+    manifest = json.loads(
+        (asset_folder.parent / WebvizAssets.MANIFEST_FILENAME).read_text()
+    )
+    assert manifest[str(tmp_path / "image.png")] == manifest[str(tmp_path / "copy.png")]
+
+    # Files already present in the folder are not copied again
+    (asset_folder / copied_files[0]).write_bytes(b"kept")
+    assets.make_portable(asset_folder)
+    assert (asset_folder / copied_files[0]).read_bytes() == b"kept"
+
+    portable_assets = WebvizAssets()
+    portable_assets.portable = True
+    portable_assets.portable_folder = asset_folder
+    (tmp_path / "image.png").unlink()
+    uri = portable_assets.add(tmp_path / "image.png")
+    assert uri.startswith(f"assets/{copied_files[0]}?v=")
+    assert portable_assets.add(tmp_path / "copy.png") == uri
@@ -0,0 +1,112 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from webviz_config.webviz_datasets import (
+    WebvizDatasets,
+    check_csv_options,
+    read_csv,
+)
+from webviz_config.webviz_store import WEBVIZ_STORAGE, WebvizStorage
+
+
+def test_datasets_are_shared_and_stored_once(tmp_path: Path) -> None:
+    csv_file = tmp_path / "data.csv"
+    pd.DataFrame({"A": [1, 2], "B": ["x", "y"]}).to_csv(csv_file, index=False)
+
+    datasets = WebvizDatasets()
+    dframe = datasets.get(csv_file)
+    assert np.shares_memory(
+        datasets.get(tmp_path / "subfolder" / ".." / "data.csv")["A"].to_numpy(),
+        dframe["A"].to_numpy(),
+    )
+    assert not np.shares_memory(
+        datasets.get(csv_file, usecols=["A"])["A"].to_numpy(), dframe["A"].to_numpy()
+    )
+
+    WEBVIZ_STORAGE.storage_folder = tmp_path / "storage"
+    WEBVIZ_STORAGE.register_function_arguments(
+        [
+            datasets.webvizstore_arguments(csv_file),
+            datasets.webvizstore_arguments(tmp_path / "." / "data.csv"),
+        ]
+    )
+    WEBVIZ_STORAGE.build_store()
+    assert len(list((tmp_path / "storage").glob("*read_csv*"))) == 1
+
+    csv_file.unlink()
+    datasets.clear()
+    WEBVIZ_STORAGE.use_storage = True
+    try:
+        pd.testing.assert_frame_equal(datasets.get(csv_file), dframe)
+    finally:
+        WEBVIZ_STORAGE.use_storage = False
+        # pylint: disable=protected-access
+        WEBVIZ_STORAGE.storage_function_argvalues.pop(
+            WebvizStorage._undecorate(read_csv)
+        )
+
+
+def test_shared_dataframe_is_not_modified(tmp_path: Path) -> None:
+    csv_file = tmp_path / "data.csv"
+    pd.DataFrame({"A": [1, 2], "B": ["x", "y"]}).to_csv(csv_file, index=False)
+
+    datasets = WebvizDatasets()
+    dframe = datasets.get(csv_file)
+    dframe["C"] = dframe["A"] * 2
+    dframe.drop(columns="B", inplace=True)
+    assert list(datasets.get(csv_file).columns) == ["A", "B"]
+
+    if int(pd.__version__.split(".", maxsplit=1)[0]) >= 3:
+        # Copy-on-write is the default from pandas 3.0
+        dframe.loc[0, "A"] = 100
+        assert datasets.get(csv_file)["A"].tolist() == [1, 2]
+
+
+def test_datasets_with_converted_dtypes(tmp_path: Path) -> None:
+    csv_file = tmp_path / "data.csv"
+    pd.DataFrame(
+        {
+            "REAL": range(1000),
+            "ZONE": ["upper", "lower"] * 500,
+            "NAME": [f"name-{i}" for i in range(1000)],
+        }
+    ).to_csv(csv_file, index=False)
+
+    datasets = WebvizDatasets()
+    dframe = datasets.get(
+        csv_file,
+        dtype={"REAL": "int32"},
+        categorical_max_cardinality=10,
+        arrow_strings=True,
+    )
+    assert dframe["REAL"].dtype == "int32"
+    assert isinstance(dframe["ZONE"].dtype, pd.CategoricalDtype)
+    assert dframe["NAME"].dtype.storage == "pyarrow"
+
+    assert len(datasets.memory_report()) == 1
+    memory = datasets.memory_report()[0]
+    assert memory.rows == 1000
+    assert memory.bytes == dframe.memory_usage(deep=True).sum()
+    assert memory.saved_bytes > 0
+
+    # Conversion options are not passed on to pandas.read_csv
+    _, [arguments] = datasets.webvizstore_arguments(
+        csv_file, usecols=["ZONE"], categorical_max_cardinality=10
+    )
+    assert arguments["read_options"] == (("usecols", ["ZONE"]),)
+
+
+def test_csv_options() -> None:
+    shared_settings = {"csv_options": {"engine": "pyarrow", "usecols": ["A"]}}
+    assert WebvizDatasets.options(shared_settings, {"usecols": ["B"]}) == {
+        "engine": "pyarrow",
+        "usecols": ["B"],
+    }
+    assert not WebvizDatasets.options({}, None)
+
+    assert not check_csv_options(None)
+    with pytest.raises(ValueError):
+        check_csv_options({"categorical_max_cardinality": -1})
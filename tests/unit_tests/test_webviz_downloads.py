@@ -0,0 +1,63 @@
+import io
+import gzip
+import zipfile
+
+import dash
+import flask
+import pandas as pd
+
+from webviz_config.generic_plugins._data_table import DataTable
+from webviz_config.webviz_downloads import WebvizDownloads
+
+
+def test_streamed_downloads() -> None:
+    dframe = pd.DataFrame({"A": range(250), "B": ["text"] * 250})
+
+    downloads = WebvizDownloads(chunk_size=100)
+    downloads.add("table", lambda: dframe)
+    downloads.add(
+        "archive", lambda: [{"filename": "file.txt", "content": "Some content"}]
+    )
+
+    server = flask.Flask(__name__)
+    server.secret_key = "secret"
+    downloads.register_route(server)
+    client = server.test_client()
+
+    with server.test_request_context():
+        csv_url = downloads.url("table", "data.csv")
+        compressed_csv_url = downloads.url("table", "data.csv", compress=True)
+        parquet_url = downloads.url("table", "data.parquet")
+        zip_url = downloads.url("archive", "data.zip")
+
+    response = client.get(csv_url)
+    assert response.is_streamed
+    assert response.headers["Content-Disposition"] == 'attachment; filename="data.csv"'
+    assert response.get_data().decode() == dframe.to_csv(index=False)
+
+    response = client.get(compressed_csv_url, headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(response.get_data()).decode() == dframe.to_csv(index=False)
+
+    response = client.get(parquet_url)
+    pd.testing.assert_frame_equal(pd.read_parquet(io.BytesIO(response.data)), dframe)
+
+    response = client.get(zip_url)
+    with zipfile.ZipFile(io.BytesIO(response.data)) as archive:
+        assert archive.read("file.txt") == b"Some content"
+
+    assert client.get(csv_url + "tampered").status_code == 403
+
+
+def test_downloads_in_test_app(_webviz_performance_app: dash.Dash) -> None:
+    app = _webviz_performance_app
+    plugin = DataTable(app, csv_file="./tests/data/example_data.csv")
+
+    with app.server.test_request_context():
+        url = plugin.plugin_download_url("data.csv")
+
+    response = app.server.test_client().get(url)
+    assert response.status_code == 200
+    assert response.get_data().decode() == pd.read_csv(
+        "./tests/data/example_data.csv"
+    ).to_csv(index=False)
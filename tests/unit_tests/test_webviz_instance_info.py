@@ -96,11 +96,19 @@ def test_immutability() -> None:
 
     returned_theme = instance_info.theme
     assert returned_theme is not my_theme
+    assert returned_theme is instance_info.theme
     assert isinstance(returned_theme, WebvizConfigTheme)
     assert returned_theme.__dict__ == my_theme.__dict__
     my_theme.theme_name = "MODIFIED"
     assert returned_theme.__dict__ != my_theme.__dict__
 
+    # The returned theme is read-only, but can be copied
+    with pytest.raises(AttributeError):
+        returned_theme.theme_name = "MODIFIED"
+    copied_theme = returned_theme.copy()
+    copied_theme.theme_name = "MODIFIED"
+    assert copied_theme.__dict__ == my_theme.__dict__
+
     with pytest.raises(AttributeError):
         # pylint: disable=assigning-non-slot
         instance_info.some_new_attribute = "myAttributeValue"  # type: ignore[attr-defined]
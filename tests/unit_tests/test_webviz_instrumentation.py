@@ -0,0 +1,73 @@
+import logging
+
+import dash
+import pytest
+from flask.testing import FlaskClient
+from dash import Input, Output, html
+from dash.exceptions import PreventUpdate
+
+from webviz_config.generic_plugins._example_wlf_plugin import ExampleWlfPlugin
+from webviz_config.webviz_instrumentation import WebvizInstrumentation
+
+
+def _call(client: FlaskClient, callback_id: str, value: int) -> int:
+    return client.post(
+        "/_dash-update-component",
+        json={
+            "output": callback_id,
+            "outputs": {"id": callback_id.split(".")[0], "property": "children"},
+            "inputs": [{"id": "input", "property": "value", "value": value}],
+            "changedPropIds": ["input.value"],
+        },
+    ).status_code
+
+
+def test_instrumented_callbacks(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    app = dash.Dash(__name__)
+    plugin = ExampleWlfPlugin(title="instrumented")
+    view_element_id = plugin.view("plot-view").view_element_unique_id("plot", "graph")
+    app.layout = html.Div(
+        [html.Div(id="input"), html.Div(id="output"), html.Div(id=view_element_id)]
+    )
+
+    @app.callback(Output("output", "children"), Input("input", "value"))
+    def _output(value: int) -> int:
+        if value < 0:
+            raise PreventUpdate
+        return value
+
+    @app.callback(Output(view_element_id, "children"), Input("input", "value"))
+    def _plugin_output(value: int) -> int:
+        return 1 // value
+
+    instrumentation = WebvizInstrumentation()
+    assert not instrumentation.instrument(app)
+
+    monkeypatch.setenv("WEBVIZ_INSTRUMENT_CALLBACKS", "1")
+    assert instrumentation.instrument(app, slow_callback_threshold=0)
+
+    client = app.server.test_client()
+    with caplog.at_level(logging.WARNING):
+        assert _call(client, "output.children", 1) == 200
+    assert "Slow callback" in caplog.text
+    assert _call(client, "output.children", -1) == 204
+    assert _call(client, f"{view_element_id}.children", 0) == 500
+
+    stats = {
+        callback["callback_id"]: callback
+        for callback in client.get(WebvizInstrumentation.ROUTE).get_json()["callbacks"]
+    }
+
+    output_stats = stats["output.children"]
+    assert output_stats["plugin_class"] is None
+    assert (output_stats["count"], output_stats["prevented"]) == (2, 1)
+    assert sum(output_stats["duration_buckets"]) == 2
+    assert output_stats["input_bytes"] > 0 and output_stats["output_bytes"] > 0
+
+    plugin_stats = stats[f"{view_element_id}.children"]
+    assert plugin_stats["plugin_class"] == "ExampleWlfPlugin"
+    assert plugin_stats["plugin_id"] == plugin.uuid()
+    assert plugin_stats["layout"] == "plot-view/plot"
+    assert (plugin_stats["count"], plugin_stats["errors"]) == (1, 1)
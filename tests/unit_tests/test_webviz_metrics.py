@@ -0,0 +1,109 @@
+import dash
+import pytest
+from dash import Input, Output, html
+
+from webviz_config import LocalhostToken
+from webviz_config.common_cache import CACHE
+from webviz_config.webviz_metrics import WebvizMetrics
+from webviz_config.webviz_instrumentation import WebvizInstrumentation
+
+pytest.importorskip("prometheus_client")
+
+
+def _sample(metrics: str, name: str) -> float:
+    return sum(
+        float(line.rsplit(" ", 1)[1])
+        for line in metrics.splitlines()
+        if line.startswith(name)
+    )
+
+
+def test_metrics(monkeypatch: pytest.MonkeyPatch) -> None:
+    instrumentation = WebvizInstrumentation()
+    monkeypatch.setattr(
+        "webviz_config.webviz_metrics.WEBVIZ_INSTRUMENTATION", instrumentation
+    )
+    monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+
+    app = dash.Dash(__name__)
+    app.layout = html.Div([html.Div(id="input"), html.Div(id="output")])
+    CACHE.init_app(app.server)
+
+    @CACHE.memoize()
+    def _square(value: int) -> int:
+        return value * value
+
+    @app.callback(Output("output", "children"), Input("input", "value"))
+    def _output(value: int) -> int:
+        return _square(value)
+
+    metrics = WebvizMetrics()
+    assert not metrics.register(app)
+
+    monkeypatch.setenv("WEBVIZ_METRICS", "1")
+    assert metrics.register(app)
+    assert instrumentation.instrument(app)
+
+    client = app.server.test_client()
+    for _ in range(2):
+        client.post(
+            "/_dash-update-component",
+            json={
+                "output": "output.children",
+                "outputs": {"id": "output", "property": "children"},
+                "inputs": [{"id": "input", "property": "value", "value": 3}],
+                "changedPropIds": ["input.value"],
+            },
+        )
+    # pylint: disable=protected-access
+    metrics._storage_read("get_data", 100)
+
+    response = client.get(WebvizMetrics.ROUTE)
+    assert response.mimetype == "text/plain"
+    text = response.text
+
+    assert (
+        _sample(
+            text,
+            'webviz_requests_total{method="POST",route="/_dash-update-component",'
+            'status="200"}',
+        )
+        == 2
+    )
+    assert (
+        _sample(
+            text,
+            'webviz_callback_duration_seconds_count{outcome="ok",plugin="application"',
+        )
+        == 2
+    )
+    assert _sample(text, 'webviz_cache_requests_total{result="hit"}') == 1
+    assert _sample(text, 'webviz_cache_requests_total{result="miss"}') == 1
+    assert _sample(text, 'webviz_storage_read_bytes_total{function="get_data"}') == 100
+    assert _sample(text, "webviz_process_resident_memory_bytes{") > 0
+
+
+def test_metrics_are_served_without_app_authorization(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("WEBVIZ_METRICS", "1")
+    monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+    monkeypatch.delenv("WEBVIZ_METRICS_TOKEN", raising=False)
+    monkeypatch.delenv("WEBVIZ_OTT", raising=False)
+    monkeypatch.delenv("WEBVIZ_COOKIE_TOKEN", raising=False)
+
+    app = dash.Dash(__name__)
+    app.layout = html.Div()
+    assert WebvizMetrics().register(app)
+    LocalhostToken(app.server, 8050)
+
+    client = app.server.test_client()
+    assert client.get("/").status_code == 401
+    assert client.get(WebvizMetrics.ROUTE).status_code == 200
+
+    monkeypatch.setenv("WEBVIZ_METRICS_TOKEN", "secret")
+    assert client.get(WebvizMetrics.ROUTE).status_code == 401
+    response = client.get(
+        WebvizMetrics.ROUTE, headers={"Authorization": "Bearer secret"}
+    )
+    assert response.status_code == 200
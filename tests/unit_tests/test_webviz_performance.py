@@ -0,0 +1,121 @@
+import json
+import pathlib
+
+import dash
+import pytest
+from dash import Input, Output, State
+from dash.exceptions import PreventUpdate
+
+from webviz_config.generic_plugins._example_plugin import ExamplePlugin
+from webviz_config.testing import WebvizPerformance
+from webviz_config.testing._performance import Measurement, PerformanceBaselines
+
+
+def test_webviz_performance() -> None:
+    app = dash.Dash(__name__)
+    app.layout = dash.html.Div()
+    performance = WebvizPerformance(app)
+
+    plugin = performance.construct(lambda: ExamplePlugin(app, title="Performance"))
+    assert performance.measure_layout(plugin) > len("Performance")
+
+    @app.callback(
+        Output("text", "children"),
+        Input("number", "value"),
+        State("unit", "value"),
+    )
+    def _update_text(number: int, unit: str) -> str:
+        return f"{number} {unit}"
+
+    assert performance.measure_callback(
+        "text.children",
+        inputs={"number.value": 3},
+        state={"unit.value": "m"},
+        name="text",
+        repeat=3,
+    ) == {"text": {"children": "3 m"}}
+
+    assert performance.measure_callback(
+        f"{plugin.uuid('output-state')}.children", name="plugin"
+    ) == {
+        plugin.uuid("output-state"): {"children": "Button has been pressed None times."}
+    }
+
+    @app.callback(
+        Output("first", "children"),
+        Output("second", "children"),
+        Input("number", "n_clicks"),
+    )
+    def _update_both(n_clicks: int) -> tuple:
+        if n_clicks is None:
+            raise PreventUpdate
+        return n_clicks, 2 * n_clicks
+
+    assert performance.measure_callback(
+        "second.children", inputs={"number.n_clicks": 2}, name="both"
+    ) == {"first": {"children": 2}, "second": {"children": 4}}
+    assert performance.measure_callback("first.children", name="prevented") is None
+
+    assert set(performance.measurements) == {
+        "construction_time[ExamplePlugin]",
+        "construction_peak_memory[ExamplePlugin]",
+        "layout_size[ExamplePlugin]",
+        "callback_latency[text]",
+        "callback_latency[plugin]",
+        "callback_latency[both]",
+        "callback_latency[prevented]",
+    }
+
+    with pytest.raises(ValueError, match="no input/state"):
+        performance.measure_callback("text.children", inputs={"unknown.value": 1})
+    with pytest.raises(ValueError, match="already measured"):
+        performance.measure_callback("text.children", name="text")
+    with pytest.raises(ValueError, match="Found no callback"):
+        performance.measure_callback("unknown.children")
+
+
+def test_performance_baselines(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "baselines.json"
+    path.write_text(json.dumps({"tolerances": {"time": 1.0}}))
+    test_id = "test_plugin.py::test_performance"
+
+    baselines = PerformanceBaselines(path)
+    baselines.update(
+        test_id,
+        {
+            "construction_time[Plugin]": Measurement(
+                "construction_time[Plugin]", "time", 0.1
+            ),
+            "layout_size[Plugin]": Measurement("layout_size[Plugin]", "size", 1000),
+        },
+    )
+
+    baselines = PerformanceBaselines(path)
+    assert baselines.tolerances["time"] == 1.0
+    assert (
+        baselines.regression_report(
+            test_id,
+            {
+                "construction_time[Plugin]": Measurement(
+                    "construction_time[Plugin]", "time", 0.19
+                ),
+                "layout_size[Plugin]": Measurement("layout_size[Plugin]", "size", 1050),
+            },
+        )
+        is None
+    )
+
+    with pytest.warns(UserWarning, match="No performance baselines"):
+        report = baselines.regression_report(
+            test_id,
+            {
+                "construction_time[Plugin]": Measurement(
+                    "construction_time[Plugin]", "time", 0.05
+                ),
+                "layout_size[Plugin]": Measurement("layout_size[Plugin]", "size", 2000),
+                "layout_size[Other]": Measurement("layout_size[Other]", "size", 10),
+            },
+        )
+    assert report is not None
+    assert "REGRESSED layout_size[Plugin]: 2.0 kB (baseline 1.0 kB, +100%" in report
+    assert "ok        construction_time[Plugin]" in report
@@ -0,0 +1,70 @@
+import dash
+import numpy as np
+import pandas as pd
+import pytest
+from dash import html
+
+from webviz_config import WebvizPluginABC
+from webviz_config.webviz_instrumentation import WebvizInstrumentation
+from webviz_config.webviz_plugin_memory import (
+    WebvizPluginMemory,
+    referenced_data_size,
+)
+
+
+class DataPlugin(WebvizPluginABC):
+    def __init__(self, rows: int) -> None:
+        super().__init__()
+        self.data = {"frame": pd.DataFrame({"values": np.arange(rows, dtype=np.int64)})}
+
+    @property
+    def layout(self) -> str:
+        return ""
+
+
+def test_referenced_data_size() -> None:
+    frame = pd.DataFrame({"values": np.arange(1000, dtype=np.int64)})
+    array = np.zeros(100, dtype=np.float64)
+
+    class Holder:  # pylint: disable=too-few-public-methods
+        def __init__(self) -> None:
+            self.nested = [{"frame": frame}, (array, frame)]
+
+    assert referenced_data_size(Holder()) == (
+        frame.memory_usage(deep=True).sum() + array.nbytes
+    )
+
+
+def test_plugin_memory(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+) -> None:
+    instrumentation = WebvizInstrumentation()
+    monkeypatch.setattr(
+        "webviz_config.webviz_plugin_memory.WEBVIZ_INSTRUMENTATION", instrumentation
+    )
+    plugin_memory = WebvizPluginMemory()
+    with plugin_memory.measure():
+        DataPlugin(10)
+    assert not plugin_memory.stats()["plugins"]
+
+    monkeypatch.setenv("WEBVIZ_PLUGIN_MEMORY", "1")
+    with plugin_memory.measure():
+        small_plugin = DataPlugin(10)
+    with plugin_memory.measure():
+        large_plugin = DataPlugin(1_000_000)
+    plugin_memory.report()
+    assert large_plugin.uuid() in capsys.readouterr().out
+
+    app = dash.Dash(__name__)
+    app.layout = html.Div()
+    assert instrumentation.instrument(app)
+    stats = {
+        plugin["plugin_id"]: plugin
+        for plugin in app.server.test_client()
+        .get(WebvizInstrumentation.ROUTE)
+        .get_json()["plugin_memory"]["plugins"]
+    }
+    assert stats[small_plugin.uuid()]["data"] < 1000
+    assert stats[large_plugin.uuid()]["data"] >= 8_000_000
+    assert stats[large_plugin.uuid()]["allocated"] >= 8_000_000
+    assert stats[large_plugin.uuid()]["plugin_class"] == "DataPlugin"
@@ -1,29 +1,53 @@
+import copy
 from typing import cast
 
 import pytest
 
 from webviz_config import WebvizConfigTheme, WebvizSettings
+from webviz_config._frozen import FrozenList
 
 
 def test_construction_and_basic_access() -> None:
-    # pylint: disable=unidiomatic-typecheck
-    the_shared_settings = {"somenumber": 10, "somestring": "abc"}
+    the_shared_settings = {"somenumber": 10, "somestring": "abc", "list": [1]}
     the_theme = WebvizConfigTheme("dummyThemeName")
     settings_obj = WebvizSettings(the_shared_settings, the_theme)
 
-    copy_of_shared_settings = settings_obj.shared_settings
-    assert copy_of_shared_settings is not the_shared_settings
-    assert type(copy_of_shared_settings) == type(the_shared_settings)
-    assert copy_of_shared_settings == the_shared_settings
+    shared_settings = settings_obj.shared_settings
+    assert shared_settings is not the_shared_settings
+    assert shared_settings is settings_obj.shared_settings
+    assert isinstance(shared_settings, dict)
+    assert shared_settings == the_shared_settings
     the_shared_settings["somestring"] = "MODIFIED"
-    assert copy_of_shared_settings != the_shared_settings
+    assert shared_settings != the_shared_settings
 
-    copy_of_theme = settings_obj.theme
-    assert copy_of_theme is not the_theme
-    assert type(copy_of_theme) == type(the_theme)
-    assert copy_of_theme.__dict__ == the_theme.__dict__
+    with pytest.raises(TypeError):
+        shared_settings["somenumber"] = 11  # type: ignore[index]
+    with pytest.raises(TypeError):
+        shared_settings["list"].append(2)
+
+    mutable_shared_settings = shared_settings.copy()  # type: ignore[attr-defined]
+    mutable_shared_settings["list"].append(2)
+    assert not isinstance(mutable_shared_settings["list"], FrozenList)
+    assert shared_settings["list"] == [1]
+    assert copy.deepcopy(shared_settings) == shared_settings
+
+    theme = settings_obj.theme
+    assert theme is not the_theme
+    assert theme is settings_obj.theme
+    assert isinstance(theme, WebvizConfigTheme)
+    assert theme.__dict__ == the_theme.__dict__
     the_theme.theme_name = "MODIFIED"
-    assert copy_of_theme.__dict__ != the_theme.__dict__
+    assert theme.__dict__ != the_theme.__dict__
+
+    with pytest.raises(AttributeError):
+        theme.theme_name = "MODIFIED"
+    with pytest.raises(TypeError):
+        theme.adjust_csp({"script-src": ["'self'"]})
+
+    mutable_theme = theme.copy()
+    mutable_theme.adjust_csp({"script-src": ["https://example.com"]})
+    assert "https://example.com" in mutable_theme.csp["script-src"]
+    assert "https://example.com" not in theme.csp["script-src"]
 
 
 def test_construction_with_invalid_types() -> None:
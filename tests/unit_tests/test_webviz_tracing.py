@@ -0,0 +1,110 @@
+import json
+import pathlib
+
+import dash
+import pytest
+from dash import Input, Output, html
+from flask_caching import Cache
+
+from webviz_config import webviz_tracing
+from webviz_config.webviz_tracing import WebvizTracing
+from webviz_config.webviz_instrumentation import WebvizInstrumentation
+
+
+def _span_parents(spans: list) -> dict:
+    names = {span["context"]["span_id"]: span["name"] for span in spans}
+    return {span["name"]: names.get(span["parent_id"]) for span in spans}
+
+
+def test_tracing(monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path) -> None:
+    instrumentation = WebvizInstrumentation()
+    monkeypatch.setattr(
+        "webviz_config.webviz_tracing.WEBVIZ_INSTRUMENTATION", instrumentation
+    )
+
+    tracing = WebvizTracing()
+    assert not tracing.enabled()
+    assert tracing.start_span("startup") is None
+
+    spans_file = tmp_path / "spans.jsonl"
+    monkeypatch.setenv("WEBVIZ_TRACING", str(spans_file))
+
+    app = dash.Dash(__name__)
+    app.layout = html.Div([html.Div(id="input"), html.Div(id="output")])
+    cache = Cache(config={"CACHE_TYPE": "SimpleCache"})
+    cache.init_app(app.server)
+
+    @tracing.traced_memoize(cache.memoize())
+    def _square(value: int) -> int:
+        return value * value
+
+    @app.callback(Output("output", "children"), Input("input", "value"))
+    def _output(value: int) -> int:
+        return _square(value)
+
+    startup_span = tracing.start_span("startup")
+    with tracing.span("plugin", {"webviz.plugin": "Plugin"}):
+        pass
+    tracing.end_span(startup_span)
+
+    assert tracing.instrument(app)
+    assert instrumentation.instrument(app)
+
+    client = app.server.test_client()
+    for _ in range(2):
+        client.post(
+            "/_dash-update-component",
+            json={
+                "output": "output.children",
+                "outputs": {"id": "output", "property": "children"},
+                "inputs": [{"id": "input", "property": "value", "value": 3}],
+                "changedPropIds": ["input.value"],
+            },
+        )
+    tracing.force_flush()
+
+    spans = [json.loads(line) for line in spans_file.read_text().splitlines()]
+    parents = _span_parents(spans)
+    assert parents["plugin"] == "startup"
+    assert parents["callback output.children"] == "POST /_dash-update-component"
+    assert parents["memoize test_tracing.<locals>._square"] == (
+        "callback output.children"
+    )
+
+    cache_hits = [
+        span["attributes"]["webviz.cache.hit"]
+        for span in spans
+        if span["name"].startswith("memoize")
+    ]
+    assert cache_hits == [False, True]
+
+
+def test_tracing_file_is_flushed_and_closed(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path
+) -> None:
+    exporters = []
+    span_exporter = webviz_tracing._span_exporter  # pylint: disable=protected-access
+
+    def _span_exporter(destination: str) -> webviz_tracing.ConsoleSpanExporter:
+        exporters.append(span_exporter(destination))
+        return exporters[-1]
+
+    monkeypatch.setattr(webviz_tracing, "_span_exporter", _span_exporter)
+    spans_file = tmp_path / "spans.jsonl"
+    monkeypatch.setenv("WEBVIZ_TRACING", str(spans_file))
+
+    tracing = WebvizTracing()
+    with tracing.span("first"):
+        pass
+    tracing.force_flush()
+    assert not exporters[0].out.closed
+    assert [json.loads(line)["name"] for line in spans_file.open()] == ["first"]
+
+    with tracing.span("second"):
+        pass
+    tracing.shutdown()
+    assert exporters[0].out.closed
+    assert [json.loads(line)["name"] for line in spans_file.open()] == [
+        "first",
+        "second",
+    ]
@@ -1,14 +1,15 @@
 import sys
-import time
 import shutil
 import pathlib
 import tempfile
 import subprocess  # nosec
 import argparse
+from typing import Dict, Iterable, Set, Tuple
 
 from yaml import YAMLError
 
 from ._config_parser import ParserError
+from ._config_watcher import ConfigWatcher
 from ._write_script import write_script
 from ._dockerize import create_docker_setup
 from .themes import installed_themes
@@ -18,8 +19,6 @@ BUILD_FILENAME = "webviz_app.py"
 STATIC_FOLDER = pathlib.Path(__file__).resolve().parent / "static"
 
 
-# Restructure here before merge.
-# pylint: disable=too-many-branches
 def build_webviz(args: argparse.Namespace) -> None:
 
     if args.theme not in installed_themes:
@@ -31,6 +30,29 @@ def build_webviz(args: argparse.Namespace) -> None:
         build_directory = args.portable.resolve()
         build_directory.mkdir(parents=True)
 
+    try:
+        plugin_metadata, referenced_paths = build_app(args, build_directory)
+
+        if args.portable:
+            for filename in ["README.md", ".dockerignore", ".gitignore"]:
+                shutil.copy(STATIC_FOLDER / filename, build_directory)
+            create_docker_setup(build_directory, plugin_metadata)
+        else:
+            run_webviz(args, build_directory, referenced_paths)
+
+    finally:
+        if not args.portable:
+            shutil.rmtree(build_directory)
+
+
+def build_app(
+    args: argparse.Namespace, build_directory: pathlib.Path
+) -> Tuple[Dict[str, dict], Set[pathlib.Path]]:
+    """Writes the Dash application, together with its assets (and, if portable,
+    its data), to the (existing) build directory. Returns information regarding
+    the plugins and the paths they are given as arguments (see `write_script`).
+    """
+
     shutil.copytree(STATIC_FOLDER / "assets", build_directory / "resources" / "assets")
 
     for asset in installed_themes[args.theme].assets:
@@ -40,54 +62,48 @@ def build_webviz(args: argparse.Namespace) -> None:
         installed_themes[args.theme].to_json()
     )
 
-    try:
-        if args.portable:
-            print(
-                f"{terminal_colors.BLUE}{terminal_colors.BOLD}"
-                "Saving requested data to build folder "
-                "such that the webviz instance is portable."
-                f"{terminal_colors.END}"
-            )
-
-            write_script(
-                args, build_directory, "copy_data_template.py.jinja2", "copy_data.py"
-            )
-
-            if subprocess.call(  # nosec
-                [sys.executable, "copy_data.py"], cwd=build_directory
-            ):
-                # We simply exit here with a non-zero status in order to not clutter
-                # the subprocess traceback with unnecessary information
-                sys.exit(1)
-
-            (build_directory / "copy_data.py").unlink()
-
-            print(
-                f"{terminal_colors.GREEN}{terminal_colors.BOLD}"
-                "Finished data extraction. All output saved."
-                f"{terminal_colors.END}"
-            )
-
-        non_default_assets, plugin_metadata = write_script(
-            args, build_directory, "webviz_template.py.jinja2", BUILD_FILENAME
+    if args.portable:
+        print(
+            f"{terminal_colors.BLUE}{terminal_colors.BOLD}"
+            "Saving requested data to build folder "
+            "such that the webviz instance is portable."
+            f"{terminal_colors.END}"
         )
 
-        for asset in non_default_assets:
-            shutil.copy(asset, build_directory / "resources" / "assets")
+        write_script(
+            args, build_directory, "copy_data_template.py.jinja2", "copy_data.py"
+        )
 
-        if args.portable:
-            for filename in ["README.md", ".dockerignore", ".gitignore"]:
-                shutil.copy(STATIC_FOLDER / filename, build_directory)
-            create_docker_setup(build_directory, plugin_metadata)
-        else:
-            run_webviz(args, build_directory)
+        if subprocess.call(  # nosec
+            [sys.executable, "copy_data.py"], cwd=build_directory
+        ):
+            # We simply exit here with a non-zero status in order to not clutter
+            # the subprocess traceback with unnecessary information
+            sys.exit(1)
 
-    finally:
-        if not args.portable:
-            shutil.rmtree(build_directory)
+        (build_directory / "copy_data.py").unlink()
 
+        print(
+            f"{terminal_colors.GREEN}{terminal_colors.BOLD}"
+            "Finished data extraction. All output saved."
+            f"{terminal_colors.END}"
+        )
 
-def run_webviz(args: argparse.Namespace, build_directory: pathlib.Path) -> None:
+    non_default_assets, plugin_metadata, referenced_paths = write_script(
+        args, build_directory, "webviz_template.py.jinja2", BUILD_FILENAME
+    )
+
+    for asset in non_default_assets:
+        shutil.copy(asset, build_directory / "resources" / "assets")
+
+    return plugin_metadata, referenced_paths
+
+
+def run_webviz(
+    args: argparse.Namespace,
+    build_directory: pathlib.Path,
+    referenced_paths: Iterable[pathlib.Path] = (),
+) -> None:
 
     print(
         f"{terminal_colors.YELLOW}"
@@ -97,27 +113,39 @@ def run_webviz(args: argparse.Namespace, build_directory: pathlib.Path) -> None:
 
     with subprocess.Popen(  # nosec
         [sys.executable, BUILD_FILENAME], cwd=build_directory
-    ) as app_process:
-
-        lastmtime = args.yaml_file.stat().st_mtime
+    ) as app_process, ConfigWatcher(args.yaml_file, referenced_paths) as watcher:
 
         while app_process.poll() is None:
             try:
-                time.sleep(1)
+                changed_paths = watcher.wait_for_changes(timeout=1)
+
+                if not changed_paths:
+                    continue
 
-                if lastmtime != args.yaml_file.stat().st_mtime:
-                    lastmtime = args.yaml_file.stat().st_mtime
-                    write_script(
+                if watcher.config_file_changed(changed_paths):
+                    _, _, referenced_paths = write_script(
                         args,
                         build_directory,
                         "webviz_template.py.jinja2",
                         BUILD_FILENAME,
                     )
+                    watcher.watch(referenced_paths)
                     print(
                         f"{terminal_colors.BLUE}{terminal_colors.BOLD}"
                         " Rebuilt webviz dash app from configuration file"
                         f"{terminal_colors.END}"
                     )
+                else:
+                    # Only files referenced by the configuration file changed. There is
+                    # no need to render the app again, it is enough to trigger the
+                    # hot reload of the app process (which rereads the files).
+                    (build_directory / BUILD_FILENAME).touch()
+                    print(
+                        f"{terminal_colors.BLUE}{terminal_colors.BOLD}"
+                        " Reloading webviz dash app due to changes in "
+                        f"{', '.join(path.name for path in sorted(changed_paths))}"
+                        f"{terminal_colors.END}"
+                    )
 
             except (ParserError, YAMLError) as excep:
                 print(
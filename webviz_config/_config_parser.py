@@ -2,7 +2,7 @@ import re
 import sys
 import pathlib
 import inspect
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set
 import warnings
 
 import yaml
@@ -145,7 +145,11 @@ def _call_signature(
 
     signature = inspect.signature(getattr(webviz_config.plugins, plugin_name).__init__)
     for key, value in signature.parameters.items():
-        if value.default is not inspect.Parameter.empty and key not in kwargs.keys():
+        if (
+            value.default is not inspect.Parameter.empty
+            and key not in kwargs.keys()
+            and key not in SPECIAL_ARGS
+        ):
             kwargs_including_defaults[key] = value.default
 
     for deprecation in deprecations:
@@ -242,6 +246,7 @@ class ConfigParser:
         self._assets: set = set()
         self._plugin_metadata: Dict[str, dict] = {}
         self._used_plugin_packages: set = set()
+        self._referenced_paths: Set[pathlib.Path] = set()
         self.clean_configuration()
 
     @staticmethod
@@ -349,6 +354,13 @@ class ConfigParser:
     def assets(self) -> set:
         return self._assets
 
+    @property
+    def referenced_paths(self) -> Set[pathlib.Path]:
+        """Returns the set of (resolved) paths given as path arguments
+        to the plugins included in the configuration file.
+        """
+        return self._referenced_paths
+
     @property
     def plugin_metadata(self) -> Dict[str, dict]:
         """Returns a dictionary of plugin metadata, and only for
@@ -356,6 +368,15 @@ class ConfigParser:
         """
         return self._plugin_metadata
 
+    def _register_referenced_paths(self, kwargs: dict) -> None:
+        for value in kwargs.values():
+            if isinstance(value, pathlib.Path):
+                self._referenced_paths.add(value)
+            elif isinstance(value, list):
+                self._referenced_paths.update(
+                    v for v in value if isinstance(v, pathlib.Path)
+                )
+
     def _recursively_parse_navigation_item(self, items: dict, level: int) -> list:
         navigation_items: list = []
         for item_number, item in enumerate(items):
@@ -448,6 +469,8 @@ class ConfigParser:
                         kwargs,
                         self._config_folder,
                     )
+                    # _call_signature resolves path arguments in place
+                    self._register_referenced_paths(kwargs)
 
                     self._assets.update(
                         getattr(webviz_config.plugins, plugin_name).ASSETS
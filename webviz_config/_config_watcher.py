@@ -0,0 +1,159 @@
+import queue
+import pathlib
+import threading
+from typing import Callable, Dict, Iterable, Optional, Set
+
+try:
+    from watchdog.events import FileSystemEvent, FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    WATCHDOG_INSTALLED = True
+except ModuleNotFoundError:
+    WATCHDOG_INSTALLED = False
+
+
+class ConfigWatcher:
+    """Watches the configuration file, together with all files/folders referenced
+    by plugin path arguments in it, for changes.
+
+    If the optional dependency `watchdog` is installed, file system events
+    (e.g. inotify on Linux) are used. If not, the watcher falls back to polling
+    the modification time of the watched paths.
+
+    Changes are debounced, i.e. a burst of writes (editors typically do
+    several writes, or write to a temporary file followed by a rename, when
+    saving) is reported as one change set when the file system has been quiet
+    for `debounce` seconds.
+    """
+
+    def __init__(
+        self,
+        config_file: pathlib.Path,
+        referenced_paths: Iterable[pathlib.Path] = (),
+        debounce: float = 0.3,
+        poll_interval: float = 1.0,
+    ):
+        self._config_file = config_file.resolve()
+        self._debounce = debounce
+        self._poll_interval = poll_interval
+
+        self._events: "queue.Queue[pathlib.Path]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+        self._paths: Set[pathlib.Path] = set()
+        self._mtimes: Dict[pathlib.Path, Optional[float]] = {}
+        self._watched_dirs: Dict[pathlib.Path, object] = {}
+
+        self._observer = Observer() if WATCHDOG_INSTALLED else None
+        self._poll_thread: Optional[threading.Thread] = None
+
+        self.watch(referenced_paths)
+
+    @property
+    def uses_file_system_events(self) -> bool:
+        return self._observer is not None
+
+    def watch(self, referenced_paths: Iterable[pathlib.Path]) -> None:
+        """Replaces the set of watched referenced paths (the configuration
+        file itself is always watched).
+        """
+        paths = {self._config_file} | {
+            pathlib.Path(path).resolve() for path in referenced_paths
+        }
+
+        with self._lock:
+            self._paths = paths
+            self._mtimes = {path: _mtime(path) for path in paths}
+
+        if self._observer is not None:
+            for directory in {path if path.is_dir() else path.parent for path in paths}:
+                if directory not in self._watched_dirs and directory.is_dir():
+                    self._watched_dirs[directory] = self._observer.schedule(
+                        _EventHandler(self._on_event), str(directory), recursive=False
+                    )
+
+    def start(self) -> "ConfigWatcher":
+        if self._observer is not None:
+            self._observer.start()
+        else:
+            self._poll_thread = threading.Thread(target=self._poll, daemon=True)
+            self._poll_thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+        elif self._poll_thread is not None:
+            self._poll_thread.join()
+
+    def __enter__(self) -> "ConfigWatcher":
+        return self.start()
+
+    def __exit__(self, *_args: object) -> None:
+        self.stop()
+
+    def config_file_changed(self, changed_paths: Set[pathlib.Path]) -> bool:
+        return self._config_file in changed_paths
+
+    def wait_for_changes(self, timeout: Optional[float] = None) -> Set[pathlib.Path]:
+        """Blocks until at least one watched path has changed (or `timeout`
+        seconds have passed), and then until no further changes have been seen
+        for the debounce period. Returns the set of changed paths (empty if
+        the timeout was reached without any changes).
+        """
+        changed_paths: Set[pathlib.Path] = set()
+
+        try:
+            changed_paths.add(self._events.get(timeout=timeout))
+        except queue.Empty:
+            return changed_paths
+
+        while True:
+            try:
+                changed_paths.add(self._events.get(timeout=self._debounce))
+            except queue.Empty:
+                return changed_paths
+
+    def _on_event(self, path: pathlib.Path) -> None:
+        with self._lock:
+            if path not in self._paths and path.parent not in self._paths:
+                return
+
+            # File system events are also triggered by reads/metadata changes
+            # on some platforms, only report actual content modifications.
+            mtime = _mtime(path)
+            if path in self._mtimes and self._mtimes[path] == mtime:
+                return
+            self._mtimes[path] = mtime
+
+        self._events.put(path)
+
+    def _poll(self) -> None:
+        while not self._stop_event.wait(self._poll_interval):
+            with self._lock:
+                paths = list(self._paths)
+            for path in paths:
+                self._on_event(path)
+
+
+if WATCHDOG_INSTALLED:
+
+    class _EventHandler(FileSystemEventHandler):
+        def __init__(self, callback: Callable[[pathlib.Path], None]) -> None:
+            super().__init__()
+            self._callback = callback
+
+        def on_any_event(self, event: FileSystemEvent) -> None:
+            for path in (event.src_path, getattr(event, "dest_path", "")):
+                if path:
+                    self._callback(pathlib.Path(str(path)).resolve())
+
+
+def _mtime(path: pathlib.Path) -> Optional[float]:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return None
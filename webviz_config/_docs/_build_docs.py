@@ -91,6 +91,8 @@ def _extract_init_arguments_and_check_for_deprecation(
         for arg, default in dict(
             zip(reversed(argspec.args), reversed(argspec.defaults))
         ).items():
+            if arg in SPECIAL_ARGS:
+                continue
             # Casting pathlib.Path to str could become unnecessary if outsourcing creation
             # of json schema to pydantic https://pydantic-docs.helpmanual.io/
             result[arg]["default_value"] = (
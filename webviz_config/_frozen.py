@@ -0,0 +1,85 @@
+import copy
+from typing import Any, NoReturn
+
+# Values of these types are immutable, and are shared instead of copied
+_ATOMIC_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def _read_only(self: Any, *_args: Any, **_kwargs: Any) -> NoReturn:
+    raise TypeError(
+        f"'{type(self).__name__}' is read-only. Use copy() to get a mutable copy."
+    )
+
+
+class FrozenDict(dict):
+    """Read-only dictionary, as returned by `freeze()`. It is still an instance
+    of `dict` (e.g. for `isinstance` checks and JSON serialization), but all
+    methods changing it raise `TypeError`. Both `copy()` and `copy.deepcopy()`
+    return a mutable (deep) copy with ordinary dictionaries and lists.
+    """
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        return hash(frozenset(self.items()))
+
+    def __reduce__(self) -> tuple:
+        return (FrozenDict, (dict(self),))
+
+    def __copy__(self) -> "FrozenDict":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        return thaw(self)
+
+    def copy(self) -> dict:  # type: ignore[override]
+        return thaw(self)
+
+
+class FrozenList(list):
+    """Read-only list, as returned by `freeze()`. See `FrozenDict`."""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        return hash(tuple(self))
+
+    def __reduce__(self) -> tuple:
+        return (FrozenList, (list(self),))
+
+    def __copy__(self) -> "FrozenList":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> list:
+        return thaw(self)
+
+    def copy(self) -> list:  # type: ignore[override]
+        return thaw(self)
+
+
+def freeze(value: Any) -> Any:
+    """Returns a read-only deep copy of the given value, where all (nested)
+    dictionaries and lists are replaced by `FrozenDict` and `FrozenList`.
+    """
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return FrozenList([freeze(item) for item in value])
+    if type(value) in _ATOMIC_TYPES:
+        return value
+    return copy.deepcopy(value)
+
+
+def thaw(value: Any) -> Any:
+    """Returns a mutable deep copy of a value returned by `freeze()`."""
+    if type(value) in _ATOMIC_TYPES:
+        return value
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    return copy.deepcopy(value)
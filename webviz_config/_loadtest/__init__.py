@@ -0,0 +1 @@
+from ._loadtest import main_loadtest
@@ -0,0 +1,191 @@
+import random
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# (component id, property)
+PropId = Tuple[str, str]
+
+
+@dataclass
+class CallbackSpec:
+    """A server side callback, as described by `/_dash-dependencies`."""
+
+    output: str
+    outputs: List[PropId]
+    inputs: List[PropId]
+    state: List[PropId]
+    prevent_initial_call: bool
+
+    @property
+    def label(self) -> str:
+        """Short, readable name of the callback used in the report."""
+        first = ".".join(self.outputs[0])
+        return (
+            first if len(self.outputs) == 1 else f"{first} (+{len(self.outputs) - 1})"
+        )
+
+    def request_body(
+        self, props: Dict[PropId, Any], changed: Iterable[PropId]
+    ) -> Dict[str, Any]:
+        """Body of the `/_dash-update-component` request, equal to what the Dash
+        renderer sends given the current property values."""
+
+        def spec(prop_id: PropId, with_value: bool) -> Dict[str, Any]:
+            component_id, prop = prop_id
+            return {
+                "id": component_id,
+                "property": prop,
+                **({"value": props.get(prop_id)} if with_value else {}),
+            }
+
+        outputs = [spec(prop_id, False) for prop_id in self.outputs]
+        return {
+            "output": self.output,
+            "outputs": outputs if self.output.startswith("..") else outputs[0],
+            "inputs": [spec(prop_id, True) for prop_id in self.inputs],
+            "state": [spec(prop_id, True) for prop_id in self.state],
+            "changedPropIds": [".".join(prop_id) for prop_id in changed],
+        }
+
+
+@dataclass
+class AppModel:
+    """Pages and server side callbacks of a Webviz application, discovered from
+    the layout (`/_dash-layout`) and callback map (`/_dash-dependencies`)."""
+
+    pages: List[str]
+    callbacks: List[CallbackSpec]
+    skipped_callbacks: int = 0
+    page_callback: Optional[CallbackSpec] = None
+    layout_props: Dict[PropId, Any] = field(default_factory=dict)
+
+    @staticmethod
+    def discover(layout: Dict[str, Any], dependencies: List[dict]) -> "AppModel":
+        pages: List[str] = []
+        layout_props = collect_props(layout)
+        for (component_id, prop), value in layout_props.items():
+            if component_id == "main-menu" and prop == "navigationItems":
+                pages.extend(_page_hrefs(value))
+
+        callbacks = []
+        skipped_callbacks = 0
+        for dependency in dependencies:
+            callback = _callback_spec(dependency)
+            if callback is None:
+                skipped_callbacks += 1
+            else:
+                callbacks.append(callback)
+
+        page_callback = next(
+            (
+                callback
+                for callback in callbacks
+                if callback.inputs == [("location", "pathname")]
+            ),
+            None,
+        )
+        if page_callback is not None:
+            callbacks.remove(page_callback)
+
+        return AppModel(
+            pages=pages or ["/"],
+            callbacks=callbacks,
+            skipped_callbacks=skipped_callbacks,
+            page_callback=page_callback,
+            layout_props=layout_props,
+        )
+
+    def triggered_callbacks(
+        self, changed: Set[PropId], initial: bool = False
+    ) -> List[Tuple[CallbackSpec, List[PropId]]]:
+        """Returns the callbacks triggered by the changed properties, together
+        with which of their inputs changed."""
+        triggered = []
+        for callback in self.callbacks:
+            if initial and callback.prevent_initial_call:
+                continue
+            changed_inputs = [
+                prop_id for prop_id in callback.inputs if prop_id in changed
+            ]
+            if changed_inputs:
+                triggered.append((callback, changed_inputs))
+        return triggered
+
+
+def collect_props(
+    tree: Any, props: Optional[Dict[PropId, Any]] = None
+) -> Dict[PropId, Any]:
+    """Returns the property values of all components (with a string id) in the
+    given (JSON serialized) component tree."""
+    props = {} if props is None else props
+    if isinstance(tree, list):
+        for child in tree:
+            collect_props(child, props)
+    elif isinstance(tree, dict) and "props" in tree and "type" in tree:
+        component_id = tree["props"].get("id")
+        for prop, value in tree["props"].items():
+            if isinstance(component_id, str):
+                props[(component_id, prop)] = value
+            if isinstance(value, (dict, list)):
+                collect_props(value, props)
+    return props
+
+
+def changed_value(props: Dict[PropId, Any], prop_id: PropId) -> Any:
+    """Returns a new value for the property, simulating a user interaction. For
+    properties with options (e.g. dropdowns and radio items) a random option is
+    selected, otherwise the current value is kept."""
+    component_id, prop = prop_id
+    options = props.get((component_id, "options"))
+    if prop != "value" or not isinstance(options, list) or not options:
+        return props.get(prop_id)
+
+    option = random.choice(options)
+    value = option.get("value") if isinstance(option, dict) else option
+    return [value] if isinstance(props.get(prop_id), list) else value
+
+
+def _page_hrefs(navigation_items: Any) -> List[str]:
+    hrefs = []
+    for item in navigation_items if isinstance(navigation_items, list) else []:
+        if item.get("type") == "page" and item.get("href"):
+            hrefs.append(item["href"])
+        hrefs.extend(_page_hrefs(item.get("content")))
+    return hrefs
+
+
+def _callback_spec(dependency: Dict[str, Any]) -> Optional[CallbackSpec]:
+    """Returns None for callbacks not replayed, i.e. clientside callbacks (which
+    do not hit the server) and callbacks with pattern-matching ids."""
+    if dependency.get("clientside_function") is not None:
+        return None
+
+    inputs = _prop_ids(dependency.get("inputs", []))
+    state = _prop_ids(dependency.get("state", []))
+    output = dependency["output"]
+    outputs = []
+    for output_spec in (
+        output[2:-2].split("...") if output.startswith("..") else [output]
+    ):
+        component_id, _, prop = output_spec.rpartition(".")
+        outputs.append((component_id, prop))
+    if (
+        inputs is None
+        or state is None
+        or any(component_id.startswith("{") for component_id, _ in outputs)
+    ):
+        return None
+
+    return CallbackSpec(
+        output=output,
+        outputs=outputs,
+        inputs=inputs,
+        state=state,
+        prevent_initial_call=bool(dependency.get("prevent_initial_call")),
+    )
+
+
+def _prop_ids(dependencies: List[Dict[str, Any]]) -> Optional[List[PropId]]:
+    if any(not isinstance(dependency["id"], str) for dependency in dependencies):
+        return None
+    return [(dependency["id"], dependency["property"]) for dependency in dependencies]
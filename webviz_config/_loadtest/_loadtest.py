@@ -0,0 +1,209 @@
+import os
+import sys
+import json
+import time
+import pathlib
+import argparse
+import tempfile
+import threading
+import subprocess  # nosec
+import importlib.util
+from typing import Any, Dict, List
+
+import requests
+
+from .._build_webviz import BUILD_FILENAME, build_app
+from ..themes import installed_themes
+from ..utils import get_available_port, terminal_colors
+from ._app_model import AppModel
+from ._stats import PERCENTILES, LoadTestStats
+from ._virtual_user import VirtualUser
+
+# Seconds between each sample of the memory usage of the worker processes
+MEMORY_SAMPLE_INTERVAL = 1
+
+
+def main_loadtest(args: argparse.Namespace) -> None:
+    """Builds a portable application from the configuration file, starts it
+    with gunicorn (with the same settings as the generated Dockerfile), and
+    runs `args.users` concurrent virtual users against it for `args.duration`
+    seconds. Finally, throughput and latency per request/callback, and memory
+    usage of the workers, are reported."""
+
+    if importlib.util.find_spec("gunicorn") is None:
+        raise RuntimeError(
+            "Load testing requires gunicorn, which is not installed. "
+            "Install it with `pip install gunicorn`."
+        )
+
+    if args.theme not in installed_themes:
+        raise ValueError(f"Theme `{args.theme}` is not installed.")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        build_directory = pathlib.Path(temp_dir)
+        build_app(
+            argparse.Namespace(
+                yaml_file=args.yaml_file,
+                portable=build_directory,
+                theme=args.theme,
+                loglevel="WARNING",
+                debug=False,
+                logconfig=None,
+            ),
+            build_directory,
+        )
+
+        port = get_available_port(preferred_port=5000)
+        base_url = f"http://localhost:{port}"
+
+        with subprocess.Popen(  # nosec
+            [
+                sys.executable,
+                "-m",
+                "gunicorn",
+                "--bind",
+                f"localhost:{port}",
+                "--preload",
+                "--workers",
+                str(args.workers),
+                "--worker-class",
+                "gthread",
+                "--threads",
+                str(args.threads),
+                "--timeout",
+                "100000",
+                f"{pathlib.Path(BUILD_FILENAME).stem}:server",
+            ],
+            cwd=build_directory,
+        ) as server:
+            try:
+                _wait_until_ready(server, base_url, args.startup_timeout)
+                summary = run_loadtest(args, base_url, server.pid)
+            finally:
+                server.terminate()
+                server.wait()
+
+    print_summary(summary)
+    if args.output is not None:
+        args.output.write_text(json.dumps(summary, indent=4))
+        print(f"Load test report written to {args.output}")
+
+
+def run_loadtest(
+    args: argparse.Namespace, base_url: str, server_pid: int
+) -> Dict[str, Any]:
+    app_model = AppModel.discover(
+        requests.get(f"{base_url}/_dash-layout", timeout=60).json(),
+        requests.get(f"{base_url}/_dash-dependencies", timeout=60).json(),
+    )
+    print(
+        f"{terminal_colors.BLUE}{terminal_colors.BOLD}"
+        f"Discovered {len(app_model.pages)} pages and {len(app_model.callbacks)} "
+        f"callbacks ({app_model.skipped_callbacks} clientside/pattern-matching "
+        f"callbacks are not replayed). Running {args.users} virtual users "
+        f"for {args.duration} seconds..."
+        f"{terminal_colors.END}"
+    )
+
+    stats = LoadTestStats()
+    stop = threading.Event()
+    users = [
+        VirtualUser(
+            base_url,
+            app_model,
+            stats,
+            stop,
+            think_time=args.think_time,
+            interactions_per_page=args.interactions,
+            start_delay=i * args.ramp_up / args.users,
+        )
+        for i in range(args.users)
+    ]
+
+    start = time.perf_counter()
+    for user in users:
+        user.start()
+    try:
+        while not stop.wait(MEMORY_SAMPLE_INTERVAL):
+            elapsed = time.perf_counter() - start
+            stats.add_memory_sample(elapsed, worker_memory(server_pid))
+            if elapsed >= args.duration:
+                stop.set()
+    except KeyboardInterrupt:
+        stop.set()
+        print("Stopping the load test on user request.")
+
+    for user in users:
+        user.join()
+
+    return stats.summary(time.perf_counter() - start)
+
+
+def worker_memory(server_pid: int) -> Dict[int, int]:
+    """Returns the resident memory size (in bytes) of each child (i.e. worker)
+    process of the server process. Empty if not available (only Linux is
+    supported)."""
+    rss_per_worker = {}
+    for stat_file in pathlib.Path("/proc").glob("[0-9]*/stat"):
+        try:
+            # The process name (second field) is in parenthesis, and may
+            # contain spaces. The parent pid is the second field after it.
+            parent_pid = int(stat_file.read_text().rsplit(")", 1)[1].split()[1])
+            if parent_pid == server_pid:
+                statm = (stat_file.parent / "statm").read_text()
+                rss_per_worker[int(stat_file.parent.name)] = int(
+                    statm.split()[1]
+                ) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, IndexError, ValueError):
+            # The process exited while reading
+            continue
+    return rss_per_worker
+
+
+def print_summary(summary: Dict[str, Any]) -> None:
+    header = f"{'Request':<60} {'Count':>7} {'Errors':>7} {'Req/s':>7}" + "".join(
+        f" {f'p{percent} (ms)':>10}" for percent in PERCENTILES
+    )
+    print(f"\n{terminal_colors.BOLD}{header}{terminal_colors.END}")
+    for label, stats in summary["per_request"].items():
+        print(
+            f"{label[:60]:<60} {stats['count']:>7} {stats['errors']:>7} "
+            f"{stats['throughput']:>7.2f}"
+            + "".join(
+                f" {1000 * stats[f'p{percent}']:>10.1f}" for percent in PERCENTILES
+            )
+        )
+
+    print(
+        f"\n{terminal_colors.BOLD}Total: {summary['requests']} requests "
+        f"({summary['errors']} errors) in {summary['duration']:.1f} seconds, "
+        f"{summary['throughput']:.2f} requests per second.{terminal_colors.END}"
+    )
+
+    rss_per_worker: Dict[str, List[int]] = {}
+    for sample in summary["memory"]:
+        for pid, rss in sample["rss"].items():
+            rss_per_worker.setdefault(pid, []).append(rss)
+    for pid, rss in rss_per_worker.items():
+        print(
+            f"Worker {pid} memory (MB): start {rss[0] / 2**20:.0f}, "
+            f"peak {max(rss) / 2**20:.0f}, end {rss[-1] / 2**20:.0f}"
+        )
+
+
+def _wait_until_ready(
+    server: subprocess.Popen, base_url: str, startup_timeout: float
+) -> None:
+    deadline = time.monotonic() + startup_timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError("The webviz application exited during startup.")
+        try:
+            if requests.get(base_url, timeout=5).status_code == 200:
+                return
+        except requests.exceptions.ConnectionError:
+            pass
+        time.sleep(0.5)
+    raise RuntimeError(
+        f"The webviz application did not start within {startup_timeout} seconds."
+    )
@@ -0,0 +1,69 @@
+import math
+import threading
+from collections import defaultdict
+from typing import Any, DefaultDict, Dict, List, Tuple
+
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return math.nan
+    rank = math.ceil(percent / 100 * len(sorted_values))
+    return sorted_values[max(rank, 1) - 1]
+
+
+class LoadTestStats:
+    """Latencies and errors of all requests, grouped by request label (e.g. the
+    callback), and memory samples of the worker processes. Thread safe."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._durations: DefaultDict[str, List[float]] = defaultdict(list)
+        self._errors: DefaultDict[str, int] = defaultdict(int)
+        self.memory_samples: List[Tuple[float, Dict[int, int]]] = []
+
+    def record(self, label: str, duration: float, success: bool) -> None:
+        with self._lock:
+            self._durations[label].append(duration)
+            if not success:
+                self._errors[label] += 1
+
+    def add_memory_sample(self, elapsed: float, rss_per_worker: Dict[int, int]) -> None:
+        with self._lock:
+            self.memory_samples.append((elapsed, rss_per_worker))
+
+    def summary(self, duration: float) -> Dict[str, Any]:
+        """Returns throughput and latency percentiles (in seconds) per request
+        label, together with the memory samples, for a run of the given
+        duration (in seconds)."""
+        with self._lock:
+            requests = {}
+            for label, durations in sorted(self._durations.items()):
+                sorted_durations = sorted(durations)
+                requests[label] = {
+                    "count": len(durations),
+                    "errors": self._errors[label],
+                    "throughput": len(durations) / duration,
+                    "mean": sum(durations) / len(durations),
+                    **{
+                        f"p{percent}": percentile(sorted_durations, percent)
+                        for percent in PERCENTILES
+                    },
+                }
+            total = sum(stats["count"] for stats in requests.values())
+            return {
+                "duration": duration,
+                "requests": total,
+                "errors": sum(stats["errors"] for stats in requests.values()),
+                "throughput": total / duration,
+                "per_request": requests,
+                "memory": [
+                    {
+                        "elapsed": elapsed,
+                        "rss": {str(pid): rss for pid, rss in rss_per_worker.items()},
+                    }
+                    for elapsed, rss_per_worker in self.memory_samples
+                ],
+            }
@@ -0,0 +1,157 @@
+import time
+import random
+import threading
+from typing import Any, Dict, Optional, Set
+
+import requests
+
+from ._app_model import AppModel, CallbackSpec, PropId, changed_value, collect_props
+from ._stats import LoadTestStats
+
+# Maximum number of rounds of chained callbacks (callbacks triggered by the
+# outputs of other callbacks) replayed after a page load or interaction
+MAX_CALLBACK_ROUNDS = 10
+
+# Seconds before a request is considered failed
+REQUEST_TIMEOUT = 300
+
+
+class VirtualUser(threading.Thread):
+    """Simulates a user of the application, by repeatedly navigating to a random
+    page followed by a number of interactions with it, until `stop` is set.
+
+    A page load consists of the requests a browser does: the index page, the
+    layout and the callback map, followed by the page callback and the initial
+    callbacks of the components on the page. An interaction changes an input of
+    a random callback on the page (e.g. selecting a random option in a
+    dropdown). Callbacks triggered by the outputs of other callbacks are
+    replayed as well, like the Dash renderer does.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        base_url: str,
+        app_model: AppModel,
+        stats: LoadTestStats,
+        stop: threading.Event,
+        think_time: float,
+        interactions_per_page: int,
+        start_delay: float = 0,
+    ):
+        super().__init__(daemon=True)
+        self._base_url = base_url
+        self._app_model = app_model
+        self._stats = stats
+        self._stop_event = stop
+        self._think_time = think_time
+        self._interactions_per_page = interactions_per_page
+        self._start_delay = start_delay
+        self._session = requests.Session()
+        self._props: Dict[PropId, Any] = {}
+
+    def run(self) -> None:
+        if self._stop_event.wait(self._start_delay):
+            return
+        while not self._stop_event.is_set():
+            self._load_page(random.choice(self._app_model.pages))
+            for _ in range(self._interactions_per_page):
+                if not self._think():
+                    return
+                self._interact()
+            if not self._think():
+                return
+
+    def _think(self) -> bool:
+        """Waits a random think time. Returns False if the user should stop."""
+        return not self._stop_event.wait(random.uniform(0, 2 * self._think_time))
+
+    def _load_page(self, page: str) -> None:
+        self._request("GET /", "GET", "/")
+        self._request("GET /_dash-layout", "GET", "/_dash-layout")
+        self._request("GET /_dash-dependencies", "GET", "/_dash-dependencies")
+
+        self._props = dict(self._app_model.layout_props)
+        self._props[("location", "pathname")] = page
+        changed: Set[PropId] = set(self._props)
+
+        if self._app_model.page_callback is not None:
+            changed |= self._call(
+                self._app_model.page_callback,
+                [("location", "pathname")],
+                label=f"page {page}",
+            )
+        self._call_triggered(changed, initial=True)
+
+    def _interact(self) -> None:
+        on_page = [
+            (callback, prop_id)
+            for callback in self._app_model.callbacks
+            for prop_id in callback.inputs
+            if prop_id in self._props
+        ]
+        if not on_page:
+            return
+        callback, prop_id = random.choice(on_page)
+        self._props[prop_id] = changed_value(self._props, prop_id)
+        self._call_triggered(self._call(callback, [prop_id]) | {prop_id})
+
+    def _call_triggered(self, changed: Set[PropId], initial: bool = False) -> None:
+        for _ in range(MAX_CALLBACK_ROUNDS):
+            triggered = self._app_model.triggered_callbacks(changed, initial)
+            changed = set()
+            for callback, changed_inputs in triggered:
+                if self._stop_event.is_set():
+                    return
+                changed |= self._call(callback, changed_inputs)
+            if not changed:
+                return
+            initial = False
+
+    def _call(
+        self,
+        callback: CallbackSpec,
+        changed_inputs: list,
+        label: Optional[str] = None,
+    ) -> Set[PropId]:
+        """Calls the callback, and updates the property values with the response.
+        Returns the properties which were changed."""
+        response = self._request(
+            label or f"callback {callback.label}",
+            "POST",
+            "/_dash-update-component",
+            json=callback.request_body(self._props, changed_inputs),
+        )
+        if response is None or response.status_code != 200:
+            return set()
+
+        changed: Set[PropId] = set()
+        for component_id, props in response.json().get("response", {}).items():
+            for prop, value in props.items():
+                self._props[(component_id, prop)] = value
+                changed.add((component_id, prop))
+                if isinstance(value, (dict, list)):
+                    # New components (e.g. the page content) are rendered,
+                    # which triggers their callbacks
+                    new_props = collect_props(value)
+                    self._props.update(new_props)
+                    changed |= set(new_props)
+        return changed
+
+    def _request(
+        self, label: str, method: str, path: str, **kwargs: Any
+    ) -> Optional[requests.Response]:
+        start = time.perf_counter()
+        try:
+            response = self._session.request(
+                method, self._base_url + path, timeout=REQUEST_TIMEOUT, **kwargs
+            )
+        except requests.exceptions.RequestException:
+            self._stats.record(label, time.perf_counter() - start, success=False)
+            return None
+        # 204 is returned by callbacks raising PreventUpdate
+        self._stats.record(
+            label,
+            time.perf_counter() - start,
+            success=response.status_code in (200, 204),
+        )
+        return response
@@ -5,6 +5,7 @@ import flask
 
 from ._is_reload_process import is_reload_process
 from ._oauth2 import Oauth2
+from ._static_auth import StaticRequestAuth
 
 
 class LocalhostToken:
@@ -64,7 +65,10 @@ class LocalhostToken:
     def set_request_decorators(self) -> None:
         # pylint: disable=inconsistent-return-statements
         @self._app.before_request
+        @StaticRequestAuth.for_app(self._app).timed
         def _check_for_ott_or_cookie():  # type: ignore[no-untyped-def]
+            if StaticRequestAuth.for_app(self._app).is_public_request():
+                return None
 
             if not self._ott_validated and self._ott == flask.request.args.get("ott"):
                 self._ott_validated = True
@@ -6,12 +6,16 @@ import msal
 import flask
 from werkzeug.middleware.proxy_fix import ProxyFix
 
+from ._static_auth import StaticRequestAuth
+
 
 class Oauth2:
     """Oauth2 authorization Code grant flow"""
 
     def __init__(self, app: flask.app.Flask):
         self._app = app
+        self._static_auth = StaticRequestAuth.for_app(app)
+        self._static_auth.skip_static_sessions()
 
         self.configure_proxy_trust()
 
@@ -116,14 +120,24 @@ class Oauth2:
         If the current date exceeds its expiration date, a new access token is
         retrieved and set in the session cookie. A new expiration date is also
         set in the session cookie.
+
+        Requests for static files are authorized by a signed cookie, set after
+        the access token has been checked, see StaticRequestAuth.
         """
 
         @self._app.before_request
+        @self._static_auth.timed
         def _check_access_token():  # type: ignore[no-untyped-def]
             return self.check_access_token()
 
     # pylint: disable=inconsistent-return-statements
     def check_access_token(self):  # type: ignore[no-untyped-def]
+        if (
+            self._static_auth.is_authorized_static_request()
+            or self._static_auth.is_public_request()
+        ):
+            return None
+
         self.check_and_set_token_expiry()
 
         # If the client session does not contain access token, redirect to /login
@@ -131,6 +145,9 @@ class Oauth2:
         if is_redirected:
             return flask.redirect(redirect_url)
 
+        if flask.session.get("access_token"):
+            self._static_auth.authorize(flask.session["expiration_date"].timestamp())
+
     @staticmethod
     def is_empty_token() -> Tuple[bool, str]:
         if (
@@ -1,4 +1,4 @@
-from typing import TypedDict
+from typing import Callable, TypedDict
 import io
 import abc
 import base64
@@ -6,14 +6,25 @@ import zipfile
 import warnings
 import urllib
 import enum
+import weakref
 
 import bleach
 from dash.development.base_component import Component
-from dash import callback, callback_context, dcc, html, Input, Output
+from dash import (
+    ALL,
+    callback,
+    callback_context,
+    clientside_callback,
+    dcc,
+    html,
+    Input,
+    Output,
+)
 import dash
 import jinja2
 import webviz_core_components as wcc
 
+from .webviz_downloads import WEBVIZ_DOWNLOADS, DownloadData
 from .webviz_plugin_subclasses import SettingsGroupABC, ViewABC, LayoutUniqueId
 
 
@@ -53,8 +64,13 @@ class DuplicatePluginChildId(Exception):
     pass
 
 
+# Type of the pattern-matching id of the container showing the active view,
+# within the wrapper of each plugin with views
+VIEW_CONTAINER_TYPE = "webviz-plugin-view-container"
+
+
 class WebvizPluginABC(abc.ABC):
-    # pylint: disable=too-many-public-methods
+    # pylint: disable=too-many-public-methods, too-many-instance-attributes
     """All webviz plugins need to subclass this abstract base class,
     e.g.
 
@@ -91,6 +107,16 @@ class WebvizPluginABC(abc.ABC):
     # Used to create unique ids of DOM elements
     CLASS_INSTANCE_COUNTER: int = 0
 
+    # All plugin instances by plugin unique id, such that the single
+    # callback switching views can look up the plugin of each view container
+    _INSTANCES: "weakref.WeakValueDictionary[str, WebvizPluginABC]" = (
+        weakref.WeakValueDictionary()
+    )
+
+    # Apps on which the callback switching views has been registered. It is
+    # registered when the first view is added to a plugin of each app.
+    _VIEW_CALLBACK_APPS: "weakref.WeakSet[dash.Dash]" = weakref.WeakSet()
+
     class StorageType(enum.Enum):
         MEMORY = "memory"
         LOCAL = "local"
@@ -115,11 +141,15 @@ class WebvizPluginABC(abc.ABC):
         )
         self._screenshot_filename = screenshot_filename
         self._add_download_button = False
+        self._download_provider_set = False
 
         self._views: list[tuple[str, ViewABC]] = []
+        # Views by view id and by view unique id (as used in the layout)
+        self._views_by_id: dict[str, ViewABC] = {}
+        self._views_by_unique_id: dict[str, ViewABC] = {}
         self._stores: list[tuple[str, WebvizPluginABC.StorageType]] = []
         self._shared_settings_groups: list[SettingsGroupABC] = []
-        self._registered_ids: list[str] = []
+        self._registered_ids: set[str] = set()
 
         self._active_view_id = ""
         self._stretch = stretch
@@ -127,7 +157,7 @@ class WebvizPluginABC(abc.ABC):
 
         self._legacy_plugin_view_id = f"{self._plugin_unique_id.to_string()}-view"
 
-        self._set_wrapper_callbacks()
+        WebvizPluginABC._INSTANCES[self._plugin_unique_id.to_string()] = self
 
     def uuid(self, element: str | None = None) -> str:
         """Typically used to get a unique ID for some given element/component in
@@ -170,7 +200,7 @@ class WebvizPluginABC(abc.ABC):
                 raise DuplicatePluginChildId(
                     f"Duplicate ID in plugin '{type(self).__name__}' detected: '{i}'"
                 )
-            self._registered_ids.append(i)
+            self._registered_ids.add(i)
 
     def add_view(self, view: ViewABC, view_id: str, view_group: str = "") -> None:
         # pylint: disable=protected-access
@@ -180,6 +210,9 @@ class WebvizPluginABC(abc.ABC):
         view._set_plugin_get_store_unique_id_func(self.get_store_unique_id)
         view._set_unique_id(self._plugin_unique_id)
         self._views.append((view_group, view))
+        self._views_by_id[view_id] = view
+        self._views_by_unique_id[view.unique_id()] = view
+        WebvizPluginABC.set_view_callbacks()
 
     def add_shared_settings_group(
         self,
@@ -243,14 +276,7 @@ class WebvizPluginABC(abc.ABC):
         return self._views
 
     def view(self, view_id: str) -> ViewABC:
-        view = next(
-            (
-                el[1]
-                for el in self.views()
-                if el[1].get_unique_id().get_view_id() == view_id
-            ),
-            None,
-        )
+        view = self._views_by_id.get(view_id)
         if view:
             return view
 
@@ -326,6 +352,59 @@ class WebvizPluginABC(abc.ABC):
     def plugin_data_requested(self) -> Input:
         return Input(self._legacy_plugin_view_id, "data_requested")
 
+    def set_download_provider(
+        self,
+        provider: Callable[[], DownloadData],
+        filename: str,
+        compress: bool = False,
+    ) -> None:
+        """Alternative to `plugin_data_output` for plugins with potentially large
+        download data. Instead of returning the whole file base64 encoded through
+        a callback, the browser is given a short lived URL from which the data
+        returned by `provider` is streamed in chunks.
+
+        `provider` should return either a dataframe (if `filename` ends with
+        `.csv` or `.parquet`) or a list of `ZipFileMember` (if `filename` ends with
+        `.zip`). If `compress` is `True`, the stream is in addition gzip compressed.
+        """
+        self._add_download_button = True
+        self._download_provider_set = True
+        WEBVIZ_DOWNLOADS.add(self.uuid("download"), provider)
+
+        @callback(
+            Output(self.uuid("download-url"), "data"),
+            self.plugin_data_requested,
+            prevent_initial_call=True,
+        )
+        def _download_url(data_requested: int | None) -> str | None:
+            return (
+                self.plugin_download_url(filename, compress) if data_requested else None
+            )
+
+        clientside_callback(
+            """
+            function (url) {
+                if (url) {
+                    const link = document.createElement("a");
+                    link.href = url;
+                    link.download = "";
+                    document.body.appendChild(link);
+                    link.click();
+                    link.remove();
+                }
+                return window.dash_clientside.no_update;
+            }
+            """,
+            Output(self.uuid("download-url"), "clear_data"),
+            Input(self.uuid("download-url"), "data"),
+        )
+
+    def plugin_download_url(self, filename: str, compress: bool = False) -> str:
+        """Returns a short lived URL streaming the data from the download provider
+        given in `set_download_provider`. Needs to be called from within a callback.
+        """
+        return WEBVIZ_DOWNLOADS.url(self.uuid("download"), filename, compress)
+
     @staticmethod
     def _reformat_tour_steps(steps: list[dict]) -> list[dict]:
         return [
@@ -465,73 +544,105 @@ class WebvizPluginABC(abc.ABC):
             for key in contact_person:
                 contact_person[key] = bleach.clean(str(contact_person[key]))
 
-        return [
-            dcc.Store(
-                id=self.uuid(f"store-{store[0]}"),
-                storage_type=store[1].value,
+        return (
+            [
+                dcc.Store(
+                    id=self.uuid(f"store-{store[0]}"),
+                    storage_type=store[1].value,
+                )
+                for store in self._stores
+            ]
+            + (
+                [dcc.Store(id=self.uuid("download-url"))]
+                if self._download_provider_set
+                else []
             )
-            for store in self._stores
-        ] + [
-            wcc.WebvizPluginWrapper(
-                id=self._plugin_unique_id.to_string(),
-                name=type(self).__name__,
-                views=[
-                    {
-                        "id": view[1].unique_id(),
-                        "group": view[0],
-                        "name": view[1].name,
-                        # pylint: disable=protected-access
-                        "showDownload": view[1]._add_download_button,
-                    }
-                    for view in self.views()
-                ]
-                if self.views()
-                else [
-                    {
-                        "id": self._legacy_plugin_view_id,
-                        "group": "",
-                        "name": "",
-                        "showDownload": self._add_download_button,
-                    }
-                ],
-                initiallyActiveViewId=self.active_view_id
-                if self.views()
-                else self._legacy_plugin_view_id,
-                contactPerson=contact_person,
-                deprecationWarnings=self._make_extended_deprecation_warnings(
-                    plugin_deprecation_warnings, argument_deprecation_warnings
-                ),
-                screenshotFilename=self._screenshot_filename,
-                feedbackUrl=self._make_feedback_url(),
-                tourSteps=WebvizPluginABC._reformat_tour_steps(self.tour_steps)
-                if hasattr(self, "tour_steps")
-                else None,
-                stretch=self._stretch if self.views() else True,
-                children=[
-                    wcc.WebvizPluginLoadingIndicator()
+            + [
+                wcc.WebvizPluginWrapper(
+                    id=self._plugin_unique_id.to_string(),
+                    name=type(self).__name__,
+                    views=[
+                        {
+                            "id": view[1].unique_id(),
+                            "group": view[0],
+                            "name": view[1].name,
+                            # pylint: disable=protected-access
+                            "showDownload": view[1]._add_download_button,
+                        }
+                        for view in self.views()
+                    ]
                     if self.views()
-                    else wcc.WebvizView(
-                        id=self._legacy_plugin_view_id,
-                        children=[
-                            html.Div(
-                                children=[self.layout],
-                                style={"width": "100%", "margin-left": "16px"},
-                            )
-                        ],
-                    )
-                ],
-                persistence_type="session",
-                persistence=True,
-            )
-        ]
+                    else [
+                        {
+                            "id": self._legacy_plugin_view_id,
+                            "group": "",
+                            "name": "",
+                            "showDownload": self._add_download_button,
+                        }
+                    ],
+                    initiallyActiveViewId=self.active_view_id
+                    if self.views()
+                    else self._legacy_plugin_view_id,
+                    contactPerson=contact_person,
+                    deprecationWarnings=self._make_extended_deprecation_warnings(
+                        plugin_deprecation_warnings, argument_deprecation_warnings
+                    ),
+                    screenshotFilename=self._screenshot_filename,
+                    feedbackUrl=self._make_feedback_url(),
+                    tourSteps=WebvizPluginABC._reformat_tour_steps(self.tour_steps)
+                    if hasattr(self, "tour_steps")
+                    else None,
+                    stretch=self._stretch if self.views() else True,
+                    children=[
+                        html.Div(
+                            id={
+                                "type": VIEW_CONTAINER_TYPE,
+                                "plugin": self._plugin_unique_id.to_string(),
+                            },
+                            style={"display": "flex", "flexGrow": 1, "width": "100%"},
+                            children=wcc.WebvizPluginLoadingIndicator(),
+                        )
+                        if self.views()
+                        else wcc.WebvizView(
+                            id=self._legacy_plugin_view_id,
+                            children=[
+                                html.Div(
+                                    children=[self.layout],
+                                    style={"width": "100%", "margin-left": "16px"},
+                                )
+                            ],
+                        )
+                    ],
+                    persistence_type="session",
+                    persistence=True,
+                )
+            ]
+        )
 
-    def _set_wrapper_callbacks(self) -> None:
-        @callback(
-            Output(self._plugin_unique_id.to_string(), "children"),
+    @staticmethod
+    def set_view_callbacks(app: dash.Dash | None = None) -> None:
+        """Registers the callback rendering the active view of each plugin with
+        views, when the active view or plugin in `webviz-content-manager` changes.
+        A single callback serves all plugins of an app. It is registered on the
+        most recently created app (unless `app` is given) when a view is added
+        to a plugin, and only once per app.
+        """
+        if app is None:
+            try:
+                app = dash.get_app()
+            except Exception:  # pylint: disable=broad-except
+                # No app has been created yet
+                return
+        if app in WebvizPluginABC._VIEW_CALLBACK_APPS:
+            return
+        WebvizPluginABC._VIEW_CALLBACK_APPS.add(app)
+
+        @app.callback(
+            Output({"type": VIEW_CONTAINER_TYPE, "plugin": ALL}, "children"),
             Input("webviz-content-manager", "activeViewId"),
             Input("webviz-content-manager", "activePluginId"),
         )
-        def change_view(view_id: str, plugin_id: str) -> Component:
+        def _change_view(view_id: str, plugin_id: str) -> list:
             ctx = callback_context.triggered
             initial_call = (
                 ctx[0]["prop_id"] == "."
@@ -542,15 +653,16 @@ class WebvizPluginABC(abc.ABC):
                 else False
             )
 
-            if plugin_id == self._plugin_unique_id.to_string() or initial_call:
-                view = next(
-                    (
-                        view[1]
-                        for view in self.views()
-                        if view[1].unique_id() == view_id
-                    ),
-                    None,
+            # pylint: disable=protected-access
+            layouts = []
+            for output in callback_context.outputs_list:
+                container_plugin_id = output["id"]["plugin"]
+                plugin = WebvizPluginABC._INSTANCES.get(container_plugin_id)
+                view = (
+                    plugin._views_by_unique_id.get(view_id)
+                    if plugin is not None
+                    and (container_plugin_id == plugin_id or initial_call)
+                    else None
                 )
-                if view:
-                    return view.outer_layout()
-            return dash.no_update
+                layouts.append(view.outer_layout() if view else dash.no_update)
+            return layouts
@@ -0,0 +1,171 @@
+import time
+import secrets
+import functools
+from typing import Any, Callable, Dict, Optional, Set
+
+import flask
+from flask.sessions import SecureCookieSessionInterface, SessionMixin
+from itsdangerous import BadSignature, Signer
+
+# Routes serving immutable static files: Dash component bundles, Dash assets
+# and assets hosted by WebvizAssets.directly_host_assets()
+STATIC_ROUTES = ("/_dash-component-suites/", "/assets/", "/temp/", "/_favicon.ico")
+
+# Maximum number of verified cookie values kept, in order to not verify the
+# signature of the same cookie on every request
+VERIFIED_COOKIES_MAX_SIZE = 1024
+
+
+class StaticRequestAuth:
+    """Fast path for authorization of requests for immutable static files, and
+    reporting of the time spent on authorization.
+
+    Once a request has passed the full authorization check (e.g. the Oauth2
+    access token check), the response sets a signed cookie valid until the
+    access token expires (at most `max_age` seconds). Requests for static files
+    with a valid cookie are then authorized by only checking the cookie, and
+    the session (containing the access token) is not deserialized for them.
+    Other requests always go through the full check.
+
+    Each request is classified once, and the time spent in authorization checks
+    wrapped by `timed()` is reported as `auth` in the `Server-Timing` response
+    header.
+
+    Endpoints added with `add_public_endpoint()` (e.g. the Prometheus metrics
+    endpoint) are not authorized by the authorization checks at all.
+    """
+
+    COOKIE_NAME = "webviz_static_auth"
+    ENVIRON_KEY = "webviz.authorized_static_request"
+
+    def __init__(self, app: flask.Flask, max_age: int = 3600) -> None:
+        self._app = app
+        self._max_age = max_age
+        self._signer: Optional[Signer] = None
+        self._verified_cookies: Dict[str, int] = {}
+        self._fallback_secret = secrets.token_urlsafe(nbytes=64)
+        self._public_endpoints: Set[str] = set()
+        app.after_request(self._after_request)
+
+    @staticmethod
+    def for_app(app: flask.Flask) -> "StaticRequestAuth":
+        """Returns the instance shared by all authorization checks on the app."""
+        if "webviz_static_auth" not in app.extensions:
+            app.extensions["webviz_static_auth"] = StaticRequestAuth(app)
+        return app.extensions["webviz_static_auth"]
+
+    def skip_static_sessions(self) -> None:
+        """Do not deserialize the session for authorized static requests."""
+        self._app.session_interface = _StaticSkippingSessionInterface(self)
+
+    def is_authorized_static_request(
+        self, request: Optional[flask.Request] = None
+    ) -> bool:
+        """Returns True if the request is for a static file, and has a valid
+        static authorization cookie."""
+        request = request or flask.request
+        try:
+            return request.environ[StaticRequestAuth.ENVIRON_KEY]
+        except KeyError:
+            authorized = request.environ[StaticRequestAuth.ENVIRON_KEY] = self._check(
+                request
+            )
+            return authorized
+
+    def add_public_endpoint(self, endpoint: str) -> None:
+        """Excludes the (Flask) endpoint from the authorization checks. The
+        endpoint is then responsible for its own access control, if any."""
+        self._public_endpoints.add(endpoint)
+
+    def is_public_request(self, request: Optional[flask.Request] = None) -> bool:
+        """Returns True if the request is for an endpoint added with
+        `add_public_endpoint()`."""
+        request = request or flask.request
+        return request.endpoint in self._public_endpoints
+
+    def authorize(self, expiry: float) -> None:
+        """Marks the current request as having passed the full authorization
+        check, valid until the given expiry (POSIX timestamp)."""
+        flask.g.webviz_static_auth_expiry = int(
+            min(expiry, time.time() + self._max_age)
+        )
+
+    @staticmethod
+    def timed(check: Callable[[], Any]) -> Callable[[], Any]:
+        """Wraps an authorization check (a before request function), such that
+        its duration is reported in the `Server-Timing` response header."""
+
+        @functools.wraps(check)
+        def timed_check() -> Any:
+            start = time.perf_counter()
+            try:
+                return check()
+            finally:
+                flask.g.webviz_auth_duration = (
+                    flask.g.get("webviz_auth_duration", 0) + time.perf_counter() - start
+                )
+
+        return timed_check
+
+    def _check(self, request: flask.Request) -> bool:
+        if not request.path.startswith(STATIC_ROUTES):
+            return False
+
+        cookie = request.cookies.get(StaticRequestAuth.COOKIE_NAME)
+        if cookie is None:
+            return False
+
+        expiry = self._verified_cookies.get(cookie)
+        if expiry is None:
+            try:
+                expiry = int(self._get_signer().unsign(cookie))
+            except (BadSignature, ValueError):
+                return False
+            if len(self._verified_cookies) >= VERIFIED_COOKIES_MAX_SIZE:
+                self._verified_cookies.clear()
+            self._verified_cookies[cookie] = expiry
+
+        return time.time() < expiry
+
+    def _after_request(self, response: flask.Response) -> flask.Response:
+        duration: Optional[float] = flask.g.get("webviz_auth_duration")
+        if duration is not None:
+            response.headers.add("Server-Timing", f"auth;dur={1000 * duration:.3f}")
+
+        expiry: Optional[int] = flask.g.get("webviz_static_auth_expiry")
+        if expiry is not None:
+            cookie = self._get_signer().sign(str(expiry)).decode()
+            if flask.request.cookies.get(StaticRequestAuth.COOKIE_NAME) != cookie:
+                response.set_cookie(
+                    StaticRequestAuth.COOKIE_NAME,
+                    cookie,
+                    max_age=max(0, expiry - int(time.time())),
+                    secure=flask.request.is_secure,
+                    httponly=True,
+                    samesite="Lax",
+                )
+
+        return response
+
+    def _get_signer(self) -> Signer:
+        if self._signer is None:
+            self._signer = Signer(
+                self._app.secret_key or self._fallback_secret,
+                salt="webviz-static-auth",
+            )
+        return self._signer
+
+
+class _StaticSkippingSessionInterface(SecureCookieSessionInterface):
+    """Session interface giving authorized static requests an empty session,
+    instead of deserializing the session cookie."""
+
+    def __init__(self, static_auth: StaticRequestAuth) -> None:
+        self._static_auth = static_auth
+
+    def open_session(
+        self, app: flask.Flask, request: flask.Request
+    ) -> Optional[SessionMixin]:
+        if self._static_auth.is_authorized_static_request(request):
+            return self.session_class()
+        return super().open_session(app, request)
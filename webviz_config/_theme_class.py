@@ -1,5 +1,30 @@
 import copy
+import hashlib
 import json
+import weakref
+from typing import Any, Dict, Optional
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from ._frozen import freeze, thaw
+
+# Maximum number of themed layouts memoized per theme
+THEMED_LAYOUTS_MAX_SIZE = 256
+
+
+class _ThemeCache:  # pylint: disable=too-few-public-methods
+    """Values computed from the plotly theme of a theme, kept outside of the
+    theme object itself in order to not be part of its (JSON) state."""
+
+    def __init__(self) -> None:
+        self.themed_layouts: Dict[str, dict] = {}
+        self.plotly_template: Optional[str] = None
+
+
+_THEME_CACHES: "weakref.WeakKeyDictionary[WebvizConfigTheme, _ThemeCache]" = (
+    weakref.WeakKeyDictionary()
+)
 
 
 class WebvizConfigTheme:
@@ -60,6 +85,29 @@ class WebvizConfigTheme:
     def from_json(self, json_string: str) -> None:
         for key, value in json.loads(json_string).items():
             setattr(self, key, value)
+        _THEME_CACHES.pop(self, None)
+
+    def _cache(self) -> _ThemeCache:
+        try:
+            return _THEME_CACHES[self]
+        except KeyError:
+            return _THEME_CACHES.setdefault(self, _ThemeCache())
+
+    def copy(self) -> "WebvizConfigTheme":
+        """Returns a mutable deep copy of the theme."""
+        theme = WebvizConfigTheme.__new__(WebvizConfigTheme)
+        for key, value in vars(self).items():
+            object.__setattr__(theme, key, thaw(value))
+        return theme
+
+    def frozen(self) -> "WebvizConfigTheme":
+        """Returns a read-only deep copy of the theme. Use `copy()` on the
+        returned theme to get a mutable copy of it.
+        """
+        theme = _FrozenWebvizConfigTheme.__new__(_FrozenWebvizConfigTheme)
+        for key, value in vars(self).items():
+            object.__setattr__(theme, key, freeze(value))
+        return theme
 
     def adjust_csp(self, dictionary: dict, append: bool = True) -> None:
         """If the default CSP settings needs to be changed, this function can
@@ -84,7 +132,25 @@ class WebvizConfigTheme:
         and tertiary xaxis), the axis will get the theme xaxis/yaxis layout, unless they are
         defined themselves as e.g. xaxis2 in the theme layout. Note that e.g. xaxis2 still needs to
         be in the input layout, just not in the theme layout.
+
+        Themed layouts are memoized, i.e. the theme layout is only merged once
+        with each distinct (JSON serializable) input layout.
         """
+        try:
+            key = json.dumps(layout)
+        except TypeError:
+            return self._merge_theme_layout(layout)
+
+        themed_layouts = self._cache().themed_layouts
+        themed_layout = themed_layouts.get(key)
+        if themed_layout is None:
+            themed_layout = freeze(self._merge_theme_layout(layout))
+            if len(themed_layouts) >= THEMED_LAYOUTS_MAX_SIZE:
+                themed_layouts.clear()
+            themed_layouts[key] = themed_layout
+        return thaw(themed_layout)
+
+    def _merge_theme_layout(self, layout: dict) -> dict:
         # pylint: disable=too-many-nested-blocks
         def deep_update(update: dict, ref: dict) -> dict:
             for key, value in ref.items():
@@ -122,10 +188,36 @@ class WebvizConfigTheme:
     def plotly_theme(self, plotly_theme: dict) -> None:
         """Layout object of Plotly graph objects."""
         self._plotly_theme = plotly_theme
+        _THEME_CACHES.pop(self, None)
 
     def plotly_theme_layout_update(self, plotly_theme_layout: dict) -> None:
         """Updates layout object of Plotly graph objects based on input dict"""
         self._plotly_theme["layout"] = self.create_themed_layout(plotly_theme_layout)
+        _THEME_CACHES.pop(self, None)
+
+    def register_plotly_template(self) -> str:
+        """Registers the plotly theme as a named template in `plotly.io.templates`,
+        and returns the template name. The name is derived from the content of
+        the plotly theme, such that the template is only created once for equal
+        themes (e.g. read-only copies of the theme).
+        """
+        cache = self._cache()
+        if cache.plotly_template is None:
+            digest = hashlib.sha1(
+                json.dumps(self._plotly_theme, sort_keys=True).encode()
+            ).hexdigest()[:10]
+            name = f"webviz_{self.theme_name}_{digest}"
+            if name not in pio.templates:
+                pio.templates[name] = go.layout.Template(thaw(self._plotly_theme))
+            cache.plotly_template = name
+        return cache.plotly_template
+
+    @property
+    def plotly_template(self) -> str:
+        """Name of the registered plotly template with the plotly theme, to be
+        given as `template` to plotly figures. Using the name, instead of the
+        plotly theme itself, avoids validating the theme for every figure."""
+        return self.register_plotly_template()
 
     @property
     def external_stylesheets(self) -> list:
@@ -150,3 +242,26 @@ class WebvizConfigTheme:
         assets.
         """
         self._assets = assets
+
+
+class _FrozenWebvizConfigTheme(WebvizConfigTheme):
+    """Read-only theme, as returned by `WebvizConfigTheme.frozen()`."""
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(
+            "Theme is read-only. Use copy() to get a mutable copy of the theme."
+        )
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(
+            "Theme is read-only. Use copy() to get a mutable copy of the theme."
+        )
+
+    def __copy__(self) -> WebvizConfigTheme:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> WebvizConfigTheme:
+        return self.copy()
+
+    def frozen(self) -> WebvizConfigTheme:
+        return self
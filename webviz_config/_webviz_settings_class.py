@@ -1,12 +1,15 @@
-import copy
 from typing import Dict, Any, Mapping
 
 from ._theme_class import WebvizConfigTheme
+from ._frozen import freeze
 
 
 class WebvizSettings:
     """This class contains global Webviz settings that will be made available
     to all plugins through the special argument named webviz_settings.
+
+    Both the shared settings and the theme are read-only snapshots, taken when
+    the object is created. Call `copy()` on them to get a mutable copy.
     """
 
     def __init__(self, shared_settings: Dict[str, Any], theme: WebvizConfigTheme):
@@ -16,13 +19,13 @@ class WebvizSettings:
         if not isinstance(theme, WebvizConfigTheme):
             raise TypeError("theme must be of type WebvizConfigTheme")
 
-        self._shared_settings = shared_settings
-        self._theme = theme
+        self._shared_settings = freeze(shared_settings)
+        self._theme = theme.frozen()
 
     @property
     def shared_settings(self) -> Mapping[str, Any]:
-        return copy.deepcopy(self._shared_settings)
+        return self._shared_settings
 
     @property
     def theme(self) -> WebvizConfigTheme:
-        return copy.deepcopy(self._theme)
+        return self._theme
@@ -3,7 +3,7 @@ import getpass
 import datetime
 import pathlib
 import argparse
-from typing import Dict, Tuple
+from typing import Dict, Set, Tuple
 
 import yaml
 import jinja2
@@ -16,9 +16,10 @@ def write_script(
     build_directory: pathlib.Path,
     template_filename: str,
     output_filename: str,
-) -> Tuple[set, Dict[str, dict]]:
+) -> Tuple[set, Dict[str, dict], Set[pathlib.Path]]:
     """Writes rendered script to build directory. Also returns information regarding
-    assets and which plugins that are incluced in the user provided configuration file.
+    assets, which plugins that are incluced in the user provided configuration file,
+    and which paths the plugins are given as arguments.
     """
 
     config_parser = ConfigParser(args.yaml_file)
@@ -53,4 +54,8 @@ def write_script(
 
     (build_directory / output_filename).write_text(template.render(configuration))
 
-    return config_parser.assets, config_parser.plugin_metadata
+    return (
+        config_parser.assets,
+        config_parser.plugin_metadata,
+        config_parser.referenced_paths,
+    )
@@ -250,6 +250,92 @@ def main() -> None:  # pylint: disable=too-many-locals,too-many-statements
 
     parser_schema.set_defaults(func=parser_schema_function)
 
+    # Add "loadtest" parser:
+
+    parser_loadtest = subparsers.add_parser(
+        "loadtest",
+        help="Load test a Webviz application, by running it with gunicorn "
+        "and simulating concurrent users",
+    )
+
+    parser_loadtest.add_argument(
+        "yaml_file", type=pathlib.Path, help="Path to YAML configuration file"
+    )
+    parser_loadtest.add_argument(
+        "--theme",
+        type=str,
+        default=get_user_preference("theme")
+        if get_user_preference("theme") is not None
+        else "default",
+        help="Which installed theme to use.",
+    )
+    parser_loadtest.add_argument(
+        "--users",
+        type=int,
+        default=10,
+        help="Number of concurrent simulated users.",
+    )
+    parser_loadtest.add_argument(
+        "--duration",
+        type=float,
+        default=60,
+        help="Duration of the load test in seconds.",
+    )
+    parser_loadtest.add_argument(
+        "--ramp-up",
+        type=float,
+        default=10,
+        help="Seconds until all users have started (users are started evenly "
+        "spread out in this period).",
+    )
+    parser_loadtest.add_argument(
+        "--think-time",
+        type=float,
+        default=1,
+        help="Average number of seconds a user waits between interactions.",
+    )
+    parser_loadtest.add_argument(
+        "--interactions",
+        type=int,
+        default=3,
+        help="Number of interactions (e.g. changing a dropdown value) "
+        "a user does on each page before navigating to another page.",
+    )
+    parser_loadtest.add_argument(
+        "--workers",
+        type=int,
+        default=2,
+        help="Number of gunicorn worker processes.",
+    )
+    parser_loadtest.add_argument(
+        "--threads",
+        type=int,
+        default=2,
+        help="Number of threads per gunicorn worker process.",
+    )
+    parser_loadtest.add_argument(
+        "--startup-timeout",
+        type=float,
+        default=600,
+        help="Maximum number of seconds to wait for the application to start.",
+    )
+    parser_loadtest.add_argument(
+        "--output",
+        type=pathlib.Path,
+        default=None,
+        help="Write the full report (including memory usage over time) "
+        "to this JSON file.",
+    )
+
+    def parser_loadtest_function(args: argparse.Namespace) -> None:
+        from ._loadtest import (  # pylint: disable=import-outside-toplevel
+            main_loadtest,
+        )
+
+        main_loadtest(args)
+
+    parser_loadtest.set_defaults(func=parser_loadtest_function)
+
     # Add "editor" parser:
 
     parser_editor = subparsers.add_parser(
@@ -1,7 +1,10 @@
 import warnings
+from typing import Any, Callable
 
 import flask_caching
 
+from .webviz_tracing import WEBVIZ_TRACING
+
 
 class Cache(flask_caching.Cache):
     def __init__(
@@ -21,5 +24,8 @@ class Cache(flask_caching.Cache):
         )
         return 3600
 
+    def memoize(self, *args: Any, **kwargs: Any) -> Callable:
+        return WEBVIZ_TRACING.traced_memoize(super().memoize(*args, **kwargs))
+
 
 CACHE = Cache()
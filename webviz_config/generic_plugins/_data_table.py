@@ -1,15 +1,15 @@
-import base64
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
-from dash import dash_table, Dash
+from dash import dash_table, html, Dash, Input, Output
 
-from .. import WebvizPluginABC, EncodedFile
-from ..webviz_store import webvizstore
-from ..common_cache import CACHE
+from .. import WebvizPluginABC, WebvizSettings
+from ..webviz_datasets import WEBVIZ_DATASETS
 
 
+# pylint: disable=too-many-arguments
 class DataTable(WebvizPluginABC):
     """Adds a table to the webviz instance, using tabular data from a provided csv file.
 If feature is requested, the data could also come from a database.
@@ -24,6 +24,18 @@ If feature is requested, the data could also come from a database.
                individual columns.
 * **`pagination`:** If `True`, only a subset of the table is displayed at once. \
                 Different subsets can be viewed from 'previous/next' buttons
+* **`server_side`:** If `True`, pagination, sorting and filtering is done on the \
+                 server, and only the rows on the current page are sent to the browser. \
+                 Recommended for large tables. Pagination is always enabled in this mode.
+* **`page_size`:** Number of rows shown on each page when pagination is enabled. \
+                 When `server_side` is `True`, at most 1000 rows are sent per page.
+* **`csv_options`:** Options used when reading the csv file, on top of the defaults \
+                 given under `csv_options` in `shared_settings`. Either keyword \
+                 arguments to `pandas.read_csv` (e.g. `dtype`, `usecols` or \
+                 `engine: pyarrow` for multithreaded parsing), \
+                 `categorical_max_cardinality` (convert string columns with at most \
+                 this many unique values to categoricals) or `arrow_strings` \
+                 (store string columns as Arrow backed strings).
 """
 
     def __init__(
@@ -33,48 +45,314 @@ If feature is requested, the data could also come from a database.
         sorting: bool = True,
         filtering: bool = True,
         pagination: bool = True,
+        server_side: bool = False,
+        page_size: int = 250,
+        csv_options: Optional[dict] = None,
+        webviz_settings: Optional[WebvizSettings] = None,
     ):
 
         super().__init__()
 
         self.csv_file = csv_file
-        self.df = get_data(self.csv_file)
+        self.csv_options = WEBVIZ_DATASETS.options(
+            webviz_settings.shared_settings if webviz_settings else None, csv_options
+        )
+        self.df = get_data(self.csv_file, **self.csv_options)
         self.sorting = sorting
         self.filtering = filtering
         self.pagination = pagination
+        self.server_side = server_side
+        self.page_size = page_size
+
+        # Row order for each (column, ascending) combination, computed on first use
+        self._sorted_indexes: Dict[Tuple[str, bool], np.ndarray] = {}
 
         self.set_callbacks(app)
 
     def add_webvizstore(self) -> List[tuple]:
-        return [(get_data, [{"csv_file": self.csv_file}])]
+        return [
+            WEBVIZ_DATASETS.webvizstore_arguments(self.csv_file, **self.csv_options)
+        ]
 
     @property
-    def layout(self) -> dash_table.DataTable:
+    def layout(self) -> Union[html.Div, dash_table.DataTable]:
+        if self.server_side:
+            return html.Div(
+                [
+                    dash_table.DataTable(
+                        id=self.uuid("table"),
+                        columns=[{"name": i, "id": i} for i in self.df.columns],
+                        data=[],
+                        sort_action="custom" if self.sorting else "none",
+                        sort_mode="single",
+                        sort_by=[],
+                        filter_action="custom" if self.filtering else "none",
+                        filter_query="",
+                        page_action="custom",
+                        page_current=0,
+                        page_size=self.page_size,
+                    ),
+                    html.Div(id=self.uuid("filter-message")),
+                ]
+            )
+
         return dash_table.DataTable(
             columns=[{"name": i, "id": i} for i in self.df.columns],
             data=self.df.to_dict("records"),
             sort_action="native" if self.sorting else "none",
             filter_action="native" if self.filtering else "none",
             page_action="native" if self.pagination else "none",
+            page_size=self.page_size,
         )
 
+    def sorted_index(self, column: str, ascending: bool) -> np.ndarray:
+        """Returns the row positions of the table sorted by the given column.
+        The result is cached, such that paging through a sorted table does not
+        require sorting the table again.
+        """
+        key = (column, ascending)
+        if key not in self._sorted_indexes:
+            self._sorted_indexes[key] = (
+                self.df[column]
+                .reset_index(drop=True)
+                .sort_values(ascending=ascending, kind="stable", na_position="last")
+                .index.to_numpy()
+            )
+        return self._sorted_indexes[key]
+
+    def query(
+        self, page_current: int, page_size: int, sort_by: List[dict], filter_query: str
+    ) -> Tuple[pd.DataFrame, int]:
+        """Filters and sorts the table, and returns the rows on the requested page
+        together with the total number of pages. The page size is limited to
+        `MAX_PAGE_SIZE`.
+        """
+        mask = filter_mask(self.df, filter_query) if filter_query else None
+
+        if sort_by:
+            positions = self.sorted_index(
+                sort_by[0]["column_id"], sort_by[0]["direction"] == "asc"
+            )
+            if mask is not None:
+                positions = positions[mask[positions]]
+        elif mask is not None:
+            positions = np.flatnonzero(mask)
+        else:
+            positions = np.arange(len(self.df))
+
+        page_current = max(page_current, 0)
+        page_size = min(max(page_size, 1), MAX_PAGE_SIZE)
+        start = page_current * page_size
+        page_count = max(1, -(-len(positions) // page_size))
+        return self.df.iloc[positions[start : start + page_size]], page_count
+
     def set_callbacks(self, app: Dash) -> None:
-        @app.callback(self.plugin_data_output, self.plugin_data_requested)
-        def _user_download_data(data_requested: Optional[int]) -> Optional[EncodedFile]:
-            return (
-                {
-                    "filename": "data-table.csv",
-                    "content": base64.b64encode(
-                        get_data(self.csv_file).to_csv(index=False).encode()
-                    ).decode("ascii"),
-                    "mime_type": "text/csv",
-                }
-                if data_requested
-                else None
+        if self.server_side:
+
+            @app.callback(
+                Output(self.uuid("table"), "data"),
+                Output(self.uuid("table"), "page_count"),
+                Output(self.uuid("filter-message"), "children"),
+                Input(self.uuid("table"), "page_current"),
+                Input(self.uuid("table"), "page_size"),
+                Input(self.uuid("table"), "sort_by"),
+                Input(self.uuid("table"), "filter_query"),
             )
+            def _update_table(
+                page_current: Optional[int],
+                page_size: Optional[int],
+                sort_by: Optional[List[dict]],
+                filter_query: Optional[str],
+            ) -> Tuple[List[dict], int, str]:
+                try:
+                    page, page_count = self.query(
+                        page_current or 0,
+                        page_size or self.page_size,
+                        sort_by or [],
+                        filter_query or "",
+                    )
+                except ValueError as exc:
+                    return [], 1, f"Invalid filter: {exc}"
+                return page.to_dict("records"), page_count, ""
+
+        self.set_download_provider(
+            lambda: get_data(self.csv_file, **self.csv_options),
+            filename="data-table.csv",
+            compress=True,
+        )
+
+
+def get_data(csv_file: Path, **csv_options: Any) -> pd.DataFrame:
+    return WEBVIZ_DATASETS.get(csv_file, **csv_options)
+
+
+# Maximum number of rows sent per page in server side mode, as the page size
+# is given by the browser
+MAX_PAGE_SIZE = 1000
+
+# Dash DataTable relational filter operators, and their pandas equivalents.
+# All of them can be prefixed with "i" (case insensitive) or "s" (case sensitive).
+RELATIONAL_OPERATORS = {
+    "=": "eq",
+    "eq": "eq",
+    "!=": "ne",
+    "ne": "ne",
+    "<": "lt",
+    "lt": "lt",
+    "<=": "le",
+    "le": "le",
+    ">": "gt",
+    "gt": "gt",
+    ">=": "ge",
+    "ge": "ge",
+    "contains": "contains",
+    "datestartswith": "datestartswith",
+}
+
+# Dash DataTable unary filter operators supported on the server
+UNARY_OPERATORS = (
+    "is blank",
+    "is nil",
+    "is num",
+    "is str",
+    "is bool",
+    "is even",
+    "is odd",
+)
+
+
+def split_filter_query(filter_query: str) -> List[str]:
+    """Splits a Dash DataTable filter query into its parts joined by `&&`,
+    ignoring `&&` within quoted values and column names."""
+    parts = []
+    start = 0
+    closing = ""
+    escaped = False
+    for position, character in enumerate(filter_query):
+        if escaped:
+            escaped = False
+        elif closing:
+            if character == "\\" and closing != "}":
+                escaped = True
+            elif character == closing:
+                closing = ""
+        elif character in ("'", '"', "`"):
+            closing = character
+        elif character == "{":
+            closing = "}"
+        elif filter_query.startswith(" && ", position):
+            parts.append(filter_query[start:position])
+            start = position + len(" && ")
+    parts.append(filter_query[start:])
+    return parts
+
+
+def split_filter_part(filter_part: str) -> Tuple[str, str, object, bool]:
+    """Splits one part of a Dash DataTable filter query, e.g. `{column} >= 5`,
+    into column name, operator (as in `RELATIONAL_OPERATORS` values or
+    `UNARY_OPERATORS`), value and whether the comparison is case insensitive.
+    Raises ValueError if the filter part is not supported.
+    """
+    filter_part = filter_part.strip()
+    if not filter_part.startswith("{") or "}" not in filter_part:
+        raise ValueError(f"Unsupported filter expression: {filter_part}")
+    column, _, expression = filter_part[1:].partition("}")
+    expression = expression.strip()
+
+    if expression in UNARY_OPERATORS:
+        return column, expression, None, False
+    if expression.startswith("is "):
+        raise ValueError(f"Unsupported filter operator: {expression}")
+
+    operator, _, value_part = expression.partition(" ")
+    case_insensitive = False
+    if operator not in RELATIONAL_OPERATORS and operator[1:] in RELATIONAL_OPERATORS:
+        case_insensitive = operator[0] == "i"
+        if operator[0] not in ("i", "s"):
+            raise ValueError(f"Unsupported filter operator: {operator}")
+        operator = operator[1:]
+    if operator not in RELATIONAL_OPERATORS:
+        raise ValueError(f"Unsupported filter operator: {operator}")
+
+    value_part = value_part.strip()
+    if len(value_part) > 1 and value_part[0] == value_part[-1] in ("'", '"', "`"):
+        value: object = value_part[1:-1].replace("\\" + value_part[0], value_part[0])
+    elif len(value_part.split()) > 1:
+        # Unquoted values can not contain spaces, this is e.g. `||`
+        raise ValueError(f"Unsupported filter expression: {filter_part}")
+    else:
+        try:
+            value = float(value_part)
+        except ValueError:
+            value = value_part
+
+    return column, RELATIONAL_OPERATORS[operator], value, case_insensitive
+
+
+def filter_mask(dframe: pd.DataFrame, filter_query: str) -> np.ndarray:
+    """Evaluates a Dash DataTable filter query as a vectorized boolean mask
+    over the rows of the dataframe. Raises ValueError if the query uses
+    operators which are not supported (e.g. `||` or `!`).
+    """
+    mask = np.ones(len(dframe), dtype=bool)
+    for filter_part in split_filter_query(filter_query):
+        column, operator, value, case_insensitive = split_filter_part(filter_part)
+        if column not in dframe.columns:
+            raise ValueError(f"Unknown column in filter: {column}")
+
+        series = dframe[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Unordered categoricals do not support ordering comparisons
+            series = series.astype(series.cat.categories.dtype)
+        numeric = pd.api.types.is_numeric_dtype(series) and not (
+            pd.api.types.is_bool_dtype(series)
+        )
+
+        if operator in UNARY_OPERATORS:
+            part_mask = _unary_filter_mask(series, operator)
+        elif operator in ("eq", "ne", "lt", "le", "gt", "ge") and numeric:
+            # Values not being numbers (e.g. `{column} > abc`) match no rows,
+            # except for `!=`
+            part_mask = getattr(series, operator)(
+                pd.to_numeric(pd.Series([value]), errors="coerce")[0]
+            )
+        else:
+            strings = series.astype("string")
+            # Numbers in the filter are compared with text as typed, e.g. 1 as "1"
+            value = (
+                str(value).removesuffix(".0")
+                if isinstance(value, float)
+                else str(value)
+            )
+            if case_insensitive:
+                strings = strings.str.lower()
+                value = value.lower()
+            if operator == "contains":
+                part_mask = strings.str.contains(value, regex=False)
+            elif operator == "datestartswith":
+                part_mask = strings.str.startswith(value)
+            else:
+                part_mask = getattr(strings, operator)(value)
+
+        mask &= part_mask.fillna(False).to_numpy(dtype=bool)
+
+    return mask
+
 
+def _unary_filter_mask(series: pd.Series, operator: str) -> pd.Series:
+    if operator == "is blank":
+        return series.isna() | series.astype("string").str.strip().eq("")
+    if operator == "is nil":
+        return series.isna()
+    if operator in ("is even", "is odd"):
+        remainder = pd.to_numeric(series, errors="coerce") % 2
+        return remainder.eq(0 if operator == "is even" else 1)
 
-@CACHE.memoize()
-@webvizstore
-def get_data(csv_file: Path) -> pd.DataFrame:
-    return pd.read_csv(csv_file)
+    value_type = {"is num": (int, float, np.number), "is str": str, "is bool": bool}[
+        operator
+    ]
+    return series.map(
+        lambda element: isinstance(element, value_type)
+        and not (operator == "is num" and isinstance(element, bool))
+        and not (operator == "is num" and pd.isna(element))
+    )
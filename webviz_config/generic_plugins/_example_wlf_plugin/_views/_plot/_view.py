@@ -182,6 +182,8 @@ class PlotViewElement(ViewElementABC):
 
 
 class PlotView(ViewABC):
+    STATIC_LAYOUT = True
+
     class Ids(StrEnum):
         TEXT = "text"
         PLOT = "plot"
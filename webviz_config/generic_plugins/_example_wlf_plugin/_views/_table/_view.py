@@ -132,6 +132,8 @@ class TableViewSettingsGroup(SettingsGroupABC):
 
 
 class TableView(ViewABC):
+    STATIC_LAYOUT = True
+
     class Ids(StrEnum):
         TEXT = "text"
         TABLE = "table"
@@ -1,14 +1,43 @@
-import base64
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, Optional, Tuple, Union
 
 import pandas as pd
-from dash import Dash
+from dash import dash_table, html, Dash, Input, Output, State
 import dash_pivottable
+import webviz_core_components as wcc
 
-from .. import WebvizPluginABC, EncodedFile
-from ..webviz_store import webvizstore
+from .. import WebvizPluginABC, WebvizSettings
+from ..webviz_datasets import WEBVIZ_DATASETS
 from ..common_cache import CACHE
+from ..utils import dataset_profile
+
+# Aggregators (as named in dash-pivottable) supported when pivoting server side,
+# and the corresponding pandas aggregation function
+AGGREGATORS = {
+    "Count": "size",
+    "Count Unique Values": "nunique",
+    "Sum": "sum",
+    "Average": "mean",
+    "Median": "median",
+    "Sample Variance": "var",
+    "Sample Standard Deviation": "std",
+    "Minimum": "min",
+    "Maximum": "max",
+    "First": "first",
+    "Last": "last",
+}
+
+# Aggregators only meaningful for numeric values
+NUMERIC_AGGREGATORS = {
+    "Sum",
+    "Average",
+    "Median",
+    "Sample Variance",
+    "Sample Standard Deviation",
+}
+
+# Tables with more cells than this are by default pivoted server side
+CLIENT_SIDE_MAX_CELLS = 100000
 
 
 class PivotTable(WebvizPluginABC):
@@ -21,37 +50,189 @@ class PivotTable(WebvizPluginABC):
                   path or relative to the configuration file.
 * **`options`:** Additional options for the plot. See [dash-pivottable documentation]\
     (https://github.com/plotly/dash-pivottable#references) for all possible options.
+* **`server_side`:** If `True`, the pivot table is computed on the server, and only \
+    the aggregated result is sent to the browser. If `False`, the whole table is sent \
+    to the browser and pivoted there. If not given, the pivot table is computed on the \
+    server if the table has more than 100 000 cells.
+* **`csv_options`:** Options used when reading the csv file, on top of the defaults \
+    given under `csv_options` in `shared_settings`. See the `DataTable` plugin.
+
+---
+
+When pivoting server side, the options `rows`, `cols`, `vals` and `aggregatorName` \
+are used as initial selection. Supported aggregators are then \
+`Count`, `Count Unique Values`, `Sum`, `Average`, `Median`, `Sample Variance`, \
+`Sample Standard Deviation`, `Minimum`, `Maximum`, `First` and `Last`. \
+`Sum`, `Average`, `Median` and the sample variance/standard deviation can only be \
+used with numeric values.
 """
 
-    def __init__(self, app: Dash, csv_file: Path, options: dict = None):
+    def __init__(
+        self,
+        app: Dash,
+        csv_file: Path,
+        options: dict = None,
+        server_side: Optional[bool] = None,
+        csv_options: Optional[dict] = None,
+        webviz_settings: Optional[WebvizSettings] = None,
+    ):
 
         super().__init__()
 
         self.csv_file = csv_file
+        self.csv_options = WEBVIZ_DATASETS.options(
+            webviz_settings.shared_settings if webviz_settings else None, csv_options
+        )
         self.options = options if options is not None else {}
 
+        self.profile = dataset_profile(
+            WEBVIZ_DATASETS.key(self.csv_file, **self.csv_options),
+            get_data(self.csv_file, **self.csv_options),
+        )
+        self.server_side = (
+            server_side
+            if server_side is not None
+            else self.profile.size > CLIENT_SIDE_MAX_CELLS
+        )
+
+        if self.server_side:
+            aggregator = self.options.get("aggregatorName", "Count")
+            if aggregator not in AGGREGATORS:
+                raise ValueError(
+                    f"Aggregator '{aggregator}' is not supported when pivoting server "
+                    f"side. Supported aggregators are {list(AGGREGATORS)}."
+                )
+
         self.set_callbacks(app)
 
     def add_webvizstore(self) -> List[tuple]:
-        return [(get_data, [{"csv_file": self.csv_file}])]
+        return [
+            WEBVIZ_DATASETS.webvizstore_arguments(self.csv_file, **self.csv_options)
+        ]
 
     @property
-    def layout(self) -> dash_pivottable.PivotTable:
-        return generate_table(get_data(self.csv_file), **self.options)
+    def layout(self) -> Union[wcc.FlexBox, dash_pivottable.PivotTable]:
+        if not self.server_side:
+            return generate_table(
+                get_data(self.csv_file, **self.csv_options), **self.options
+            )
+
+        columns = self.profile.columns
+        aggregator = self.options.get("aggregatorName", "Count")
+        vals = self.options.get("vals", [])
+
+        return wcc.FlexBox(
+            children=[
+                wcc.Frame(
+                    style={"flex": 1},
+                    children=[
+                        wcc.Dropdown(
+                            label="Rows",
+                            id=self.uuid("rows"),
+                            options=[{"label": i, "value": i} for i in columns],
+                            value=self.options.get("rows", []),
+                            multi=True,
+                        ),
+                        wcc.Dropdown(
+                            label="Columns",
+                            id=self.uuid("cols"),
+                            options=[{"label": i, "value": i} for i in columns],
+                            value=self.options.get("cols", []),
+                            multi=True,
+                        ),
+                        wcc.Dropdown(
+                            label="Aggregator",
+                            id=self.uuid("aggregator"),
+                            options=[{"label": i, "value": i} for i in AGGREGATORS],
+                            value=aggregator,
+                            clearable=False,
+                        ),
+                        wcc.Dropdown(
+                            label="Value",
+                            id=self.uuid("vals"),
+                            options=[
+                                {"label": i, "value": i}
+                                for i in self.value_columns(aggregator)
+                            ],
+                            value=vals[0] if vals else None,
+                        ),
+                    ],
+                ),
+                wcc.Frame(
+                    style={"flex": 4},
+                    children=[
+                        html.Div(id=self.uuid("message")),
+                        dash_table.DataTable(
+                            id=self.uuid("table"),
+                            sort_action="native",
+                            page_size=100,
+                            style_table={"overflowX": "auto"},
+                        ),
+                    ],
+                ),
+            ]
+        )
+
+    def value_columns(self, aggregator: str) -> List[str]:
+        """Columns which can be aggregated with the given aggregator."""
+        if aggregator in NUMERIC_AGGREGATORS:
+            return list(self.profile.numeric_columns)
+        return list(self.profile.columns)
 
     def set_callbacks(self, app: Dash) -> None:
-        @app.callback(self.plugin_data_output, self.plugin_data_requested)
-        def _user_download_data(data_requested: Optional[int]) -> Optional[EncodedFile]:
+        self.set_download_provider(
+            lambda: get_data(self.csv_file, **self.csv_options),
+            filename="pivot-table.csv",
+            compress=True,
+        )
+
+        if not self.server_side:
+            return
+
+        @app.callback(
+            Output(self.uuid("vals"), "options"),
+            Output(self.uuid("vals"), "value"),
+            Input(self.uuid("aggregator"), "value"),
+            State(self.uuid("vals"), "value"),
+        )
+        def _update_value_options(
+            aggregator: str, val: Optional[str]
+        ) -> Tuple[List[dict], Optional[str]]:
+            value_columns = self.value_columns(aggregator)
+            return [{"label": i, "value": i} for i in value_columns], (
+                val if val in value_columns else None
+            )
+
+        @app.callback(
+            Output(self.uuid("table"), "data"),
+            Output(self.uuid("table"), "columns"),
+            Output(self.uuid("message"), "children"),
+            Input(self.uuid("rows"), "value"),
+            Input(self.uuid("cols"), "value"),
+            Input(self.uuid("aggregator"), "value"),
+            Input(self.uuid("vals"), "value"),
+        )
+        def _update_table(
+            rows: Optional[List[str]],
+            cols: Optional[List[str]],
+            aggregator: str,
+            val: Optional[str],
+        ) -> Tuple[List[dict], List[dict], str]:
+            try:
+                table = get_pivot(
+                    self.csv_file,
+                    tuple(sorted(self.csv_options.items())),
+                    tuple(rows or []),
+                    tuple(cols or []),
+                    aggregator,
+                    val,
+                )
+            except ValueError as exc:
+                return [], [], str(exc)
             return (
-                {
-                    "filename": "pivot-table.csv",
-                    "content": base64.b64encode(
-                        get_data(self.csv_file).to_csv(index=False).encode()
-                    ).decode("ascii"),
-                    "mime_type": "text/csv",
-                }
-                if data_requested
-                else None
+                table.to_dict("records"),
+                [{"name": column, "id": column} for column in table.columns],
+                "",
             )
 
 
@@ -61,7 +242,83 @@ def generate_table(dframe: pd.DataFrame, **options: str) -> dash_pivottable.Pivo
     )
 
 
+def pivot_dataframe(
+    dframe: pd.DataFrame,
+    rows: List[str],
+    cols: List[str],
+    aggregator: str,
+    val: Optional[str] = None,
+) -> pd.DataFrame:
+    """Vectorized equivalent of the pivot table computed by dash-pivottable.
+    The returned dataframe has one column per row attribute, followed by one
+    column per unique combination of the column attributes (joined with ' | ').
+    Raises ValueError for unknown columns and unsupported aggregators.
+    """
+    if aggregator not in AGGREGATORS:
+        raise ValueError(
+            f"Aggregator '{aggregator}' is not supported when pivoting server side. "
+            f"Supported aggregators are {list(AGGREGATORS)}."
+        )
+    unknown = [
+        column
+        for column in rows + cols + ([] if val is None else [val])
+        if column not in dframe.columns
+    ]
+    if unknown:
+        raise ValueError(f"Unknown columns {unknown} in the pivot table selection.")
+    if val is None and aggregator != "Count":
+        return pd.DataFrame()
+    if (
+        val is not None
+        and aggregator in NUMERIC_AGGREGATORS
+        and not pd.api.types.is_numeric_dtype(dframe[val])
+    ):
+        raise ValueError(
+            f"Aggregator '{aggregator}' can only be used with numeric values, "
+            f"and '{val}' is not numeric."
+        )
+
+    function = AGGREGATORS[aggregator]
+    keys = rows + [col for col in cols if col not in rows]
+
+    if not keys:
+        return pd.DataFrame(
+            {aggregator: [len(dframe) if val is None else dframe[val].agg(function)]}
+        )
+
+    grouped = dframe.groupby(keys, sort=True, observed=True)
+    series = grouped.size() if function == "size" else grouped[val].agg(function)
+
+    if not rows:
+        table = series.to_frame().T
+    elif len(keys) > len(rows):
+        table = series.unstack(keys[len(rows) :])
+    else:
+        table = series.to_frame(aggregator)
+
+    table.columns = [
+        " | ".join(str(value) for value in column)
+        if isinstance(column, tuple)
+        else str(column)
+        for column in table.columns.to_flat_index()
+    ]
+
+    return table.reset_index() if rows else table.reset_index(drop=True)
+
+
 @CACHE.memoize()
-@webvizstore
-def get_data(csv_file: Path) -> pd.DataFrame:
-    return pd.read_csv(csv_file)
+def get_pivot(
+    csv_file: Path,
+    csv_options: tuple,
+    rows: Tuple[str, ...],
+    cols: Tuple[str, ...],
+    aggregator: str,
+    val: Optional[str],
+) -> pd.DataFrame:
+    return pivot_dataframe(
+        get_data(csv_file, **dict(csv_options)), list(rows), list(cols), aggregator, val
+    )
+
+
+def get_data(csv_file: Path, **csv_options: Any) -> pd.DataFrame:
+    return WEBVIZ_DATASETS.get(csv_file, **csv_options)
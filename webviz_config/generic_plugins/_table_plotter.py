@@ -1,8 +1,8 @@
-import base64
 import inspect
+import functools
 from pathlib import Path
 from collections import OrderedDict
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Tuple
 
 import numpy as np
 import pandas as pd
@@ -11,12 +11,33 @@ import plotly.express as px
 from dash import html, dcc, Input, Output, Dash
 import webviz_core_components as wcc
 
-from .. import WebvizPluginABC, WebvizSettings, EncodedFile
-from ..webviz_store import webvizstore
-from ..common_cache import CACHE
+from .. import WebvizPluginABC, WebvizSettings
+from ..webviz_datasets import WEBVIZ_DATASETS
+from ..utils import (
+    DataFrameFilter,
+    dataset_profile,
+    bin_points,
+    downsample_lines,
+    histogram_counts,
+    histogram2d_counts,
+    quantile_sketch,
+)
+from ..utils._downsampling import COUNT_COLUMN, POINTS_COLUMN
 
+# Plot types which are downsampled, and rendered with WebGL, when large
+DOWNSAMPLED_PLOT_TYPES = ["scatter", "line"]
 
-# pylint: disable=too-many-arguments
+# Number of points above which scatter and line plots are rendered with WebGL
+WEBGL_MIN_POINTS = 1000
+
+# Plot types which are aggregated on the server, when large
+AGGREGATED_PLOT_TYPES = ["histogram", "box", "violin", "density_contour"]
+
+# Number of bins (along each axis) used when aggregating histograms on the server
+HISTOGRAM_BINS = 100
+
+
+# pylint: disable=too-many-arguments, too-many-instance-attributes
 class TablePlotter(WebvizPluginABC):
     """Adds a plotter to the webviz instance, using tabular data from a provided csv file.
 If feature is requested, the data could also come from a database.
@@ -37,6 +58,16 @@ If feature is requested, the data could also come from a database.
                                     to not be read as a comment.
 * **`lock`:** If `True`, only the plot is shown, \
               all dropdowns for changing plot options are hidden.
+* **`max_points`:** Plots with more points than this are downsampled or aggregated \
+                    on the server before they are sent to the browser. \
+                    Lines are downsampled with the largest-triangle-three-buckets \
+                    algorithm, and scattered points are aggregated in a regular grid. \
+                    Histograms and density contours are binned, and box and violin \
+                    plots are computed from evenly spaced quantiles of each group. \
+                    Set to `0` to disable downsampling and aggregation.
+* **`csv_options`:** Options used when reading the csv file, on top of the defaults \
+                     given under `csv_options` in `shared_settings`. \
+                     See the `DataTable` plugin.
 """
 
     def __init__(
@@ -49,22 +80,30 @@ If feature is requested, the data could also come from a database.
         filter_defaults: dict = None,
         column_color_discrete_maps: dict = None,
         lock: bool = False,
+        max_points: int = 50000,
+        csv_options: Optional[dict] = None,
     ) -> None:
 
         super().__init__()
 
         self.plot_options = plot_options if plot_options else {}
         self.lock = lock
+        self.max_points = max_points
         self.csv_file = csv_file
-        self.data = get_data(self.csv_file)
-        self.set_filters(filter_cols)
-        self.columns = list(self.data.columns)
-        self.numeric_columns = list(
-            self.data.select_dtypes(include=[np.number]).columns
+        self.csv_options = WEBVIZ_DATASETS.options(
+            webviz_settings.shared_settings, csv_options
         )
+        self.data = get_data(self.csv_file, **self.csv_options)
+        self.profile = dataset_profile(
+            WEBVIZ_DATASETS.key(self.csv_file, **self.csv_options), self.data
+        )
+        self.set_filters(filter_cols)
+        self.data_filter = DataFrameFilter(self.data, self.filter_cols)
+        self.columns = self.profile.columns
+        self.numeric_columns = self.profile.numeric_columns
         self.filter_defaults = filter_defaults
         self.column_color_discrete_maps = column_color_discrete_maps
-        self.plotly_theme = webviz_settings.theme.plotly_theme
+        self.plotly_template = webviz_settings.theme.plotly_template
         self.set_callbacks(app)
 
     def set_filters(self, filter_cols: Optional[list]) -> None:
@@ -72,14 +111,16 @@ If feature is requested, the data could also come from a database.
         self.use_filter = False
         if filter_cols:
             for col in filter_cols:
-                if col in self.data.columns:
-                    if self.data[col].nunique() != 1:
+                if col in self.profile:
+                    if self.profile[col].cardinality != 1:
                         self.filter_cols.append(col)
             if self.filter_cols:
                 self.use_filter = True
 
     def add_webvizstore(self) -> List[tuple]:
-        return [(get_data, [{"csv_file": self.csv_file}])]
+        return [
+            WEBVIZ_DATASETS.webvizstore_arguments(self.csv_file, **self.csv_options)
+        ]
 
     @property
     def plots(self) -> dict:
@@ -107,7 +148,7 @@ If feature is requested, the data could also come from a database.
             "density_contour": ["x", "y", "color", "facet_col"],
         }
 
-    @property
+    @functools.cached_property
     def plot_args(self) -> dict:
         """A dict of possible plot options and their default values"""
         return OrderedDict(
@@ -208,13 +249,13 @@ If feature is requested, the data could also come from a database.
         """Makes dropdowns for each dataframe column used for filtering."""
         if not self.use_filter:
             return None
-        df = self.data
         dropdowns = []
         for col in self.filter_cols:
-            if df[col].dtype in [np.float64, np.int64]:
-                min_val = df[col].min()
-                max_val = df[col].max()
-                mean_val = df[col].mean()
+            profile = self.profile[col]
+            if profile.dtype in [np.float64, np.int64]:
+                min_val = profile.minimum
+                max_val = profile.maximum
+                mean_val = profile.mean
                 dropdowns.append(
                     wcc.Selectors(
                         label=col.lower().capitalize(),
@@ -233,7 +274,7 @@ If feature is requested, the data could also come from a database.
                     )
                 )
             else:
-                elements = list(self.data[col].unique())
+                elements = profile.unique_values
                 dropdowns.append(
                     wcc.Selectors(
                         label=col.lower().capitalize(),
@@ -427,19 +468,11 @@ If feature is requested, the data could also come from a database.
         return inputs
 
     def set_callbacks(self, app: Dash) -> None:
-        @app.callback(self.plugin_data_output, self.plugin_data_requested)
-        def _user_download_data(data_requested: Optional[int]) -> Optional[EncodedFile]:
-            return (
-                {
-                    "filename": "table-plotter.csv",
-                    "content": base64.b64encode(
-                        get_data(self.csv_file).to_csv().encode()
-                    ).decode("ascii"),
-                    "mime_type": "text/csv",
-                }
-                if data_requested
-                else None
-            )
+        self.set_download_provider(
+            lambda: get_data(self.csv_file, **self.csv_options),
+            filename="table-plotter.csv",
+            compress=True,
+        )
 
         @app.callback(
             self.plot_output_callbacks,
@@ -467,7 +500,7 @@ If feature is requested, the data could also come from a database.
             if self.use_filter:
                 plot_inputs = args[1 : -len(self.filter_cols)]
                 filter_inputs = args[-len(self.filter_cols) :]
-                data = filter_dataframe(data, self.filter_cols, filter_inputs)
+                data = self.data_filter.filter(list(filter_inputs))
             else:
                 plot_inputs = args[1:]
             for name, plot_arg in zip(self.plot_args.keys(), plot_inputs):
@@ -490,7 +523,7 @@ If feature is requested, the data could also come from a database.
                         ] = self.column_color_discrete_maps.get(plot_arg)
                 else:
                     div_style.append(self.style_options_div_hidden)
-            figure: Figure = plotfunc(data, template=self.plotly_theme, **plotargs)
+            figure = self.make_figure(plotfunc, plot_type, data, plotargs)
             if xaxis_min is not None and xaxis_max is not None:
                 figure.update_layout(xaxis_range=[xaxis_min, xaxis_max])
             if yaxis_min is not None and yaxis_max is not None:
@@ -498,26 +531,164 @@ If feature is requested, the data could also come from a database.
 
             return (figure, *div_style)
 
+    def make_figure(
+        self,
+        plotfunc: Callable[..., Figure],
+        plot_type: str,
+        data: pd.DataFrame,
+        plotargs: dict,
+    ) -> Figure:
+        """Large scatter and line plots are rendered with WebGL, and downsampled
+        if larger than `max_points`. Other large plots are aggregated on the server,
+        if possible. Downsampling and aggregation is indicated in the figure."""
+        plot_data = data
+        trace_updates: dict = {}
+        if plot_type in DOWNSAMPLED_PLOT_TYPES:
+            if len(data) > WEBGL_MIN_POINTS:
+                plotargs["render_mode"] = "webgl"
+            plot_data = self.downsample(data, plot_type, plotargs)
+        elif plot_type in AGGREGATED_PLOT_TYPES:
+            plot_data, trace_updates = self.aggregate(data, plot_type, plotargs)
+
+        figure: Figure = plotfunc(plot_data, template=self.plotly_template, **plotargs)
+        figure.update_traces(**trace_updates)
+        if plot_type == "histogram" and plot_data is not data:
+            # Keep the axis title of a histogram counting the raw data
+            figure.for_each_yaxis(
+                lambda axis: axis.update(
+                    title_text=plotargs.get("histnorm") or COUNT_COLUMN
+                )
+                if axis.title.text
+                else None
+            )
+        if plot_data is not data:
+            figure.add_annotation(
+                text=f"Showing {len(plot_data):,} of {len(data):,} points"
+                if plot_type in DOWNSAMPLED_PLOT_TYPES
+                else f"Aggregated from {len(data):,} points",
+                xref="paper",
+                yref="paper",
+                x=1,
+                y=1,
+                xanchor="right",
+                yanchor="bottom",
+                showarrow=False,
+            )
+        return figure
+
+    def aggregate(
+        self, data: pd.DataFrame, plot_type: str, plotargs: dict
+    ) -> Tuple[pd.DataFrame, dict]:
+        """Aggregates the data if larger than `max_points`, and updates `plotargs`
+        accordingly. Returns the data to plot, together with updates to apply
+        to the traces (such that the browser bins exactly as the server did)."""
+        if not self.max_points or len(data) <= self.max_points:
+            return data, {}
+
+        group_columns = list(
+            dict.fromkeys(
+                plotargs[arg]
+                for arg in ["color", "facet_col"]
+                if plotargs.get(arg) is not None
+            )
+        )
+
+        if plot_type == "histogram":
+            counts, edges = histogram_counts(
+                data, plotargs["x"], group_columns, HISTOGRAM_BINS
+            )
+            plotargs.update(y=COUNT_COLUMN, histfunc="sum")
+            return counts, {} if edges is None else {"xbins": _bins(edges)}
+
+        if plot_type == "density_contour":
+            histogram = histogram2d_counts(
+                data, plotargs["x"], plotargs["y"], group_columns, HISTOGRAM_BINS
+            )
+            if histogram is None:
+                return data, {}
+            counts, x_edges, y_edges = histogram
+            plotargs.update(z=COUNT_COLUMN, histfunc="sum")
+            return counts, {"xbins": _bins(x_edges), "ybins": _bins(y_edges)}
+
+        sketch = quantile_sketch(
+            data, plotargs["y"], list(dict.fromkeys([plotargs["x"], *group_columns]))
+        )
+        return (data, {}) if sketch is None else (sketch, {})
+
+    def downsample(
+        self, data: pd.DataFrame, plot_type: str, plotargs: dict
+    ) -> pd.DataFrame:
+        """Downsamples the data if larger than `max_points`. Adds `hover_data`
+        to `plotargs` if the points in the returned data are aggregated."""
+        if not self.max_points or len(data) <= self.max_points:
+            return data
+
+        if plot_type == "line":
+            group_columns = [
+                plotargs[arg]
+                for arg in ["color", "line_group", "facet_col"]
+                if plotargs.get(arg) is not None
+            ]
+            return downsample_lines(
+                data,
+                plotargs["x"],
+                plotargs["y"],
+                list(dict.fromkeys(group_columns)),
+                self.max_points,
+            )
+
+        # Continuous colors and marker sizes are averaged within each bin
+        group_columns, mean_columns = [], []
+        for arg in ["color", "facet_col", "size"]:
+            column = plotargs.get(arg)
+            if column is None:
+                continue
+            if arg != "facet_col" and column in self.numeric_columns:
+                mean_columns.append(column)
+            else:
+                group_columns.append(column)
+
+        binned = bin_points(
+            data,
+            plotargs["x"],
+            plotargs["y"],
+            list(dict.fromkeys(group_columns)),
+            list(dict.fromkeys(mean_columns)),
+            self.max_points,
+        )
+        if binned is None:
+            return data.sample(self.max_points, random_state=0)
+
+        plotargs["hover_data"] = [POINTS_COLUMN]
+        return binned
+
+
+def _bins(edges: np.ndarray) -> dict:
+    return {
+        "start": float(edges[0]),
+        "end": float(edges[-1]),
+        "size": float(edges[1] - edges[0]),
+    }
+
 
-@CACHE.memoize()
-@webvizstore
-def get_data(csv_file: Path) -> pd.DataFrame:
-    return pd.read_csv(csv_file, index_col=None)
+def get_data(csv_file: Path, **csv_options: Any) -> pd.DataFrame:
+    return WEBVIZ_DATASETS.get(csv_file, **csv_options)
 
 
-@CACHE.memoize()
 def filter_dataframe(
     dframe: pd.DataFrame, columns: list, column_values: List[list]
 ) -> pd.DataFrame:
-    df = dframe.copy()
+    """One-off filtering of a dataframe. When filtering the same dataframe
+    repeatedly, use `webviz_config.utils.DataFrameFilter` instead."""
     if not isinstance(columns, list):
         columns = [columns]
+    mask = np.ones(len(dframe), dtype=bool)
     for filt, col in zip(column_values, columns):
         if isinstance(filt, list):
-            if df[col].dtype in [np.float64, np.int64]:
-                df = df.loc[df[col].between(filt[0], filt[1])]
+            if dframe[col].dtype in [np.float64, np.int64]:
+                mask &= dframe[col].between(filt[0], filt[1]).to_numpy()
             else:
-                df = df.loc[df[col].isin(filt)]
+                mask &= dframe[col].isin(filt).to_numpy()
         else:
-            df = df.loc[df[col] == filt]
-    return df
+            mask &= (dframe[col] == filt).to_numpy()
+    return dframe if mask.all() else dframe.take(np.flatnonzero(mask))
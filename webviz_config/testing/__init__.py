@@ -1,5 +1,7 @@
 from typing import Any, Generator
 
+from ._performance import WebvizPerformance
+
 # pylint: disable=too-few-public-methods
 class MissingWebvizTesting:
     def __init__(self, **kwargs: Any) -> None:
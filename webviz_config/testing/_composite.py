@@ -1,17 +1,11 @@
 from typing import Any
 
-import pathlib
-
 from dash.testing.composite import Browser
 import dash
-import webviz_core_components as wcc
 
-from webviz_config.common_cache import CACHE
-from webviz_config.themes import default_theme
-from webviz_config.webviz_factory_registry import WEBVIZ_FACTORY_REGISTRY
-from webviz_config.webviz_instance_info import WEBVIZ_INSTANCE_INFO, WebvizRunMode
 from webviz_config import WebvizPluginABC
 
+from ._webviz_app import init_test_app, plugin_test_layout
 from ._webviz_ids import WebvizIds
 
 
@@ -24,43 +18,12 @@ class WebvizComposite(Browser):
         self.init_app()
 
     def init_app(self) -> None:
-        WEBVIZ_INSTANCE_INFO.initialize(
-            dash_app=self.app,
-            run_mode=WebvizRunMode.NON_PORTABLE,
-            theme=default_theme,
-            storage_folder=pathlib.Path(__file__).resolve().parent,
-        )
-        try:
-            WEBVIZ_FACTORY_REGISTRY.initialize(None)
-        except RuntimeError:
-            pass
-
-        self.app.css.config.serve_locally = True
-        self.app.scripts.config.serve_locally = True
-        self.app.config.suppress_callback_exceptions = True
-        CACHE.init_app(self.app.server)
+        init_test_app(self.app)
 
     def start_server(self, plugin: WebvizPluginABC, **kwargs: Any) -> None:
         """Start the local server with app."""
 
-        self.app.layout = dash.html.Div(
-            className=WebvizIds.LAYOUT_WRAPPER,
-            children=[
-                wcc.WebvizContentManager(
-                    id=WebvizIds.CONTENT_MANAGER,
-                    children=[
-                        wcc.WebvizSettingsDrawer(
-                            id=WebvizIds.SETTINGS_DRAWER,
-                            children=plugin.get_all_settings(),
-                        ),
-                        wcc.WebvizPluginsWrapper(
-                            id=WebvizIds.PLUGINS_WRAPPER,
-                            children=plugin.plugin_layout(),
-                        ),
-                    ],
-                ),
-            ],
-        )
+        self.app.layout = plugin_test_layout(plugin)
         self.plugin = plugin
         # start server with app and pass Dash arguments
         self.server(self.app, **kwargs)
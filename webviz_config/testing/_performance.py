@@ -0,0 +1,310 @@
+import json
+import time
+import pathlib
+import warnings
+import statistics
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+import dash
+from plotly.io.json import to_json_plotly
+
+from webviz_config import WebvizPluginABC
+
+from ._webviz_app import plugin_test_layout
+
+# Relative increase (compared to the baseline) allowed before a measurement is
+# reported as a regression, per kind of measurement. Can be overridden in the
+# baselines file.
+DEFAULT_TOLERANCES = {"time": 0.5, "memory": 0.25, "size": 0.1}
+
+# Absolute increase (in seconds or bytes) always allowed, per kind of
+# measurement, such that noise in small measurements is not reported as
+# regressions. Can be overridden in the baselines file.
+DEFAULT_ABSOLUTE_TOLERANCES = {"time": 0.01, "memory": 2**16, "size": 0}
+
+T = TypeVar("T", bound=WebvizPluginABC)
+
+
+class Measurement:
+    """One performance measurement, of a given kind (`time` in seconds, or
+    `memory`/`size` in bytes)."""
+
+    def __init__(self, name: str, kind: str, value: float):
+        self.name = name
+        self.kind = kind
+        self.value = value
+
+    def formatted(self, value: Optional[float] = None) -> str:
+        value = self.value if value is None else value
+        if self.kind == "time":
+            return f"{1000 * value:.1f} ms"
+        return f"{value / 1024:.1f} kB"
+
+
+class WebvizPerformance:
+    """Measures the performance of plugins, without a browser:
+
+    * `construct()`: time and peak memory used when creating a plugin.
+    * `measure_layout()`: size of the serialized layout of a plugin.
+    * `measure_callback()`: latency of a callback, invoked through the
+      `_dash-update-component` endpoint of the Dash app (as by the browser).
+
+    All measurements are added to `measurements`, which are compared with the
+    baselines stored in a file by the `_webviz_performance` fixture.
+    """
+
+    def __init__(self, app: dash.Dash):
+        self.app = app
+        self.measurements: Dict[str, Measurement] = {}
+
+    def construct(
+        self, plugin_factory: Callable[[], T], name: Optional[str] = None
+    ) -> T:
+        """Creates a plugin using the factory (e.g. `lambda: MyPlugin(app, ...)`)
+        and measures the time and peak memory used. The measurements are named
+        by the plugin class, unless `name` is given.
+
+        Memory allocations are traced (using `tracemalloc`) while the plugin is
+        created, which adds to the construction time. Compare the time only
+        with baselines measured the same way.
+        """
+        started_tracemalloc = not tracemalloc.is_tracing()
+        if started_tracemalloc:
+            tracemalloc.start()
+        try:
+            allocated_before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            start = time.perf_counter()
+            plugin = plugin_factory()
+            duration = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            if started_tracemalloc:
+                tracemalloc.stop()
+
+        name = type(plugin).__name__ if name is None else name
+        self._add(Measurement(f"construction_time[{name}]", "time", duration))
+        self._add(
+            Measurement(
+                f"construction_peak_memory[{name}]", "memory", peak - allocated_before
+            )
+        )
+        return plugin
+
+    def measure_layout(
+        self, plugin: WebvizPluginABC, name: Optional[str] = None
+    ) -> int:
+        """Returns (and measures) the size in bytes of the serialized layout,
+        including settings, of the plugin."""
+        size = len(to_json_plotly(plugin_test_layout(plugin)).encode())
+        name = type(plugin).__name__ if name is None else name
+        self._add(Measurement(f"layout_size[{name}]", "size", size))
+        return size
+
+    def measure_callback(
+        self,
+        output: str,
+        inputs: Optional[Dict[str, Any]] = None,
+        state: Optional[Dict[str, Any]] = None,
+        name: Optional[str] = None,
+        repeat: int = 1,
+    ) -> Any:
+        """Invokes the callback updating `output` (given as `"id.property"`)
+        `repeat` times, and measures the median latency. Input and state values
+        are given as dictionaries with `"id.property"` keys (missing values are
+        `None`), and all inputs are regarded as triggered. Returns the response
+        of the callback (`None` if the update was prevented).
+
+        The callback is invoked through the Flask test client of the app, such
+        that the latency includes handling the request and serializing the
+        response. The app needs a layout (as required by Dash when handling
+        requests). The first invocation includes e.g. populating caches, use
+        `repeat=1` in order to measure the latency seen by the first user. As
+        component ids often include a counter, give a stable `name` for the
+        measurement.
+        """
+        client = self.app.server.test_client()
+        prefix = self.app.config.routes_pathname_prefix
+        callback = self._find_callback(client, prefix, output)
+        body = _request_body(output, callback, {**(inputs or {}), **(state or {})})
+
+        latencies: List[float] = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            response = client.post(f"{prefix}_dash-update-component", json=body)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code not in (200, 204):
+                raise RuntimeError(
+                    f"The callback updating {output} failed "
+                    f"with status {response.status_code}."
+                )
+
+        self._add(
+            Measurement(
+                f"callback_latency[{output if name is None else name}]",
+                "time",
+                statistics.median(latencies),
+            )
+        )
+        # Status 204 (no content) is returned when the update is prevented
+        if response.status_code == 204:
+            return None
+        return json.loads(response.data).get("response")
+
+    @staticmethod
+    def _find_callback(client: Any, prefix: str, output: str) -> Dict[str, Any]:
+        # The callbacks of the app, including those registered with
+        # `dash.callback`, as requested by the browser
+        for callback in client.get(f"{prefix}_dash-dependencies").get_json():
+            if output in _output_prop_ids(callback["output"]):
+                return callback
+        raise ValueError(f"Found no callback updating {output}.")
+
+    def _add(self, measurement: Measurement) -> None:
+        if measurement.name in self.measurements:
+            raise ValueError(
+                f"{measurement.name} is already measured. "
+                "Give the measurement a unique name."
+            )
+        self.measurements[measurement.name] = measurement
+
+
+class PerformanceBaselines:
+    """Baselines of performance measurements per test, stored in a JSON file
+    together with (optional) relative and absolute tolerances per kind of
+    measurement:
+
+    ```json
+    {
+        "tolerances": {"time": 0.5, "memory": 0.25, "size": 0.1},
+        "absolute_tolerances": {"time": 0.01, "memory": 65536, "size": 0},
+        "baselines": {
+            "tests/test_my_plugin.py::test_performance": {
+                "construction_time[MyPlugin]": 0.12
+            }
+        }
+    }
+    ```
+    """
+
+    def __init__(self, path: pathlib.Path):
+        self.path = path
+        content = json.loads(path.read_text()) if path.exists() else {}
+        self.tolerances: Dict[str, float] = {
+            **DEFAULT_TOLERANCES,
+            **content.get("tolerances", {}),
+        }
+        self.absolute_tolerances: Dict[str, float] = {
+            **DEFAULT_ABSOLUTE_TOLERANCES,
+            **content.get("absolute_tolerances", {}),
+        }
+        self.baselines: Dict[str, Dict[str, float]] = content.get("baselines", {})
+
+    def regression_report(
+        self, test_id: str, measurements: Dict[str, Measurement]
+    ) -> Optional[str]:
+        """Returns a report of all measurements of the test, if any of them
+        exceeds its baseline by more than both the relative and the absolute
+        tolerance. Measurements without baselines give a warning."""
+        baselines = self.baselines.get(test_id, {})
+        missing = sorted(set(measurements) - set(baselines))
+        if missing:
+            warnings.warn(
+                f"No performance baselines for {', '.join(missing)} in {test_id}. "
+                f"Run pytest with --webviz-update-baselines to store them in {self.path}."
+            )
+
+        regressed = False
+        lines = []
+        for name, measurement in measurements.items():
+            if name not in baselines:
+                continue
+            baseline = baselines[name]
+            allowed = max(
+                baseline * (1 + self.tolerances[measurement.kind]),
+                baseline + self.absolute_tolerances[measurement.kind],
+            )
+            exceeded = measurement.value > allowed
+            regressed = regressed or exceeded
+            change = (
+                f"{100 * (measurement.value / baseline - 1):+.0f}%"
+                if baseline
+                else "n/a"
+            )
+            lines.append(
+                f"{'REGRESSED' if exceeded else 'ok':<10}{name}: "
+                f"{measurement.formatted()} (baseline {measurement.formatted(baseline)}, "
+                f"{change}, allowed {measurement.formatted(allowed)})"
+            )
+
+        if not regressed:
+            return None
+        return "\n".join(
+            [f"Performance regression in {test_id} (baselines in {self.path}):"]
+            + lines
+            + [
+                "If the change is expected, run pytest with "
+                "--webviz-update-baselines to update the baselines."
+            ]
+        )
+
+    def update(self, test_id: str, measurements: Dict[str, Measurement]) -> None:
+        """Stores the measurements as baselines of the test."""
+        content = json.loads(self.path.read_text()) if self.path.exists() else {}
+        content.setdefault("baselines", {})[test_id] = {
+            name: measurement.value for name, measurement in measurements.items()
+        }
+        content["baselines"] = dict(sorted(content["baselines"].items()))
+        self.path.write_text(json.dumps(content, indent=4) + "\n")
+        self.baselines = content["baselines"]
+
+
+def _prop_id(dependency: Dict[str, Any]) -> str:
+    return f"{dependency['id']}.{dependency['property']}"
+
+
+def _output_prop_ids(output: str) -> List[str]:
+    # Multiple outputs are given as "..id1.property1...id2.property2.."
+    if output.startswith(".."):
+        return output[2:-2].split("...")
+    return [output]
+
+
+def _request_body(
+    output: str, callback: Dict[str, Any], values: Dict[str, Any]
+) -> Dict[str, Any]:
+    # The same request as sent by the browser, with all inputs regarded as
+    # triggered
+    dependencies = callback["inputs"] + callback["state"]
+    output_prop_ids = _output_prop_ids(callback["output"])
+    if any(isinstance(dependency["id"], dict) for dependency in dependencies) or any(
+        prop_id.startswith("{") for prop_id in output_prop_ids
+    ):
+        raise ValueError(
+            f"The callback updating {output} uses pattern-matching ids, "
+            "which is not supported."
+        )
+    unknown = set(values) - {_prop_id(dependency) for dependency in dependencies}
+    if unknown:
+        raise ValueError(
+            f"The callback updating {output} has no input/state {unknown}."
+        )
+
+    outputs = [
+        dict(zip(["id", "property"], prop_id.rsplit(".", 1)))
+        for prop_id in output_prop_ids
+    ]
+    return {
+        "output": callback["output"],
+        "outputs": outputs if callback["output"].startswith("..") else outputs[0],
+        "inputs": [
+            {**dependency, "value": values.get(_prop_id(dependency))}
+            for dependency in callback["inputs"]
+        ],
+        "state": [
+            {**dependency, "value": values.get(_prop_id(dependency))}
+            for dependency in callback["state"]
+        ],
+        "changedPropIds": [_prop_id(dependency) for dependency in callback["inputs"]],
+    }
@@ -1,8 +1,30 @@
+import pathlib
 from typing import Any, Generator
 
+import dash
 import pytest
 
 from webviz_config.testing import WebvizComposite
+from webviz_config.webviz_instance_info import WEBVIZ_INSTANCE_INFO
+
+from ._performance import PerformanceBaselines, WebvizPerformance
+from ._webviz_app import init_test_app
+
+
+def pytest_addoption(parser: Any) -> None:
+    group = parser.getgroup("webviz", "webviz performance fixtures")
+    group.addoption(
+        "--webviz-baselines",
+        default="webviz_performance_baselines.json",
+        help="File (relative to the rootdir) with performance baselines used by "
+        "the _webviz_performance fixture.",
+    )
+    group.addoption(
+        "--webviz-update-baselines",
+        action="store_true",
+        help="Store the measurements of the _webviz_performance fixture as new "
+        "baselines, instead of comparing with the existing baselines.",
+    )
 
 
 @pytest.fixture
@@ -20,3 +42,36 @@ def _webviz_duo(request: Any, dash_thread_server: Any, tmpdir: Any) -> Generator
         pause=request.config.getoption("pause"),
     ) as duo:
         yield duo
+
+
+@pytest.fixture(scope="session")
+def _webviz_performance_app() -> dash.Dash:
+    # The webviz singletons can only be initialized once, so all performance
+    # tests share one app (as all plugins in a webviz application do)
+    try:
+        return WEBVIZ_INSTANCE_INFO.dash_app
+    except RuntimeError:
+        app = dash.Dash(__name__)
+        init_test_app(app)
+        # Dash requires a layout before handling (callback) requests
+        app.layout = dash.html.Div()
+        return app
+
+
+@pytest.fixture
+def _webviz_performance(request: Any, _webviz_performance_app: dash.Dash) -> Generator:
+    performance = WebvizPerformance(_webviz_performance_app)
+    yield performance
+
+    baselines = PerformanceBaselines(
+        pathlib.Path(request.config.rootpath)
+        / request.config.getoption("webviz_baselines")
+    )
+    if request.config.getoption("webviz_update_baselines"):
+        baselines.update(request.node.nodeid, performance.measurements)
+    else:
+        report = baselines.regression_report(
+            request.node.nodeid, performance.measurements
+        )
+        if report is not None:
+            pytest.fail(report, pytrace=False)
@@ -0,0 +1,56 @@
+import pathlib
+
+import dash
+import webviz_core_components as wcc
+
+from webviz_config.common_cache import CACHE
+from webviz_config.themes import default_theme
+from webviz_config.webviz_downloads import WEBVIZ_DOWNLOADS
+from webviz_config.webviz_factory_registry import WEBVIZ_FACTORY_REGISTRY
+from webviz_config.webviz_instance_info import WEBVIZ_INSTANCE_INFO, WebvizRunMode
+from webviz_config import WebvizPluginABC
+
+from ._webviz_ids import WebvizIds
+
+
+def init_test_app(app: dash.Dash) -> None:
+    """Initializes the app, and the webviz singletons, such that plugins can
+    be created and their callbacks and downloads registered on it."""
+    WEBVIZ_INSTANCE_INFO.initialize(
+        dash_app=app,
+        run_mode=WebvizRunMode.NON_PORTABLE,
+        theme=default_theme,
+        storage_folder=pathlib.Path(__file__).resolve().parent,
+    )
+    try:
+        WEBVIZ_FACTORY_REGISTRY.initialize(None)
+    except RuntimeError:
+        pass
+
+    app.css.config.serve_locally = True
+    app.scripts.config.serve_locally = True
+    app.config.suppress_callback_exceptions = True
+    CACHE.init_app(app.server)
+    WEBVIZ_DOWNLOADS.register_route(app.server)
+
+
+def plugin_test_layout(plugin: WebvizPluginABC) -> dash.html.Div:
+    """Returns the layout of an app with the plugin as only content."""
+    return dash.html.Div(
+        className=WebvizIds.LAYOUT_WRAPPER,
+        children=[
+            wcc.WebvizContentManager(
+                id=WebvizIds.CONTENT_MANAGER,
+                children=[
+                    wcc.WebvizSettingsDrawer(
+                        id=WebvizIds.SETTINGS_DRAWER,
+                        children=plugin.get_all_settings(),
+                    ),
+                    wcc.WebvizPluginsWrapper(
+                        id=WebvizIds.PLUGINS_WRAPPER,
+                        children=plugin.plugin_layout(),
+                    ),
+                ],
+            ),
+        ],
+    )
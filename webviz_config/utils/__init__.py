@@ -8,3 +8,14 @@ from ._deprecate_webviz_settings_attribute_in_dash_app import (
 from ._str_enum import StrEnum
 from ._callback_typecheck import callback_typecheck, ConversionError
 from ._usage_analytics import setup_usage_analytics, UsageAnalytics
+from ._optimize_responses import optimize_responses
+from ._dataframe_filter import DataFrameFilter
+from ._downsampling import (
+    lttb_indices,
+    downsample_lines,
+    bin_points,
+    histogram_counts,
+    histogram2d_counts,
+    quantile_sketch,
+)
+from ._column_profile import ColumnProfile, DatasetProfile, dataset_profile
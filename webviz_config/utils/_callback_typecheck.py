@@ -1,127 +1,283 @@
 # pylint: disable=line-too-long
-from typing import Any, Callable, get_args, get_origin, _TypedDictMeta, TypeVar, Union  # type: ignore[attr-defined]
+from typing import Any, Callable, Collection, Dict, Iterable, Optional, Tuple, get_args, get_origin, _TypedDictMeta, TypeVar, Union  # type: ignore[attr-defined]
 import inspect
+import itertools
 
 T = TypeVar("T")
 
+# Converter functions by type annotation, compiled on first use. The key
+# includes the representation of the annotation, as e.g. `Union[str, int]`
+# equals `Union[int, str]` while their conversions are tried in different order.
+_CONVERTERS: Dict[Tuple[Any, str], Callable[[Any], Any]] = {}
+
+# Collections given to the element type checks, which can be iterated more than once
+_REITERABLE_TYPES = (list, type({}.keys()), type({}.values()))
+
 
 class ConversionError(Exception):
     pass
 
 
-def _isinstance(arg: Any, annotation: Any) -> bool:
-    # pylint: disable=too-many-return-statements, too-many-branches
+def _plain_types(annotation: Any) -> Optional[tuple]:
+    """Returns the types to check with a plain `isinstance` call, if that is
+    all that is needed for the given annotation, otherwise `None`."""
     if annotation is type(None) or annotation is None:
-        return arg is None
+        return (type(None),)
 
-    if annotation is Any:
-        return True
+    if get_origin(annotation) is Union:
+        types: tuple = ()
+        for annotation_arg in get_args(annotation):
+            arg_types = _plain_types(annotation_arg)
+            if arg_types is None:
+                return None
+            types += arg_types
+        return types
 
-    if get_origin(annotation) is None:
+    if get_origin(annotation) is None and isinstance(annotation, type):
         try:
-            return isinstance(arg, annotation)
+            isinstance(None, annotation)
         except TypeError:
-            return False
+            return None
+        return (annotation,)
 
-    if get_origin(annotation) == Union:
-        for annotation_arg in get_args(annotation):
-            if _isinstance(arg, annotation_arg):
-                return True
-
-    if get_origin(annotation) is list and isinstance(arg, list):
-        result = True
-        type_args = get_args(annotation)
-        if len(type_args) == 1:
-            for annotation_arg in arg:
-                result &= _isinstance(annotation_arg, type_args[0])
-        return result
-
-    if get_origin(annotation) is dict and isinstance(arg, dict):
-        result = True
-        type_args = get_args(annotation)
-        if len(type_args) == 2:
-            for key, value in arg.items():
-                result &= _isinstance(key, type_args[0])
-                result &= _isinstance(value, type_args[1])
-        return result
+    return None
 
-    return False
 
+def _compile_isinstance(annotation: Any) -> Callable[[Any], bool]:
+    """Returns a function checking if a value is an instance of the annotated type,
+    including the types of all elements in (typed) lists and dictionaries."""
+    # pylint: disable=too-many-return-statements
+    if annotation is Any:
+        return lambda arg: True
 
-def convert(arg: Any, convert_to: T) -> T:
-    # pylint: disable=too-many-return-statements, too-many-branches
-    additional_error_message: str = ""
-    try:
-        if _isinstance(arg, convert_to):
+    types = _plain_types(annotation)
+    if types is not None:
+        return lambda arg: isinstance(arg, types)
+
+    origin = get_origin(annotation)
+    type_args = get_args(annotation)
+
+    if origin is None:
+        # E.g. TypedDict, which does not support isinstance
+        return lambda arg: False
+
+    if origin is Union:
+        checks = [_compile_isinstance(annotation_arg) for annotation_arg in type_args]
+        return lambda arg: any(check(arg) for check in checks)
+
+    if origin is list:
+        if len(type_args) != 1:
+            return lambda arg: isinstance(arg, list)
+        all_elements = _compile_all_isinstance(type_args[0])
+        return lambda arg: isinstance(arg, list) and all_elements(arg)
+
+    if origin is dict:
+        if len(type_args) != 2:
+            return lambda arg: isinstance(arg, dict)
+        all_keys = _compile_all_isinstance(type_args[0])
+        all_values = _compile_all_isinstance(type_args[1])
+        return lambda arg: (
+            isinstance(arg, dict) and all_keys(arg.keys()) and all_values(arg.values())
+        )
+
+    return lambda arg: False
+
+
+def _compile_all_isinstance(annotation: Any) -> Callable[[Any], bool]:
+    """Returns a function checking if all values in an iterable are instances
+    of the annotated type. For plain types, only each distinct type of the
+    values is checked."""
+    if annotation is Any:
+        return lambda values: True
+
+    types = _plain_types(annotation)
+    if types is not None:
+        return lambda values: all(
+            issubclass(value_type, types) for value_type in set(map(type, values))
+        )
+
+    # The elements of all lists (or keys and values of all dictionaries)
+    # are checked together
+    origin = get_origin(annotation)
+    type_args = get_args(annotation)
+
+    if origin is list and len(type_args) == 1:
+        all_lists = _compile_all_isinstance(list)
+        all_elements = _compile_all_isinstance(type_args[0])
+
+        def all_list_instances(values: Iterable) -> bool:
+            values = _reiterable(values)
+            return all_lists(values) and all_elements(
+                _reiterable(itertools.chain.from_iterable(values))
+            )
+
+        return all_list_instances
+
+    if origin is dict and len(type_args) == 2:
+        all_dicts = _compile_all_isinstance(dict)
+        all_keys = _compile_all_isinstance(type_args[0])
+        all_values = _compile_all_isinstance(type_args[1])
+
+        def all_dict_instances(values: Iterable) -> bool:
+            values = _reiterable(values)
+            return (
+                all_dicts(values)
+                and all_keys(_reiterable(itertools.chain.from_iterable(values)))
+                and all_values(
+                    _reiterable(itertools.chain.from_iterable(map(dict.values, values)))
+                )
+            )
+
+        return all_dict_instances
+
+    check = _compile_isinstance(annotation)
+    return lambda values: all(map(check, values))
+
+
+def _reiterable(values: Iterable) -> Collection:
+    return values if type(values) in _REITERABLE_TYPES else list(values)
+
+
+class _NotConvertible(Exception):
+    pass
+
+
+def _compile_converter(convert_to: Any) -> Callable[[Any], Any]:
+    """Returns a function converting a value to the annotated type. Values which
+    already are of the annotated type are returned as is."""
+    is_instance = _compile_isinstance(convert_to)
+    convert_other = _compile_other_converter(convert_to)
+
+    def converter(arg: Any) -> Any:
+        if is_instance(arg):
             return arg
-        if (
-            inspect.isclass(convert_to)
-            and not isinstance(convert_to, _TypedDictMeta)
-            and arg is not None
-        ):
+
+        additional_error_message: str = ""
+        try:
+            return convert_other(arg)
+        except _NotConvertible:
+            pass
+        except Exception as exception:  # pylint: disable=broad-except
+            additional_error_message = f"\n\nMore details:\n{exception}"
+
+        raise ConversionError(
+            f"Argument of type '{type(arg)}' cannot be converted to type '{convert_to}'.{additional_error_message}"
+        )
+
+    return converter
+
+
+def _compile_other_converter(convert_to: Any) -> Callable[[Any], Any]:
+    """Returns a function converting a value, which is not already of the
+    annotated type, to the annotated type. Raises `_NotConvertible` if there
+    is no conversion to the annotated type."""
+    if inspect.isclass(convert_to) and not isinstance(convert_to, _TypedDictMeta):
+
+        def convert_class(arg: Any) -> Any:
+            if arg is None:
+                raise _NotConvertible
             return convert_to(arg)
-        if (
-            isinstance(convert_to, _TypedDictMeta)
-            and "__annotations__" in dir(convert_to)
-            and isinstance(arg, dict)
-        ):
+
+        return convert_class
+
+    if isinstance(convert_to, _TypedDictMeta):
+        annotations = convert_to.__annotations__
+        value_converters = {
+            key: _converter(annotation) for key, annotation in annotations.items()
+        }
+
+        def convert_typed_dict(arg: Any) -> Any:
+            if not isinstance(arg, dict):
+                raise _NotConvertible
             new_dict = convert_to()
             for key, value in arg.items():
-                if key in list(convert_to.__annotations__.keys()):
-                    new_dict[key] = convert(value, convert_to.__annotations__[key])
-                else:
-                    raise Exception(
+                if key not in value_converters:
+                    raise ValueError(
                         f"""
                         Key '{key}' not allowed in '{convert_to}'.\n
-                        Allowed keys are: {', '.join(list(convert_to.__annotations__.keys()))}
+                        Allowed keys are: {', '.join(list(annotations.keys()))}
                         """
                     )
-
-            if not convert_to.__total__ or len(new_dict.keys()) == len(
-                convert_to.__annotations__.keys()
-            ):
+                new_dict[key] = value_converters[key](value)
+            if not convert_to.__total__ or len(new_dict) == len(annotations):
                 return new_dict
+            raise _NotConvertible
 
-        if convert_to is list and isinstance(arg, list):
-            return arg  # type: ignore[return-value]
-        if get_origin(convert_to) is list and isinstance(arg, list):
-            return [convert(a, get_args(convert_to)[0]) for a in arg]  # type: ignore[return-value]
-        if convert_to is dict and isinstance(arg, dict):
-            return arg  # type: ignore[return-value]
-        if get_origin(convert_to) is dict and isinstance(arg, dict):
-            if len(get_args(convert_to)) == 2:
-                return {  # type: ignore[return-value]
-                    convert(key, get_args(convert_to)[0]): convert(
-                        value, get_args(convert_to)[1]
-                    )
-                    for key, value in arg.items()
-                }
-        if get_origin(convert_to) is Union and "__args__" in dir(convert_to):
-            for convert_type in get_args(convert_to):
+        return convert_typed_dict
+
+    origin = get_origin(convert_to)
+    type_args = get_args(convert_to)
+
+    if origin is list and len(type_args) == 1:
+        convert_element = _converter(type_args[0])
+
+        def convert_list(arg: Any) -> Any:
+            if not isinstance(arg, list):
+                raise _NotConvertible
+            return [convert_element(a) for a in arg]
+
+        return convert_list
+
+    if origin is dict and len(type_args) == 2:
+        convert_key = _converter(type_args[0])
+        convert_value = _converter(type_args[1])
+
+        def convert_dict(arg: Any) -> Any:
+            if not isinstance(arg, dict):
+                raise _NotConvertible
+            return {
+                convert_key(key): convert_value(value) for key, value in arg.items()
+            }
+
+        return convert_dict
+
+    if origin is Union:
+        converters = [_converter(convert_type) for convert_type in type_args]
+
+        def convert_union(arg: Any) -> Any:
+            for converter in converters:
                 try:
-                    return convert(arg, convert_type)
+                    return converter(arg)
                 except ConversionError:
                     pass
+            raise _NotConvertible
 
-    # pylint: disable=broad-except
-    except Exception as exception:
-        additional_error_message = f"\n\nMore details:\n{exception}"
+        return convert_union
 
-    raise ConversionError(
-        f"Argument of type '{type(arg)}' cannot be converted to type '{convert_to}'.{additional_error_message}"
-    )
+    def not_convertible(arg: Any) -> Any:
+        raise _NotConvertible
+
+    return not_convertible
+
+
+def _converter(convert_to: Any) -> Callable[[Any], Any]:
+    key = (convert_to, repr(convert_to))
+    try:
+        return _CONVERTERS[key]
+    except KeyError:
+        converter = _CONVERTERS[key] = _compile_converter(convert_to)
+        return converter
+    except TypeError:
+        # Unhashable annotation
+        return _compile_converter(convert_to)
+
+
+def convert(arg: Any, convert_to: T) -> T:
+    return _converter(convert_to)(arg)
 
 
 def callback_typecheck(func: Callable) -> Callable:
     signature = inspect.signature(func)
     parameters = list(signature.parameters.values())
+    # Each parameter annotation is compiled once, when the callback is decorated
+    converters = [_converter(parameter.annotation) for parameter in parameters]
 
     def wrapper(*_args) -> signature.return_annotation:  # type: ignore[no-untyped-def,name-defined]
         adjusted_args: list = []
 
         for index, arg in enumerate(_args):
             try:
-                adjusted_args.append(convert(arg, parameters[index].annotation))
+                adjusted_args.append(converters[index](arg))
             except ConversionError as exception:
                 raise ConversionError(
                     f"Error while converting input to argument '{parameters[index].name}' of function '{func.__name__}' in file '{func.__globals__['__file__']}': {exception}"
@@ -0,0 +1,101 @@
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class ColumnProfile:
+    name: str
+    dtype: np.dtype
+    is_numeric: bool
+    null_count: int
+    # Unique values in order of appearance (including missing values, if any)
+    unique_values: List[Any]
+    # Number of unique values, not counting missing values
+    cardinality: int
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+    mean: Optional[float] = None
+
+    @classmethod
+    def from_series(cls, series: pd.Series) -> "ColumnProfile":
+        unique_values = list(series.unique())
+        null_count = int(series.isna().sum())
+        is_numeric = pd.api.types.is_numeric_dtype(
+            series
+        ) and not pd.api.types.is_bool_dtype(series)
+
+        return cls(
+            name=str(series.name),
+            dtype=series.dtype,
+            is_numeric=is_numeric,
+            null_count=null_count,
+            unique_values=unique_values,
+            cardinality=len(unique_values) - (1 if null_count else 0),
+            minimum=series.min() if is_numeric else None,
+            maximum=series.max() if is_numeric else None,
+            mean=series.mean() if is_numeric else None,
+        )
+
+
+class DatasetProfile:
+    """Column metadata (dtypes, unique values, ranges, null counts and
+    cardinality) of a dataframe, computed once such that layouts and callbacks
+    do not need to rescan the data. Use `dataset_profile()` in order to share
+    the profile between all plugins using the same dataset.
+    """
+
+    def __init__(self, dframe: pd.DataFrame) -> None:
+        self._row_count = len(dframe)
+        self._columns: Dict[str, ColumnProfile] = {
+            column: ColumnProfile.from_series(dframe[column])
+            for column in dframe.columns
+        }
+
+    def __getitem__(self, column: str) -> ColumnProfile:
+        return self._columns[column]
+
+    def __contains__(self, column: object) -> bool:
+        return column in self._columns
+
+    @property
+    def row_count(self) -> int:
+        return self._row_count
+
+    @property
+    def size(self) -> int:
+        return self._row_count * len(self._columns)
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns)
+
+    @property
+    def numeric_columns(self) -> List[str]:
+        return [
+            column for column, profile in self._columns.items() if profile.is_numeric
+        ]
+
+
+_PROFILES: Dict[Hashable, DatasetProfile] = {}
+_PROFILES_LOCK = threading.Lock()
+
+
+def dataset_profile(key: Hashable, dframe: pd.DataFrame) -> DatasetProfile:
+    """Returns the profile of the dataset identified by `key` (typically the
+    path to the file the dataframe was read from). The profile is computed
+    from `dframe` the first time a given key is seen (or if the shape or
+    columns of the dataframe has changed since then).
+    """
+    with _PROFILES_LOCK:
+        profile = _PROFILES.get(key)
+        if (
+            profile is None
+            or profile.row_count != len(dframe)
+            or profile.columns != list(dframe.columns)
+        ):
+            profile = _PROFILES[key] = DatasetProfile(dframe)
+        return profile
@@ -0,0 +1,92 @@
+from typing import Any, Dict, List, NamedTuple, Union
+
+import numpy as np
+import pandas as pd
+
+# Column dtypes filtered by a [min, max] range. Other columns are filtered by
+# a list of allowed values.
+RANGE_FILTER_DTYPES = [np.float64, np.int64]
+
+
+class _RangeIndex(NamedTuple):
+    values: np.ndarray
+    sorted_values: np.ndarray
+    order: np.ndarray
+
+
+class _CategoryIndex(NamedTuple):
+    codes: np.ndarray
+    code_lookup: Dict[Any, int]
+
+
+class DataFrameFilter:
+    """Filters a dataframe on a fixed set of columns, repeatedly and fast.
+
+    Indexes are computed once per column when the filter is created: numeric
+    columns are sorted (such that a range filter is two binary searches, and
+    narrow ranges only touch the rows inside the range), and
+    other columns are factorized into integer codes (such that a value filter
+    is a single lookup in a small boolean array). The filters given to
+    `filter()` are combined into one boolean mask, and the dataframe is
+    subsetted with a single `take` (or returned as is if no rows are removed).
+
+    The dataframe is assumed to not change after the filter is created.
+    """
+
+    def __init__(self, dframe: pd.DataFrame, columns: List[str]) -> None:
+        self._dframe = dframe
+        self._indexes: Dict[str, Union[_RangeIndex, _CategoryIndex]] = {}
+
+        for column in columns:
+            values = dframe[column]
+            if values.dtype in RANGE_FILTER_DTYPES:
+                array = values.to_numpy()
+                order = np.argsort(array, kind="stable")
+                self._indexes[column] = _RangeIndex(array, array[order], order)
+            else:
+                codes, uniques = pd.factorize(values)
+                self._indexes[column] = _CategoryIndex(
+                    codes, {value: code for code, value in enumerate(uniques)}
+                )
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._indexes)
+
+    def mask(self, column_values: List[Any]) -> np.ndarray:
+        """Returns a boolean mask of the rows passing all filters. The filters
+        are given in the same order as the columns given at initialization. A
+        filter is either a list ([min, max] for numeric columns, allowed values
+        for other columns) or a single value to compare with.
+        """
+        mask = np.ones(len(self._dframe), dtype=bool)
+        for column, values in zip(self._indexes, column_values):
+            index = self._indexes[column]
+            if isinstance(index, _RangeIndex):
+                low, high = values if isinstance(values, list) else (values, values)
+                start = np.searchsorted(index.sorted_values, low, side="left")
+                end = np.searchsorted(index.sorted_values, high, side="right")
+                if start == 0 and end == len(mask):
+                    continue
+                if end - start > len(mask) // 8:
+                    # Scattering many positions is slower than comparing all values
+                    column_mask = (index.values >= low) & (index.values <= high)
+                else:
+                    column_mask = np.zeros(len(mask), dtype=bool)
+                    column_mask[index.order[start:end]] = True
+            else:
+                # The last element is looked up by missing values (code -1)
+                selected = np.zeros(len(index.code_lookup) + 1, dtype=bool)
+                for value in values if isinstance(values, list) else [values]:
+                    code = -1 if pd.isna(value) else index.code_lookup.get(value)
+                    if code is not None:
+                        selected[code] = True
+                column_mask = selected[index.codes]
+            mask &= column_mask
+        return mask
+
+    def filter(self, column_values: List[Any]) -> pd.DataFrame:
+        mask = self.mask(column_values)
+        if mask.all():
+            return self._dframe
+        return self._dframe.take(np.flatnonzero(mask))
@@ -0,0 +1,282 @@
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Name of the column added by `bin_points`, counting the original points
+# aggregated into each returned point.
+POINTS_COLUMN = "points"
+
+# Name of the column with number of values per bin, added by `histogram_counts`
+# and `histogram2d_counts`.
+COUNT_COLUMN = "count"
+
+# Number of evenly spaced quantiles representing each group in `quantile_sketch`.
+# One less than a multiple of four, such that the quartiles are exact.
+SKETCH_QUANTILES = 401
+
+
+def lttb_indices(x_values: np.ndarray, y_values: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets downsampling of a line, given by `x_values`
+    (assumed sorted) and `y_values`. Returns the indices of the `n_out` points keeping
+    the visual shape of the line best (always including the first and last point).
+
+    In order to vectorize over all buckets, the triangle in each bucket is anchored
+    in the mean of the previous bucket, instead of the previously selected point.
+    """
+    n_in = len(x_values)
+    if n_out >= n_in or n_out < 3:
+        return np.arange(n_in)
+
+    points = np.column_stack((x_values, y_values)).astype(np.float64)
+
+    # The first and last point are kept, the rest is divided into n_out - 2 buckets
+    edges = np.linspace(1, n_in - 1, n_out - 1).astype(np.int64)
+    sizes = np.diff(edges)
+
+    # Mean of each bucket, with the first and last point as (single point) buckets
+    buckets = np.concatenate(
+        (
+            points[:1],
+            np.add.reduceat(points[:-1], edges[:-1], axis=0) / sizes[:, np.newaxis],
+            points[-1:],
+        )
+    )
+    previous = np.repeat(buckets[:-2], sizes, axis=0)
+    following = np.repeat(buckets[2:], sizes, axis=0)
+    inner = points[1:-1]
+
+    areas = np.nan_to_num(
+        np.abs(
+            (previous[:, 0] - following[:, 0]) * (inner[:, 1] - previous[:, 1])
+            - (previous[:, 0] - inner[:, 0]) * (following[:, 1] - previous[:, 1])
+        ),
+        nan=-1,
+    )
+
+    # First index of the largest area within each bucket
+    candidates = np.flatnonzero(
+        areas == np.repeat(np.maximum.reduceat(areas, edges[:-1] - 1), sizes)
+    )
+    _, first = np.unique(
+        np.repeat(np.arange(len(sizes)), sizes)[candidates], return_index=True
+    )
+
+    return np.concatenate(([0], candidates[first] + 1, [n_in - 1]))
+
+
+def downsample_lines(
+    dframe: pd.DataFrame,
+    x_column: str,
+    y_column: str,
+    group_columns: List[str],
+    max_points: int,
+) -> pd.DataFrame:
+    """Downsamples each line (unique combination of `group_columns`) in the
+    dataframe with LTTB, such that the total number of points is approximately
+    `max_points`. Each line is sorted by `x_column`.
+    """
+    ratio = max_points / len(dframe)
+    frames = []
+    groups = (
+        dframe.groupby(group_columns, sort=False, observed=True)
+        if group_columns
+        else [(None, dframe)]
+    )
+    for _, line in groups:
+        line = line.sort_values(x_column, kind="stable")
+        frames.append(
+            line.take(
+                lttb_indices(
+                    _numeric_values(line[x_column]),
+                    _numeric_values(line[y_column]),
+                    max(3, int(len(line) * ratio)),
+                )
+            )
+        )
+    return pd.concat(frames)
+
+
+def bin_points(
+    dframe: pd.DataFrame,
+    x_column: str,
+    y_column: str,
+    group_columns: List[str],
+    mean_columns: List[str],
+    max_points: int,
+) -> Optional[pd.DataFrame]:
+    """Aggregates scattered points into a regular 2D grid (per unique combination
+    of `group_columns`), such that the total number of points is at most
+    approximately `max_points`. Each non-empty bin is represented by one point
+    at the mean position of the points within the bin, the mean of `mean_columns`,
+    and the number of points in the column `POINTS_COLUMN`.
+
+    Returns `None` if `x_column` or `y_column` is not numeric.
+    """
+    position_columns = [x_column, y_column]
+    if not all(
+        pd.api.types.is_numeric_dtype(dframe[column]) for column in position_columns
+    ):
+        return None
+
+    group_columns = [
+        column for column in group_columns if column not in position_columns
+    ]
+    n_groups = dframe.groupby(group_columns).ngroups if group_columns else 1
+    n_bins = max(10, int(np.sqrt(max_points / n_groups)))
+
+    binned = dframe.groupby(
+        group_columns
+        + [_bin_numbers(dframe[column], n_bins) for column in position_columns],
+        sort=False,
+        observed=True,
+        dropna=True,
+    )
+    result = binned.agg(
+        {
+            column: "mean"
+            for column in position_columns + mean_columns
+            if column not in group_columns
+        }
+    )
+    result[POINTS_COLUMN] = binned.size()
+
+    if group_columns:
+        result = result.reset_index(level=group_columns)
+    return result.reset_index(drop=True)
+
+
+def histogram_counts(
+    dframe: pd.DataFrame, x_column: str, group_columns: List[str], n_bins: int = 100
+) -> Tuple[pd.DataFrame, Optional[np.ndarray]]:
+    """Counts the values in `x_column` per bin (or per unique value, if not
+    numeric) and unique combination of `group_columns`. The bins are shared
+    by all groups. Returns the counts, with `x_column` being the bin centers,
+    together with the bin edges (`None` if not numeric).
+    """
+    group_columns = [column for column in group_columns if column != x_column]
+
+    edges = None
+    series = dframe[x_column]
+    if _is_continuous(series):
+        series, edges = _bin_centers(series, n_bins)
+
+    counts = (
+        dframe.groupby(group_columns + [series], sort=False, observed=True)
+        .size()
+        .rename(COUNT_COLUMN)
+        .reset_index()
+    )
+    return counts, edges
+
+
+def histogram2d_counts(
+    dframe: pd.DataFrame,
+    x_column: str,
+    y_column: str,
+    group_columns: List[str],
+    n_bins: int = 100,
+) -> Optional[Tuple[pd.DataFrame, np.ndarray, np.ndarray]]:
+    """Two dimensional version of `histogram_counts`. Returns the counts
+    together with the bin edges along x and y, or `None` if `x_column` or
+    `y_column` is not numeric.
+    """
+    if not _is_continuous(dframe[x_column]) or not _is_continuous(dframe[y_column]):
+        return None
+
+    group_columns = [
+        column for column in group_columns if column not in (x_column, y_column)
+    ]
+    x_centers, x_edges = _bin_centers(dframe[x_column], n_bins)
+    y_centers, y_edges = _bin_centers(dframe[y_column], n_bins)
+
+    counts = (
+        dframe.groupby(
+            group_columns + [x_centers, y_centers], sort=False, observed=True
+        )
+        .size()
+        .rename(COUNT_COLUMN)
+        .reset_index()
+    )
+    return counts, x_edges, y_edges
+
+
+def quantile_sketch(
+    dframe: pd.DataFrame, value_column: str, group_columns: List[str]
+) -> Optional[pd.DataFrame]:
+    """Represents the values in `value_column`, per unique combination of
+    `group_columns`, by `SKETCH_QUANTILES` evenly spaced quantiles (including
+    minimum, quartiles and maximum). Distribution plots (e.g. box and violin
+    plots) of the returned dataframe are visually very close to those of the
+    full dataframe.
+
+    Returns `None` if `value_column` is not numeric, or if the sketch would
+    not be smaller than the original data.
+    """
+    if not _is_continuous(dframe[value_column]):
+        return None
+
+    quantiles = np.linspace(0, 1, SKETCH_QUANTILES)
+    group_columns = [column for column in group_columns if column != value_column]
+    if not group_columns:
+        if SKETCH_QUANTILES >= len(dframe):
+            return None
+        return pd.DataFrame(
+            {value_column: dframe[value_column].quantile(quantiles).to_numpy()}
+        )
+
+    grouped = dframe.groupby(group_columns, sort=False, observed=True)
+    if grouped.ngroups * SKETCH_QUANTILES >= len(dframe):
+        return None
+
+    return (
+        grouped[value_column]
+        .quantile(quantiles)
+        .reset_index(level=group_columns)
+        .reset_index(drop=True)
+    )
+
+
+def _is_continuous(series: pd.Series) -> bool:
+    return pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(
+        series
+    )
+
+
+def _bin_centers(series: pd.Series, n_bins: int) -> Tuple[pd.Series, np.ndarray]:
+    """Replaces each value with the center of its bin, for `n_bins` equally
+    sized bins between the minimum and maximum value."""
+    values = series.to_numpy(dtype=np.float64)
+    edges = np.histogram_bin_edges(values[~np.isnan(values)], bins=n_bins)
+    bin_numbers = np.clip(
+        np.searchsorted(edges, values, side="right") - 1, 0, n_bins - 1
+    )
+    centers = (edges[:-1] + edges[1:]) / 2
+    return (
+        pd.Series(
+            np.where(np.isnan(values), np.nan, centers[bin_numbers]),
+            index=series.index,
+            name=series.name,
+        ),
+        edges,
+    )
+
+
+def _bin_numbers(series: pd.Series, n_bins: int) -> pd.Series:
+    values = series.to_numpy(dtype=np.float64)
+    minimum, maximum = np.nanmin(values), np.nanmax(values)
+    scale = (n_bins - 1) / (maximum - minimum) if maximum > minimum else 0
+    return pd.Series(
+        np.floor((values - minimum) * scale),
+        index=series.index,
+        name=f"{series.name} bin",
+    )
+
+
+def _numeric_values(series: pd.Series) -> np.ndarray:
+    if pd.api.types.is_numeric_dtype(series):
+        return series.to_numpy(dtype=np.float64)
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series.to_numpy().astype(np.int64).astype(np.float64)
+    # Categorical values are equally spaced along the axis
+    return np.arange(len(series), dtype=np.float64)
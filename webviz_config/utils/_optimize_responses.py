@@ -0,0 +1,141 @@
+import gzip
+from typing import Dict, Tuple
+
+import flask
+
+try:
+    import brotli
+
+    BROTLI_INSTALLED = True
+except ModuleNotFoundError:
+    BROTLI_INSTALLED = False
+
+COMPRESSIBLE_MIMETYPES = {
+    "application/javascript",
+    "application/json",
+    "image/svg+xml",
+    "text/css",
+    "text/csv",
+    "text/html",
+    "text/javascript",
+    "text/markdown",
+    "text/plain",
+}
+
+# Dash endpoints with responses only depending on the (static) app configuration
+CONDITIONAL_ENDPOINTS = ("/_dash-layout", "/_dash-dependencies")
+
+# Static routes where a fingerprint query parameter (Dash uses "m" for its
+# assets, WebvizAssets uses "v") means the response will never change
+FINGERPRINTED_ROUTES = ("/assets/", "/temp/")
+FINGERPRINT_QUERY_PARAMETERS = ("m", "v")
+
+# Routes serving static files, of which the compressed content is cached
+STATIC_ROUTES = ("/_dash-component-suites/", "/assets/", "/temp/")
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def optimize_responses(
+    server: flask.Flask, minimum_size: int = 500, compress_level: int = 6
+) -> None:
+    """Registers an after request hook on the Flask server which:
+
+    - Adds a weak ETag to the Dash layout and dependencies responses, and replies
+      with 304 Not Modified if the browser already has the same version.
+    - Sets long lived immutable cache headers on fingerprinted static assets.
+    - Compresses responses larger than `minimum_size` bytes with brotli (if the
+      optional dependency `brotli` is installed and the browser accepts it)
+      or gzip. Callback responses (e.g. figures and table data) are typically
+      JSON which compresses very well. Static files (e.g. the Dash JavaScript
+      bundles) are only compressed once per path, version and encoding.
+      Strong ETags are made specific to the encoding.
+    """
+    # Compressed static files by (path and query, ETag, encoding)
+    compressed_static_files: Dict[Tuple[str, str, str], bytes] = {}
+
+    @server.after_request
+    def _optimize_response(response: flask.wrappers.Response) -> flask.Response:
+        request = flask.request
+
+        if response.status_code != 200:
+            return response
+
+        if request.path.startswith(FINGERPRINTED_ROUTES) and any(
+            parameter in request.args for parameter in FINGERPRINT_QUERY_PARAMETERS
+        ):
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+
+        if request.path.endswith(CONDITIONAL_ENDPOINTS) and request.method == "GET":
+            # The ETag is based on the uncompressed content, and is therefore weak.
+            response.add_etag(weak=True)
+            response.make_conditional(request)
+            if response.status_code != 200:
+                return response
+
+        return _compress(
+            response, minimum_size, compress_level, compressed_static_files
+        )
+
+
+def _compress(
+    response: flask.Response,
+    minimum_size: int,
+    compress_level: int,
+    compressed_static_files: Dict[Tuple[str, str, str], bytes],
+) -> flask.Response:
+    # Streamed responses (e.g. data downloads) should not be buffered here
+    if response.is_streamed and not response.direct_passthrough:
+        return response
+
+    if (
+        response.mimetype not in COMPRESSIBLE_MIMETYPES
+        or "Content-Encoding" in response.headers
+        or (
+            response.content_length is not None
+            and response.content_length < minimum_size
+        )
+    ):
+        return response
+
+    accepted_encodings = flask.request.accept_encodings
+    if BROTLI_INSTALLED and accepted_encodings["br"]:
+        encoding = "br"
+    elif accepted_encodings["gzip"]:
+        encoding = "gzip"
+    else:
+        return response
+
+    etag, weak = response.get_etag()
+    cache_key = None
+    if flask.request.path.startswith(STATIC_ROUTES):
+        cache_key = (flask.request.full_path, etag or "", encoding)
+
+    if cache_key in compressed_static_files:
+        if hasattr(response.response, "close"):
+            response.call_on_close(response.response.close)
+        response.direct_passthrough = False
+        response.set_data(compressed_static_files[cache_key])
+    else:
+        # Static files (e.g. JavaScript and CSS assets) are by default streamed
+        response.direct_passthrough = False
+        data = response.get_data()
+        if len(data) < minimum_size:
+            return response
+        response.set_data(
+            brotli.compress(data, quality=min(compress_level, 11))
+            if encoding == "br"
+            else gzip.compress(data, compresslevel=compress_level)
+        )
+        if cache_key is not None:
+            compressed_static_files[cache_key] = response.get_data()
+
+    response.headers["Content-Encoding"] = encoding
+    response.vary.add("Accept-Encoding")
+
+    if etag is not None and not weak:
+        # A strong ETag must differ between the encoded and unencoded content
+        response.set_etag(f"{etag}-{encoding}")
+        response.make_conditional(flask.request)
+
+    return response
@@ -1,9 +1,15 @@
+import atexit
+import collections
 import logging
 import os
 import platform
 import pwd
+import queue
+import random
+import threading
+import time
 from importlib.metadata import entry_points, version
-from typing import Optional
+from typing import Counter, Optional, Tuple
 
 from azure.monitor.opentelemetry.exporter import AzureMonitorLogExporter
 from opentelemetry._logs import set_logger_provider
@@ -23,21 +29,130 @@ _LOGGING_CONN_STRING_ENTRYPOINT_NAME = "webviz-azure-logging-connection-string"
 
 
 class UsageAnalytics:
-    def __init__(self, telemetry_logger: logging.Logger, user_name: str) -> None:
+    """Plugin usage is put on a bounded in-memory queue, which is drained by a
+    background thread. The thread counts usage per (page, plugin, user), and
+    emits the counts once every `flush_interval` seconds. Logging usage
+    therefore never adds latency to the request thread.
+
+    Only a fraction `sample_rate` of the usage is recorded. Usage which does
+    not fit in the queue is dropped. Both are counted, and the number of
+    dropped events is emitted together with the usage counts.
+    """
+
+    def __init__(
+        self,
+        telemetry_logger: logging.Logger,
+        user_name: str,
+        flush_interval: float = 60,
+        sample_rate: float = 1,
+        max_queue_size: int = 10000,
+    ) -> None:
         self._telemetry_logger = telemetry_logger
         self._user_name = user_name
+        self._flush_interval = flush_interval
+        self._sample_rate = sample_rate
+        self._queue: "queue.Queue[Optional[Tuple[str, str]]]" = queue.Queue(
+            maxsize=max_queue_size
+        )
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self._closed = threading.Event()
+        self.sampled_out_events = 0
+        self.dropped_events = 0
+        self._emitted_dropped_events = 0
 
     def log_plugin_usage(self, path_name: str, plugin_name: str) -> None:
-        log_msg = f"PLUGIN_USAGE - plugin_name={plugin_name}, user_name={self._user_name}, path_name={path_name}"
-        # print(f"log_plugin_usage(): {log_msg}")
+        if self._sample_rate < 1 and random.random() >= self._sample_rate:
+            self.sampled_out_events += 1
+            return
+
+        if self._thread is None:
+            self._start()
+
+        try:
+            self._queue.put_nowait((path_name, plugin_name))
+        except queue.Full:
+            self.dropped_events += 1
+
+    def close(self) -> None:
+        """Stops the background thread, after emitting all queued usage."""
+        self._closed.set()
+        with self._thread_lock:
+            if self._thread is None:
+                return
+        try:
+            self._queue.put_nowait(None)
+        except queue.Full:
+            # The thread is not waiting for more usage, and will see it is closed
+            pass
+        self._thread.join()
+
+    def _start(self) -> None:
+        # The thread is started on first use, such that it is started in
+        # each process if the application is forked (e.g. by uwsgi).
+        with self._thread_lock:
+            if self._thread is None and not self._closed.is_set():
+                self._thread = threading.Thread(
+                    target=self._run, name="webviz-usage-analytics", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _run(self) -> None:
+        while True:
+            counts = self._aggregate(time.monotonic() + self._flush_interval)
+            if self._closed.is_set():
+                break
+            self._emit(counts)
+
+        # Include what remains in the queue when closed
+        while True:
+            try:
+                usage = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if usage is not None:
+                counts[usage] += 1
+        self._emit(counts)
+
+    def _aggregate(self, deadline: float) -> Counter[Tuple[str, str]]:
+        counts: Counter[Tuple[str, str]] = collections.Counter()
+        while not self._closed.is_set():
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                usage = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if usage is not None:
+                counts[usage] += 1
+        return counts
+
+    def _emit(self, counts: Counter[Tuple[str, str]]) -> None:
+        for (path_name, plugin_name), count in counts.items():
+            log_msg = f"PLUGIN_USAGE - plugin_name={plugin_name}, user_name={self._user_name}, path_name={path_name}, count={count}"
+
+            extra = {
+                "wv_plugin_name": plugin_name,
+                "wv_user_name": self._user_name,
+                "wv_path_name": path_name,
+                "wv_count": count,
+                "wv_sample_rate": self._sample_rate,
+            }
 
-        extra = {
-            "wv_plugin_name": plugin_name,
-            "wv_user_name": self._user_name,
-            "wv_path_name": path_name,
-        }
+            self._telemetry_logger.info(log_msg, extra=extra)
 
-        self._telemetry_logger.info(log_msg, extra=extra)
+        dropped_events = self.dropped_events - self._emitted_dropped_events
+        if dropped_events:
+            self._emitted_dropped_events += dropped_events
+            self._telemetry_logger.warning(
+                f"PLUGIN_USAGE_DROPPED - user_name={self._user_name}, dropped_events={dropped_events}",
+                extra={
+                    "wv_user_name": self._user_name,
+                    "wv_dropped_events": dropped_events,
+                },
+            )
 
 
 def setup_usage_analytics() -> Optional[UsageAnalytics]:
@@ -107,7 +222,12 @@ def setup_usage_analytics() -> Optional[UsageAnalytics]:
         )
         return None
 
-    return UsageAnalytics(telemetry_logger=telemetry_py_logger, user_name=username)
+    return UsageAnalytics(
+        telemetry_logger=telemetry_py_logger,
+        user_name=username,
+        flush_interval=_get_float_env("WEBVIZ_USAGE_ANALYTICS_FLUSH_INTERVAL", 60),
+        sample_rate=_get_float_env("WEBVIZ_USAGE_ANALYTICS_SAMPLE_RATE", 1),
+    )
 
 
 def _get_connection_string_from_entrypoint() -> Optional[str]:
@@ -169,3 +289,15 @@ def _get_bool_env(name: str) -> bool:
         return False
 
     return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _get_float_env(name: str, default: float) -> float:
+    value = os.getenv(name)
+    if value is None:
+        return default
+
+    try:
+        return float(value)
+    except ValueError:
+        print(f"Invalid value '{value}' of {name}, defaulting to {default}.")
+        return default
@@ -1,12 +1,24 @@
+import os
 import re
+import sys
+import json
 import shutil
+import hashlib
 import pathlib
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
 
 from tqdm import tqdm
 from dash import Dash
 import flask
 
+if sys.platform == "linux":
+    import fcntl
+
+    # ioctl request cloning a file (i.e. a copy-on-write copy) on file systems
+    # supporting it (e.g. btrfs and xfs)
+    FICLONE = 0x40049409
+
 
 class WebvizAssets:
     """Dash applications by default host static resources from a folder called
@@ -30,11 +42,34 @@ class WebvizAssets:
     In both portable and non-portable mode, WebvizAssets makes sure there are
     no name conflicts (i.e. it supports multiple assets on different paths,
     but with same filename) and also assignes URI friendly resource IDs.
+
+    The returned URIs are fingerprinted with a hash of the file content, such that
+    the browser can cache them indefinitely (a changed file gets a new URI).
+    Files with identical content (e.g. the same image used by several plugins,
+    but from different paths) are only hosted, and copied, once. In portable
+    mode, the copied files are named by their content hash.
     """
 
+    # Name of the query parameter used for fingerprinting asset URIs
+    FINGERPRINT_QUERY_PARAMETER = "v"
+
+    # Name of the file (next to the portable asset folder) mapping the paths
+    # of the added assets to the names of their portable copies
+    MANIFEST_FILENAME = "assets_manifest.json"
+
     def __init__(self) -> None:
-        self._assets: dict = {}
+        # Asset id -> path of the file served
+        self._assets: Dict[str, pathlib.Path] = {}
+        # Absolute path of each added file -> asset id
+        self._ids_by_path: Dict[pathlib.Path, str] = {}
+        # Content hash (and file suffix) -> asset id
+        self._ids_by_content: Dict[str, str] = {}
+        # Asset id -> content hash
+        self._hashes: Dict[str, str] = {}
+        # Portable mode: absolute path of each asset -> portable file name and hash
+        self._manifest: Optional[Dict[str, Dict[str, str]]] = None
         self._portable = False
+        self._portable_folder = pathlib.Path("resources") / "assets"
 
     @property
     def portable(self) -> bool:
@@ -44,6 +79,15 @@ class WebvizAssets:
     def portable(self, portable: bool) -> None:
         self._portable = portable
 
+    @property
+    def portable_folder(self) -> pathlib.Path:
+        return self._portable_folder
+
+    @portable_folder.setter
+    def portable_folder(self, portable_folder: pathlib.Path) -> None:
+        """Folder where assets are served from in portable mode."""
+        self._portable_folder = portable_folder
+
     def _base_folder(self) -> str:
         return "assets" if self.portable else "temp"
 
@@ -61,15 +105,54 @@ class WebvizAssets:
         both in non-portable and portable mode.
         """
 
-        path = pathlib.Path(filename)
+        path = pathlib.Path(os.path.abspath(filename))
 
-        if filename not in self._assets.values():
-            assigned_id = self._generate_id(path.name)
-            self._assets[assigned_id] = filename
+        if self.portable:
+            portable_asset = self._portable_manifest().get(str(path))
+            if portable_asset is not None:
+                return self._uri(portable_asset["name"], portable_asset["hash"])
+
+        asset_id = self._ids_by_path.get(path)
+        if asset_id is None:
+            asset_id = self._register(path)
+
+        return self._uri(asset_id, self._hashes.get(asset_id))
+
+    def _register(self, path: pathlib.Path) -> str:
+        """Assigns an asset id to the file, reusing the id of an already added
+        file with the same content. Files which can not be read (yet) are not
+        deduplicated."""
+        try:
+            content_hash: Optional[str] = _content_hash(path)
+        except OSError:
+            content_hash = None
+
+        content_key = f"{content_hash}{path.suffix.lower()}"
+        if content_hash is not None and content_key in self._ids_by_content:
+            asset_id = self._ids_by_content[content_key]
         else:
-            assigned_id = {v: k for k, v in self._assets.items()}[filename]
+            asset_id = self._generate_id(path.name)
+            self._assets[asset_id] = path
+            if content_hash is not None:
+                self._hashes[asset_id] = content_hash
+                self._ids_by_content[content_key] = asset_id
 
-        return str(pathlib.Path(self._base_folder()) / assigned_id)
+        self._ids_by_path[path] = asset_id
+        return asset_id
+
+    def _uri(self, name: str, content_hash: Optional[str]) -> str:
+        uri = str(pathlib.Path(self._base_folder()) / name)
+        if content_hash is None:
+            return uri
+        return f"{uri}?{WebvizAssets.FINGERPRINT_QUERY_PARAMETER}={content_hash[:12]}"
+
+    def _portable_manifest(self) -> Dict[str, Dict[str, str]]:
+        if self._manifest is None:
+            manifest_path = self._portable_folder.parent / self.MANIFEST_FILENAME
+            self._manifest = (
+                json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+            )
+        return self._manifest
 
     def directly_host_assets(self, app: Dash) -> None:
         """In non-portable mode, this function can be called by the
@@ -103,20 +186,42 @@ class WebvizAssets:
                 )
 
     def make_portable(self, asset_folder: pathlib.Path) -> None:
-        """Copy over all added assets to the given folder (asset_folder)."""
+        """Copy over all added assets to the given folder (asset_folder), named
+        by their content hash. Files already present in the folder (i.e. with
+        the same content) are not copied again. The mapping from the added paths
+        to the copied files is written to MANIFEST_FILENAME next to the folder.
+        """
+
+        manifest = {}
+        copies = {}
+        for path, asset_id in self._ids_by_path.items():
+            if asset_id not in self._hashes:
+                # Not readable when added, fails here if still not readable
+                self._hashes[asset_id] = _content_hash(self._assets[asset_id])
+            content_hash = self._hashes[asset_id]
+            name = _portable_name(self._assets[asset_id], content_hash)
+            manifest[str(path)] = {"name": name, "hash": content_hash}
+            if not (asset_folder / name).exists():
+                copies[name] = self._assets[asset_id]
 
-        for assigned_id, filename in tqdm(
-            self._assets.items(),
-            bar_format="{l_bar} {bar} | Copied {n_fmt}/{total_fmt}",
-        ):
-            tqdm.write(f"Copying over {filename}")
-            shutil.copyfile(filename, asset_folder / assigned_id)
+        asset_folder.mkdir(parents=True, exist_ok=True)
+        with ThreadPoolExecutor() as executor:
+            for _ in tqdm(
+                executor.map(
+                    lambda name: _copy_file(copies[name], asset_folder / name), copies
+                ),
+                total=len(copies),
+                bar_format="{l_bar} {bar} | Copied {n_fmt}/{total_fmt}",
+            ):
+                pass
+
+        (asset_folder.parent / self.MANIFEST_FILENAME).write_text(
+            json.dumps(manifest, indent=4)
+        )
 
     def _generate_id(self, filename: str) -> str:
         """From the filename, create a safe resource id not already present"""
-        asset_id = base_id = re.sub(
-            "[^-a-z0-9._]+", "", filename.lower().replace(" ", "_")
-        )
+        asset_id = base_id = _safe_filename(filename)
 
         count = 1
         while asset_id in self._assets:
@@ -126,4 +231,47 @@ class WebvizAssets:
         return asset_id
 
 
+def _safe_filename(filename: str) -> str:
+    return re.sub("[^-a-z0-9._]+", "", filename.lower().replace(" ", "_"))
+
+
+def _content_hash(path: pathlib.Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file_handle:
+        for chunk in iter(lambda: file_handle.read(2**20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _portable_name(path: pathlib.Path, content_hash: str) -> str:
+    """The file name is kept as prefix, such that e.g. the (alphabetical) load
+    order of stylesheets is kept."""
+    stem, suffix = os.path.splitext(_safe_filename(path.name))
+    return f"{stem}.{content_hash[:16]}{suffix}"
+
+
+def _copy_file(source: pathlib.Path, target: pathlib.Path) -> None:
+    """Copies the file, as a copy-on-write clone if supported by the file
+    system. Hardlinks are not used, as the source could later be modified in
+    place, changing the content of the (content hash named) copy. The file is
+    written under a temporary name first, such that an interrupted copy is not
+    mistaken for a complete one later."""
+    temporary_target = target.with_name(f"{target.name}.tmp")
+    if not _clone_file(source, temporary_target):
+        shutil.copyfile(source, temporary_target)
+    os.replace(temporary_target, target)
+
+
+def _clone_file(source: pathlib.Path, target: pathlib.Path) -> bool:
+    if sys.platform != "linux":
+        return False
+    try:
+        with open(source, "rb") as source_handle, open(target, "wb") as target_handle:
+            fcntl.ioctl(target_handle.fileno(), FICLONE, source_handle.fileno())
+    except OSError:
+        # E.g. not supported by the file system, or across file systems
+        return False
+    return True
+
+
 WEBVIZ_ASSETS = WebvizAssets()
@@ -0,0 +1,210 @@
+import logging
+import os
+import pathlib
+import threading
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+import pandas as pd
+
+from ._shared_settings_subscriptions import SHARED_SETTINGS_SUBSCRIPTIONS
+from .webviz_store import webvizstore
+
+# Options applied by `WebvizDatasets.get()` to the dataframe after reading it.
+# All other options are given as keyword arguments to `pandas.read_csv`.
+#   * categorical_max_cardinality: String columns with at most this many unique
+#     values are converted to the categorical dtype.
+#   * arrow_strings: If `True`, (remaining) string columns are converted to the
+#     Arrow backed string dtype.
+CONVERSION_OPTIONS = ("categorical_max_cardinality", "arrow_strings")
+
+
+class DatasetMemory(NamedTuple):
+    csv_file: str
+    rows: int
+    columns: int
+    # Memory usage (in bytes) as read from file, and after applying
+    # the conversion options
+    read_bytes: int
+    bytes: int
+
+    @property
+    def saved_bytes(self) -> int:
+        return self.read_bytes - self.bytes
+
+
+class WebvizDatasets:
+    """Registry of tabular datasets read from file, such that all plugins
+    using the same file (with the same options) share one in-memory
+    dataframe, instead of each plugin parsing and holding its own copy.
+
+    Datasets are identified by the normalized absolute path of the file,
+    together with the options. Options are either keyword arguments to
+    `pandas.read_csv` (e.g. `dtype`, `usecols` or `engine="pyarrow"` for
+    multithreaded parsing), or one of `CONVERSION_OPTIONS`.
+    The file is read the first time a dataset is requested. In portable
+    builds, each dataset is stored once through `@webvizstore` (see
+    `webvizstore_arguments()`).
+
+    Each call returns a shallow copy of the dataframe, sharing the column
+    data but not e.g. the set of columns, such that plugins can add, drop or
+    rename columns without affecting each other. With copy-on-write (the
+    default from pandas 3.0) the column data is copied before it is modified
+    in place, i.e. the shared data is read-only. With older pandas versions,
+    values must not be modified in place.
+    """
+
+    def __init__(self) -> None:
+        self._datasets: Dict[Tuple[str, str], pd.DataFrame] = {}
+        self._memory: Dict[Tuple[str, str], DatasetMemory] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalized_path(csv_file: os.PathLike) -> pathlib.Path:
+        # Symbolic links are not resolved, such that the same path
+        # is given both when building and running portable apps.
+        return pathlib.Path(os.path.normpath(os.path.abspath(csv_file)))
+
+    @staticmethod
+    def key(csv_file: os.PathLike, **options: Any) -> Tuple[str, str]:
+        return (
+            str(WebvizDatasets.normalized_path(csv_file)),
+            repr(sorted(options.items())),
+        )
+
+    def get(self, csv_file: os.PathLike, **options: Any) -> pd.DataFrame:
+        key = WebvizDatasets.key(csv_file, **options)
+        with self._lock:
+            if key not in self._datasets:
+                dframe = read_csv(
+                    WebvizDatasets.normalized_path(csv_file),
+                    _read_options(options),
+                )
+                read_bytes = int(dframe.memory_usage(deep=True).sum())
+                dframe = convert_dtypes(
+                    dframe,
+                    categorical_max_cardinality=options.get(
+                        "categorical_max_cardinality"
+                    ),
+                    arrow_strings=options.get("arrow_strings", False),
+                )
+                memory = DatasetMemory(
+                    csv_file=key[0],
+                    rows=len(dframe),
+                    columns=len(dframe.columns),
+                    read_bytes=read_bytes,
+                    bytes=int(dframe.memory_usage(deep=True).sum()),
+                )
+                if memory.saved_bytes:
+                    logging.getLogger(__name__).info(
+                        "Converting column types of %s reduced memory usage "
+                        "from %.1f MB to %.1f MB",
+                        memory.csv_file,
+                        memory.read_bytes / 1e6,
+                        memory.bytes / 1e6,
+                    )
+                self._datasets[key] = dframe
+                self._memory[key] = memory
+            return self._datasets[key].copy(deep=False)
+
+    def memory_report(self) -> List[DatasetMemory]:
+        """Returns the memory usage of each dataset read so far."""
+        with self._lock:
+            return list(self._memory.values())
+
+    @staticmethod
+    def webvizstore_arguments(
+        csv_file: os.PathLike, **options: Any
+    ) -> Tuple[Any, list]:
+        """Returns the entry to include in a plugin's `add_webvizstore()`
+        in order to store the dataset in portable builds."""
+        return (
+            read_csv,
+            [
+                {
+                    "csv_file": WebvizDatasets.normalized_path(csv_file),
+                    "read_options": _read_options(options),
+                }
+            ],
+        )
+
+    @staticmethod
+    def options(
+        shared_settings: Optional[Mapping[str, Any]], options: Optional[dict]
+    ) -> Dict[str, Any]:
+        """Returns the options given as plugin argument, on top of the default
+        options given in `shared_settings` under the key `csv_options`."""
+        defaults = (shared_settings or {}).get("csv_options") or {}
+        return {**defaults, **(options or {})}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._datasets.clear()
+            self._memory.clear()
+
+
+@SHARED_SETTINGS_SUBSCRIPTIONS.subscribe("csv_options")
+def check_csv_options(csv_options: Optional[dict]) -> dict:
+    if csv_options is None:
+        return {}
+    if not isinstance(csv_options, dict):
+        raise ValueError(
+            "csv_options in shared_settings must be a mapping of options "
+            f"to pandas.read_csv, got {csv_options!r}"
+        )
+    max_cardinality = csv_options.get("categorical_max_cardinality")
+    if max_cardinality is not None and (
+        not isinstance(max_cardinality, int) or max_cardinality < 1
+    ):
+        raise ValueError(
+            "categorical_max_cardinality in csv_options must be a positive "
+            f"integer, got {max_cardinality!r}"
+        )
+    return csv_options
+
+
+def convert_dtypes(
+    dframe: pd.DataFrame,
+    categorical_max_cardinality: Optional[int] = None,
+    arrow_strings: bool = False,
+) -> pd.DataFrame:
+    """Converts string columns with at most `categorical_max_cardinality`
+    unique values to the categorical dtype, and (if `arrow_strings` is `True`)
+    the other string columns to the Arrow backed string dtype. Numerical and
+    other columns are left as is.
+    """
+    conversions = {}
+    for column in dframe.columns:
+        series = dframe[column]
+        if isinstance(
+            series.dtype, pd.CategoricalDtype
+        ) or not pd.api.types.is_string_dtype(series):
+            continue
+        if (
+            categorical_max_cardinality is not None
+            and series.nunique() <= categorical_max_cardinality
+        ):
+            conversions[column] = "category"
+        elif arrow_strings and not (
+            isinstance(series.dtype, pd.StringDtype)
+            and series.dtype.storage == "pyarrow"
+        ):
+            conversions[column] = "string[pyarrow]"
+    return dframe.astype(conversions) if conversions else dframe
+
+
+def _read_options(options: Mapping[str, Any]) -> tuple:
+    return tuple(
+        sorted(
+            (name, value)
+            for name, value in options.items()
+            if name not in CONVERSION_OPTIONS
+        )
+    )
+
+
+@webvizstore
+def read_csv(csv_file: pathlib.Path, read_options: tuple = ()) -> pd.DataFrame:
+    return pd.read_csv(csv_file, **dict(read_options))
+
+
+WEBVIZ_DATASETS = WebvizDatasets()
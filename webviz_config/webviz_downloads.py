@@ -0,0 +1,170 @@
+import io
+import zlib
+import secrets
+import zipfile
+import pathlib
+from typing import Callable, Dict, Iterator, List, Union
+
+import flask
+import pandas as pd
+import pyarrow
+import pyarrow.parquet
+from itsdangerous import BadSignature, URLSafeTimedSerializer
+
+# A download provider returns either a dataframe (downloaded as .csv or .parquet
+# depending on the requested filename) or a list of zip file members (downloaded
+# as a .zip archive). The list members have the same format as ZipFileMember.
+DownloadData = Union[pd.DataFrame, List[Dict[str, str]]]
+
+MIME_TYPES = {
+    ".csv": "text/csv",
+    ".parquet": "application/vnd.apache.parquet",
+    ".zip": "application/zip",
+}
+
+
+class WebvizDownloads:
+    """Facilitates streaming of (potentially large) data downloads directly from
+    a Flask route, instead of returning the whole file base64 encoded through a
+    Dash callback.
+
+    Plugins register a download provider (a function returning the data to
+    download) with a unique provider id. Since plugins are initialized in the
+    same way in all workers, the provider id is the same across workers.
+
+    The download URLs created by `url()` are signed with the application secret
+    key and only valid for `max_age` seconds. The data is first created when the
+    URL is requested, and then streamed in chunks to the browser.
+    """
+
+    ROUTE = "/webviz-download"
+
+    def __init__(self, max_age: int = 60, chunk_size: int = 50000) -> None:
+        self._providers: Dict[str, Callable[[], DownloadData]] = {}
+        self._max_age = max_age
+        self._chunk_size = chunk_size
+        self._fallback_secret = secrets.token_urlsafe(nbytes=64)
+
+    def add(self, provider_id: str, provider: Callable[[], DownloadData]) -> None:
+        self._providers[provider_id] = provider
+
+    def url(self, provider_id: str, filename: str, compress: bool = False) -> str:
+        """Returns a short lived URL which the browser can use in order to download
+        the data from the given provider. Needs to be called within a request
+        context (e.g. in a callback).
+        """
+        if provider_id not in self._providers:
+            raise LookupError(f"No download provider with id '{provider_id}'")
+
+        if pathlib.Path(filename).suffix not in MIME_TYPES:
+            raise ValueError(
+                f"Unsupported download file type '{filename}'. "
+                f"Supported file types are {list(MIME_TYPES)}."
+            )
+
+        token = self._serializer().dumps(
+            {"provider_id": provider_id, "filename": filename, "compress": compress}
+        )
+        return flask.url_for("_webviz_download", token=token)
+
+    def register_route(self, server: flask.Flask) -> None:
+        @server.route(f"{WebvizDownloads.ROUTE}/<token>")
+        def _webviz_download(token: str) -> flask.Response:
+            try:
+                payload = self._serializer().loads(token, max_age=self._max_age)
+            except BadSignature:
+                flask.abort(403)
+
+            provider = self._providers.get(payload["provider_id"])
+            if provider is None:
+                flask.abort(404)
+
+            filename = payload["filename"]
+            suffix = pathlib.Path(filename).suffix
+            data = provider()
+
+            if suffix == ".zip":
+                chunks = self._stream_zip(data)
+            elif suffix == ".parquet":
+                chunks = self._stream_parquet(data)
+            else:
+                chunks = self._stream_csv(data)
+
+            headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+            if payload["compress"] and flask.request.accept_encodings["gzip"]:
+                chunks = _gzip_chunks(chunks)
+                headers["Content-Encoding"] = "gzip"
+
+            return flask.Response(
+                flask.stream_with_context(chunks),
+                mimetype=MIME_TYPES[suffix],
+                headers=headers,
+            )
+
+    def _serializer(self) -> URLSafeTimedSerializer:
+        return URLSafeTimedSerializer(
+            flask.current_app.secret_key or self._fallback_secret,
+            salt="webviz-download",
+        )
+
+    def _stream_csv(self, dframe: pd.DataFrame) -> Iterator[bytes]:
+        yield dframe.iloc[:0].to_csv(index=False).encode()
+        for start in range(0, len(dframe), self._chunk_size):
+            yield dframe.iloc[start : start + self._chunk_size].to_csv(
+                index=False, header=False
+            ).encode()
+
+    def _stream_parquet(self, dframe: pd.DataFrame) -> Iterator[bytes]:
+        sink = _ChunkSink()
+        table = pyarrow.Table.from_pandas(dframe, preserve_index=False)
+        with pyarrow.parquet.ParquetWriter(sink, table.schema) as writer:
+            for batch in table.to_batches(max_chunksize=self._chunk_size):
+                writer.write_table(pyarrow.Table.from_batches([batch]))
+                yield sink.pop()
+        yield sink.pop()
+
+    @staticmethod
+    def _stream_zip(members: List[Dict[str, str]]) -> Iterator[bytes]:
+        sink = _ChunkSink()
+        with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for member in members:
+                archive.writestr(member["filename"], member["content"])
+                yield sink.pop()
+        yield sink.pop()
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write only, non-seekable file object collecting written bytes until
+    they are popped."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    @staticmethod
+    def writable() -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:  # type: ignore[override]
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def pop(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _gzip_chunks(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        yield compressor.compress(chunk)
+    yield compressor.flush()
+
+
+WEBVIZ_DOWNLOADS = WebvizDownloads()
@@ -1,4 +1,3 @@
-import copy
 from enum import Enum
 from pathlib import Path
 from typing import Optional
@@ -63,7 +62,7 @@ class WebvizInstanceInfo:
 
         if not isinstance(theme, WebvizConfigTheme):
             raise TypeError("theme must be of type WebvizConfigTheme")
-        self._theme = theme
+        self._theme = theme.frozen()
 
         if not isinstance(storage_folder, Path):
             raise TypeError("storage_folder must be of type Path")
@@ -90,8 +89,8 @@ class WebvizInstanceInfo:
         if not self._is_initialized or self._theme is None:
             raise RuntimeError("WebvizInstanceInfo is not yet initialized")
 
-        # The theme class is mutable, so return a copy
-        return copy.deepcopy(self._theme)
+        # The theme is a read-only copy, use theme.copy() to get a mutable one
+        return self._theme
 
     @property
     def storage_folder(self) -> Path:
@@ -0,0 +1,310 @@
+import os
+import re
+import json
+import time
+import bisect
+import logging
+import threading
+import contextlib
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Tuple
+
+import flask
+from dash import Dash, _callback
+from dash.exceptions import PreventUpdate
+
+from ._plugin_abc import WebvizPluginABC
+from .webviz_plugin_subclasses import LayoutUniqueId
+
+# Upper bounds (in seconds) of the callback duration histogram buckets
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class CallbackStats:
+    """Statistics of one callback, and the plugin (and view/element in the plugin)
+    the callback belongs to."""
+
+    def __init__(
+        self, callback_id: str, plugin: Optional[WebvizPluginABC], layout: str
+    ):
+        self.callback_id = callback_id
+        self.plugin_class = type(plugin).__name__ if plugin is not None else None
+        self.plugin_id = plugin.uuid() if plugin is not None else None
+        self.layout = layout
+        self.count = 0
+        self.errors = 0
+        self.prevented = 0
+        self.duration_sum = 0.0
+        self.duration_max = 0.0
+        # The last bucket counts durations above the largest bucket bound
+        self.duration_buckets = [0] * (len(DURATION_BUCKETS) + 1)
+        self.input_bytes = 0
+        self.output_bytes = 0
+
+    def record(
+        self, duration: float, input_bytes: int, output_bytes: int, outcome: str
+    ) -> None:
+        self.count += 1
+        if outcome == "error":
+            self.errors += 1
+        elif outcome == "prevented":
+            self.prevented += 1
+        self.duration_sum += duration
+        self.duration_max = max(self.duration_max, duration)
+        self.duration_buckets[bisect.bisect_left(DURATION_BUCKETS, duration)] += 1
+        self.input_bytes += input_bytes
+        self.output_bytes += output_bytes
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(vars(self))
+
+
+class WebvizInstrumentation:
+    """Opt-in instrumentation of Dash callbacks, enabled by setting the environment
+    variable WEBVIZ_INSTRUMENT_CALLBACKS, or by adding an observer or a context.
+
+    When enabled, `instrument()` wraps all callbacks registered on the application
+    (both with `app.callback` and `dash.callback`). For each callback the number
+    of calls, errors and prevented updates are counted, and a histogram of the
+    durations and the total input/output payload sizes are recorded. Callbacks are
+    attributed to the plugin, and the view/view element/settings group within the
+    plugin, through the (LayoutUniqueId) component ids of their outputs and inputs.
+
+    Callbacks slower than `slow_callback_threshold` seconds (default 1, can be set
+    through the environment variable WEBVIZ_SLOW_CALLBACK_THRESHOLD) are logged as
+    warnings. The statistics are available as JSON from the `ROUTE` endpoint.
+    Observers added with `add_observer()` are called with the statistics of the
+    callback, the duration and the outcome (ok/error/prevented) of every call.
+    Every call is also run within the contexts added with `add_context()`.
+    Statistics added with `add_stats()` are included in the `ROUTE` endpoint.
+    """
+
+    ROUTE = "/webviz-instrumentation/callbacks"
+
+    def __init__(self) -> None:
+        self._stats: Dict[str, CallbackStats] = {}
+        self._lock = threading.Lock()
+        self._slow_callback_threshold = 1.0
+        self._observers: List[Callable[[CallbackStats, float, str], None]] = []
+        self._contexts: List[Callable[[CallbackStats], ContextManager]] = []
+        self._extra_stats: Dict[str, Callable[[], Any]] = {}
+        self._logger = logging.getLogger(__name__)
+
+    def enabled(self) -> bool:
+        return bool(
+            self._observers or self._contexts or self._extra_stats
+        ) or os.environ.get("WEBVIZ_INSTRUMENT_CALLBACKS", "").strip().lower() in {
+            "1",
+            "true",
+            "yes",
+            "on",
+        }
+
+    def add_observer(
+        self, observer: Callable[[CallbackStats, float, str], None]
+    ) -> None:
+        """Adds an observer of all instrumented callback calls. Enables
+        instrumentation, and must therefore be called before `instrument()`."""
+        self._observers.append(observer)
+
+    def add_context(self, context: Callable[[CallbackStats], ContextManager]) -> None:
+        """Adds a context manager factory, called with the statistics of the
+        callback, which all instrumented callback calls are run within. Enables
+        instrumentation, and must therefore be called before `instrument()`."""
+        self._contexts.append(context)
+
+    def add_stats(self, name: str, stats: Callable[[], Any]) -> None:
+        """Adds (JSON serializable) statistics, returned by `stats`, to the
+        `ROUTE` endpoint. Enables instrumentation, and must therefore be
+        called before `instrument()`."""
+        self._extra_stats[name] = stats
+
+    def instrument(
+        self, app: Dash, slow_callback_threshold: Optional[float] = None
+    ) -> bool:
+        """Instruments all callbacks registered so far, and registers the statistics
+        route. Should be called after all plugins have been initialized. Returns
+        False, and does nothing, if instrumentation is not enabled."""
+        if not self.enabled():
+            return False
+
+        self._slow_callback_threshold = (
+            slow_callback_threshold
+            if slow_callback_threshold is not None
+            else float(os.environ.get("WEBVIZ_SLOW_CALLBACK_THRESHOLD", 1))
+        )
+
+        attribute = _PluginAttribution()
+        for callback_map in (app.callback_map, _callback.GLOBAL_CALLBACK_MAP):
+            for callback_id, callback in callback_map.items():
+                if callback_id in self._stats or "callback" not in callback:
+                    # Already instrumented, or a clientside callback
+                    continue
+                plugin, layout = attribute(
+                    _callback_component_ids(callback_id, callback)
+                )
+                stats = self._stats[callback_id] = CallbackStats(
+                    callback_id, plugin, layout
+                )
+                callback["callback"] = self._instrumented(callback["callback"], stats)
+
+        app.server.add_url_rule(
+            WebvizInstrumentation.ROUTE,
+            "_webviz_instrumentation_callbacks",
+            lambda: flask.jsonify(self.stats()),
+        )
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            callbacks = [stats.to_dict() for stats in self._stats.values()]
+        return {
+            "duration_buckets": list(DURATION_BUCKETS),
+            "callbacks": callbacks,
+            **{name: stats() for name, stats in self._extra_stats.items()},
+        }
+
+    def callback_stats(self) -> List[CallbackStats]:
+        return list(self._stats.values())
+
+    def _instrumented(self, func: Callable, stats: CallbackStats) -> Callable:
+        def instrumented_callback(*args: Any, **kwargs: Any) -> Any:
+            if not self._contexts:
+                return measured_callback(*args, **kwargs)
+            with contextlib.ExitStack() as stack:
+                for context in self._contexts:
+                    stack.enter_context(context(stats))
+                return measured_callback(*args, **kwargs)
+
+        def measured_callback(*args: Any, **kwargs: Any) -> Any:
+            outcome = "error"
+            output_bytes = 0
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+                outcome = "ok"
+                if isinstance(result, (str, bytes)):
+                    output_bytes = len(result)
+                return result
+            except PreventUpdate:
+                outcome = "prevented"
+                raise
+            finally:
+                duration = time.perf_counter() - start
+                input_bytes = (
+                    flask.request.content_length or 0
+                    if flask.has_request_context()
+                    else 0
+                )
+                with self._lock:
+                    stats.record(duration, input_bytes, output_bytes, outcome)
+                for observer in self._observers:
+                    observer(stats, duration, outcome)
+                if duration > self._slow_callback_threshold:
+                    self._logger.warning(
+                        "Slow callback (%.3f s) in %s %s: %s",
+                        duration,
+                        stats.plugin_class or "application",
+                        stats.layout,
+                        stats.callback_id,
+                    )
+
+        return instrumented_callback
+
+
+class _PluginAttribution:
+    """Finds the plugin, and the view/view element/settings group within the plugin,
+    a callback belongs to from the component ids of the callback."""
+
+    def __init__(self) -> None:
+        self._plugins = dict(WebvizPluginABC._INSTANCES)
+        self._pattern = (
+            re.compile(
+                r"(?<!\w)("
+                + "|".join(
+                    re.escape(plugin_id)
+                    for plugin_id in sorted(self._plugins, key=len, reverse=True)
+                )
+                + r")(?!\d)"
+            )
+            if self._plugins
+            else None
+        )
+        self._layouts: Dict[str, List[Tuple[str, str]]] = {}
+
+    def __call__(
+        self, component_ids: List[str]
+    ) -> Tuple[Optional[WebvizPluginABC], str]:
+        if self._pattern is None:
+            return None, ""
+
+        for component_id in component_ids:
+            match = self._pattern.search(component_id)
+            if match is None:
+                continue
+            plugin_id = match.group(1)
+            for prefix, layout in self._plugin_layouts(plugin_id):
+                if component_id == prefix or component_id.startswith(prefix + "-"):
+                    return self._plugins[plugin_id], layout
+            return self._plugins[plugin_id], ""
+
+        return None, ""
+
+    def _plugin_layouts(self, plugin_id: str) -> List[Tuple[str, str]]:
+        """Returns the unique ids of the views, view elements and settings groups
+        of the plugin, longest first, and a label for each of them."""
+        if plugin_id not in self._layouts:
+            plugin = self._plugins[plugin_id]
+            layouts = list(plugin.shared_settings_groups())
+            for _, view in plugin.views():
+                layouts.append(view)
+                layouts.extend(view.settings_groups())
+                for view_element in view.view_elements():
+                    layouts.append(view_element)
+                    layouts.extend(view_element.settings_groups())
+
+            unique_ids = [layout.get_unique_id() for layout in layouts]
+            self._layouts[plugin_id] = sorted(
+                (
+                    (unique_id.to_string(), _layout_label(unique_id))
+                    for unique_id in unique_ids
+                ),
+                key=lambda layout: len(layout[0]),
+                reverse=True,
+            )
+        return self._layouts[plugin_id]
+
+
+def _layout_label(unique_id: LayoutUniqueId) -> str:
+    return "/".join(
+        filter(
+            None,
+            (
+                unique_id.get_view_id(),
+                unique_id.get_view_element_id(),
+                unique_id.get_settings_group_id(),
+            ),
+        )
+    )
+
+
+def _callback_component_ids(callback_id: str, callback: Dict[str, Any]) -> List[str]:
+    """Returns the component ids of the outputs, followed by the component ids
+    of the inputs and states. The callback id is on the form `id.property` for
+    single output callbacks, and `..id1.property1...id2.property2..` otherwise."""
+    outputs = (
+        callback_id[2:-2].split("...")
+        if callback_id.startswith("..")
+        else [callback_id]
+    )
+    component_ids = [output.rsplit(".", 1)[0] for output in outputs]
+    for dependency in callback.get("inputs", []) + callback.get("state", []):
+        component_id = dependency["id"]
+        component_ids.append(
+            component_id
+            if isinstance(component_id, str)
+            else json.dumps(component_id, sort_keys=True)
+        )
+    return component_ids
+
+
+WEBVIZ_INSTRUMENTATION = WebvizInstrumentation()
@@ -0,0 +1,221 @@
+import os
+import time
+import logging
+import secrets
+from typing import Any, Optional
+
+import flask
+from dash import Dash
+
+from ._static_auth import StaticRequestAuth
+from .common_cache import CACHE
+from .webviz_store import WEBVIZ_STORAGE
+from .webviz_instrumentation import (
+    DURATION_BUCKETS,
+    WEBVIZ_INSTRUMENTATION,
+    CallbackStats,
+)
+
+try:
+    import prometheus_client
+    from prometheus_client import multiprocess
+
+    PROMETHEUS_CLIENT_INSTALLED = True
+except ModuleNotFoundError:
+    PROMETHEUS_CLIENT_INSTALLED = False
+
+# Minimum number of seconds between updates of the process metrics of a worker
+PROCESS_METRICS_INTERVAL = 5
+
+
+class WebvizMetrics:
+    """Opt-in Prometheus metrics, enabled by setting the environment variable
+    WEBVIZ_METRICS. Requires the optional dependency `prometheus-client`
+    (`pip install webviz-config[metrics]`).
+
+    When enabled, `register()` exposes the metrics in the Prometheus text format
+    on the `ROUTE` endpoint:
+        - number of requests and request latencies, per route,
+        - callback durations, per plugin (through `WEBVIZ_INSTRUMENTATION`),
+        - cache hits and misses of functions memoized with `CACHE`,
+        - bytes read from `WEBVIZ_STORAGE` (portable applications), and
+        - resident memory of each worker process.
+
+    When running with several worker processes (e.g. gunicorn), set the
+    environment variable PROMETHEUS_MULTIPROC_DIR to an empty directory before
+    starting the server, such that the metrics of all workers are aggregated.
+
+    The endpoint is excluded from the authorization of the application (e.g.
+    Oauth2), such that Prometheus can scrape it. If the environment variable
+    WEBVIZ_METRICS_TOKEN is set, requests must instead give the token as
+    bearer token (`Authorization: Bearer <token>`).
+    """
+
+    ROUTE = "/metrics"
+
+    def __init__(self) -> None:
+        self._last_process_update = 0.0
+        self._logger = logging.getLogger(__name__)
+
+        if PROMETHEUS_CLIENT_INSTALLED:
+            # In multiprocess mode the values are written to files in
+            # PROMETHEUS_MULTIPROC_DIR, and exposed by a MultiProcessCollector
+            # instead of this registry.
+            self._registry = prometheus_client.CollectorRegistry()
+            self._requests = prometheus_client.Counter(
+                "webviz_requests",
+                "Number of HTTP requests.",
+                ["route", "method", "status"],
+                registry=self._registry,
+            )
+            self._request_duration = prometheus_client.Histogram(
+                "webviz_request_duration_seconds",
+                "HTTP request latency.",
+                ["route"],
+                registry=self._registry,
+            )
+            self._callback_duration = prometheus_client.Histogram(
+                "webviz_callback_duration_seconds",
+                "Dash callback duration.",
+                ["plugin", "plugin_id", "outcome"],
+                buckets=DURATION_BUCKETS,
+                registry=self._registry,
+            )
+            self._cache_requests = prometheus_client.Counter(
+                "webviz_cache_requests",
+                "Number of cache lookups.",
+                ["result"],
+                registry=self._registry,
+            )
+            self._storage_read_bytes = prometheus_client.Counter(
+                "webviz_storage_read_bytes",
+                "Number of bytes read from the webviz storage.",
+                ["function"],
+                registry=self._registry,
+            )
+            self._resident_memory = prometheus_client.Gauge(
+                "webviz_process_resident_memory_bytes",
+                "Resident memory size of the worker process.",
+                ["worker"],
+                multiprocess_mode="liveall",
+                registry=self._registry,
+            )
+
+    @staticmethod
+    def enabled() -> bool:
+        return os.environ.get("WEBVIZ_METRICS", "").strip().lower() in {
+            "1",
+            "true",
+            "yes",
+            "on",
+        }
+
+    @staticmethod
+    def multiprocess_mode() -> bool:
+        return bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+    def register(self, app: Dash) -> bool:
+        """Sets up collection of the metrics, and registers the metrics route.
+        Should be called after `CACHE.init_app()`, and before
+        `WEBVIZ_INSTRUMENTATION.instrument()`. Returns False, and does nothing,
+        if metrics are not enabled (or `prometheus-client` is not installed)."""
+        if not self.enabled():
+            return False
+
+        if not PROMETHEUS_CLIENT_INSTALLED:
+            self._logger.warning(
+                "Metrics are enabled, but prometheus-client is not installed. "
+                "Run `pip install webviz-config[metrics]` to use metrics."
+            )
+            return False
+
+        flask.request_started.connect(
+            WebvizMetrics._request_started, app.server, weak=False
+        )
+        flask.request_finished.connect(self._request_finished, app.server, weak=False)
+        WEBVIZ_INSTRUMENTATION.add_observer(self._callback_finished)
+        WEBVIZ_STORAGE.add_read_observer(self._storage_read)
+        if CACHE in app.server.extensions.get("cache", {}):
+            cache = app.server.extensions["cache"][CACHE]
+            cache.get = self._counted_cache_get(cache.get)
+
+        app.server.add_url_rule(WebvizMetrics.ROUTE, "_webviz_metrics", self.metrics)
+        StaticRequestAuth.for_app(app.server).add_public_endpoint("_webviz_metrics")
+        return True
+
+    def metrics(self) -> flask.Response:
+        token = os.environ.get("WEBVIZ_METRICS_TOKEN")
+        if token and not secrets.compare_digest(
+            flask.request.headers.get("Authorization", ""), f"Bearer {token}"
+        ):
+            flask.abort(401)
+
+        self._update_process_metrics(force=True)
+        if self.multiprocess_mode():
+            registry = prometheus_client.CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+        else:
+            registry = self._registry
+        return flask.Response(
+            prometheus_client.generate_latest(registry),
+            mimetype=prometheus_client.CONTENT_TYPE_LATEST,
+        )
+
+    @staticmethod
+    def _request_started(_sender: flask.Flask, **_kwargs: Any) -> None:
+        flask.request.environ["webviz.metrics_start"] = time.perf_counter()
+
+    def _request_finished(
+        self, _sender: flask.Flask, response: flask.Response, **_kwargs: Any
+    ) -> None:
+        request = flask.request
+        start: Optional[float] = request.environ.get("webviz.metrics_start")
+        if start is None:
+            return
+        # Label by the URL rule (and not the path), to keep the number of
+        # label values bounded.
+        route = request.url_rule.rule if request.url_rule else "<unmatched>"
+        self._requests.labels(route, request.method, response.status_code).inc()
+        self._request_duration.labels(route).observe(time.perf_counter() - start)
+        self._update_process_metrics()
+
+    def _callback_finished(
+        self, stats: CallbackStats, duration: float, outcome: str
+    ) -> None:
+        self._callback_duration.labels(
+            stats.plugin_class or "application", stats.plugin_id or "", outcome
+        ).observe(duration)
+
+    def _storage_read(self, function: str, size: int) -> None:
+        self._storage_read_bytes.labels(function).inc(size)
+
+    def _counted_cache_get(self, get: Any) -> Any:
+        def counted_get(key: str) -> Any:
+            value = get(key)
+            # Lookups of the versions of memoized functions are not counted
+            if not key.endswith("_memver"):
+                self._cache_requests.labels("miss" if value is None else "hit").inc()
+            return value
+
+        return counted_get
+
+    def _update_process_metrics(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if force or now - self._last_process_update > PROCESS_METRICS_INTERVAL:
+            self._last_process_update = now
+            resident_memory = _resident_memory_bytes()
+            if resident_memory is not None:
+                self._resident_memory.labels(str(os.getpid())).set(resident_memory)
+
+
+def _resident_memory_bytes() -> Optional[int]:
+    """Returns the resident memory size of the process, or None if not
+    available (only Linux is supported)."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return None
+
+
+WEBVIZ_METRICS = WebvizMetrics()
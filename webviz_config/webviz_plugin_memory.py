@@ -0,0 +1,187 @@
+import os
+import types
+import contextlib
+import tracemalloc
+from typing import Any, Dict, Iterator, List, Set
+
+import numpy as np
+import pandas as pd
+from dash import Dash
+
+from ._plugin_abc import WebvizPluginABC
+from .webviz_instrumentation import WEBVIZ_INSTRUMENTATION
+
+# How deep object references are followed from a plugin when looking for data
+MAX_REFERENCE_DEPTH = 5
+
+
+class PluginMemory:
+    """Memory attributable to one plugin instance."""
+
+    def __init__(self, plugin: WebvizPluginABC, allocated: int, peak: int):
+        self.plugin_class = type(plugin).__name__
+        self.plugin_id = plugin.uuid()
+        # Memory allocated (and not freed) during initialization of the plugin
+        self.allocated = allocated
+        # Peak memory allocated during initialization of the plugin
+        self.peak = peak
+        # Deep size of data (data frames, series and arrays) referenced from the
+        # plugin. Updated on every report, as plugins may load data lazily.
+        self.data = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(vars(self))
+
+
+class WebvizPluginMemory:
+    """Opt-in accounting of memory per plugin instance, enabled by setting the
+    environment variable WEBVIZ_PLUGIN_MEMORY.
+
+    When enabled, `measure()` measures the memory allocated while initializing
+    the plugins created within it (using `tracemalloc`, which is started by the
+    first measurement and stopped by `report()`). In addition, the deep size of
+    data frames, series and arrays referenced (directly or through other
+    objects) from each plugin is calculated.
+
+    The memory per plugin is printed by `report()`, and is also available from
+    the `WebvizInstrumentation.ROUTE` endpoint.
+    """
+
+    def __init__(self) -> None:
+        self._plugins: Dict[str, PluginMemory] = {}
+        self._started_tracemalloc = False
+        self._added_stats = False
+
+    @staticmethod
+    def enabled() -> bool:
+        return os.environ.get("WEBVIZ_PLUGIN_MEMORY", "").strip().lower() in {
+            "1",
+            "true",
+            "yes",
+            "on",
+        }
+
+    @contextlib.contextmanager
+    def measure(self) -> Iterator[None]:
+        """Measures the memory allocated by the plugins initialized within the
+        context. Does nothing if not enabled."""
+        if not self.enabled():
+            yield
+            return
+
+        if not self._added_stats:
+            WEBVIZ_INSTRUMENTATION.add_stats("plugin_memory", self.stats)
+            self._added_stats = True
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+        existing_plugins = set(_plugin_instances())
+        allocated_before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+
+        yield
+
+        allocated_after, peak = tracemalloc.get_traced_memory()
+        for plugin_id, plugin in _plugin_instances().items():
+            if plugin_id not in existing_plugins:
+                self._plugins[plugin_id] = PluginMemory(
+                    plugin,
+                    allocated=allocated_after - allocated_before,
+                    peak=peak - allocated_before,
+                )
+
+    def report(self) -> None:
+        """Stops the memory tracing started by `measure()`, and prints the
+        memory per plugin. Does nothing if not enabled."""
+        if not self.enabled():
+            return
+
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+        plugins = sorted(
+            self.stats()["plugins"],
+            key=lambda plugin: plugin["allocated"] + plugin["data"],
+            reverse=True,
+        )
+        print(f"{'Plugin':<50} {'Allocated':>12} {'Peak':>12} {'Data':>12}")
+        for plugin in plugins:
+            print(
+                f"{plugin['plugin_id']:<50} {_megabytes(plugin['allocated']):>12} "
+                f"{_megabytes(plugin['peak']):>12} {_megabytes(plugin['data']):>12}"
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        for plugin_id, plugin_memory in self._plugins.items():
+            plugin = _plugin_instances().get(plugin_id)
+            if plugin is not None:
+                plugin_memory.data = referenced_data_size(plugin)
+        return {
+            "plugins": [
+                plugin_memory.to_dict() for plugin_memory in self._plugins.values()
+            ]
+        }
+
+
+def referenced_data_size(obj: Any) -> int:
+    """Returns the deep size (in bytes) of the data frames, series and arrays
+    referenced from the object, directly or through containers and attributes
+    of other objects. Each data object is only counted once."""
+    seen: Set[int] = {id(obj)}
+    size = 0
+    objects: List[Any] = [obj]
+    for _ in range(MAX_REFERENCE_DEPTH):
+        referenced: List[Any] = []
+        for current in objects:
+            for value in _references(current):
+                if id(value) in seen or isinstance(value, _SKIPPED_TYPES):
+                    continue
+                seen.add(id(value))
+                if isinstance(value, pd.DataFrame):
+                    size += int(value.memory_usage(deep=True).sum())
+                elif isinstance(value, pd.Series):
+                    size += int(value.memory_usage(deep=True))
+                elif isinstance(value, np.ndarray):
+                    size += value.nbytes
+                else:
+                    referenced.append(value)
+        objects = referenced
+    return size
+
+
+# Objects not followed when looking for data referenced from a plugin, as they
+# are (or reference) state shared by all plugins
+_SKIPPED_TYPES = (
+    str,
+    bytes,
+    int,
+    float,
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.MethodType,
+    Dash,
+    WebvizPluginABC,
+)
+
+
+def _references(obj: Any) -> List[Any]:
+    if isinstance(obj, dict):
+        return list(obj.values())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return list(obj)
+    return list(getattr(obj, "__dict__", {}).values())
+
+
+def _plugin_instances() -> Dict[str, WebvizPluginABC]:
+    # pylint: disable=protected-access
+    return dict(WebvizPluginABC._INSTANCES)
+
+
+def _megabytes(size: int) -> str:
+    return f"{size / 2**20:.1f} MB"
+
+
+WEBVIZ_PLUGIN_MEMORY = WebvizPluginMemory()
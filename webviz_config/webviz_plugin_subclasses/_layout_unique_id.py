@@ -1,7 +1,15 @@
-from typing import List, Optional
+import sys
+from typing import Dict, Optional
 
 
 class LayoutUniqueId:
+    """Unique id of an element in the layout of a plugin, made up of the ids of the
+    plugin, view, view element, settings group and component it belongs to.
+
+    The string forms are computed (and interned) once, and recomputed only if
+    any of the ids are changed.
+    """
+
     def __init__(
         self,
         plugin_uuid: Optional[str] = None,
@@ -16,38 +24,33 @@ class LayoutUniqueId:
         self._settings_group_id = settings_group_id
         self._view_element_id = view_element_id
         self._component_id = component_id
+        self._strings: Dict[str, str] = {}
 
         if other:
             self.adopt(other)
 
+    def _joined(self, form: str, *ids: Optional[str]) -> str:
+        string = self._strings.get(form)
+        if string is None:
+            string = self._strings[form] = sys.intern("-".join(i for i in ids if i))
+        return string
+
     def get_plugin_uuid(self) -> Optional[str]:
         return self._plugin_uuid
 
     def get_view_unique_id(self) -> str:
-        ids: List[str] = []
         if not self._view_id:
             return ""
 
-        if self._plugin_uuid:
-            ids.append(self._plugin_uuid)
-        if self._view_id:
-            ids.append(self._view_id)
-
-        return "-".join(ids)
+        return self._joined("view", self._plugin_uuid, self._view_id)
 
     def get_view_id(self) -> Optional[str]:
         return self._view_id
 
     def get_view_element_unique_id(self) -> str:
-        ids: List[str] = []
-        if self._plugin_uuid:
-            ids.append(self._plugin_uuid)
-        if self._view_id:
-            ids.append(self._view_id)
-        if self._view_element_id:
-            ids.append(self._view_element_id)
-
-        return "-".join(ids)
+        return self._joined(
+            "view_element", self._plugin_uuid, self._view_id, self._view_element_id
+        )
 
     def get_view_element_id(self) -> Optional[str]:
         return self._view_element_id
@@ -59,32 +62,33 @@ class LayoutUniqueId:
         return self._settings_group_id
 
     def get_settings_group_unique_id(self) -> str:
-        ids: List[str] = []
-        if self._plugin_uuid:
-            ids.append(self._plugin_uuid)
-        if self._view_id:
-            ids.append(self._view_id)
-        if self._view_element_id:
-            ids.append(self._view_element_id)
-        if self._settings_group_id:
-            ids.append(self._settings_group_id)
-
-        return "-".join(ids)
+        return self._joined(
+            "settings_group",
+            self._plugin_uuid,
+            self._view_id,
+            self._view_element_id,
+            self._settings_group_id,
+        )
 
     def set_plugin_uuid(self, plugin_uuid: str) -> None:
         self._plugin_uuid = plugin_uuid
+        self._strings.clear()
 
     def set_view_id(self, view_id: str) -> None:
         self._view_id = view_id
+        self._strings.clear()
 
     def set_view_element_id(self, view_element_id: str) -> None:
         self._view_element_id = view_element_id
+        self._strings.clear()
 
     def set_settings_group_id(self, settings_group_id: str) -> None:
         self._settings_group_id = settings_group_id
+        self._strings.clear()
 
     def set_component_id(self, component_id: str) -> None:
         self._component_id = component_id
+        self._strings.clear()
 
     def is_plugin(self) -> bool:
         return (
@@ -110,6 +114,8 @@ class LayoutUniqueId:
         return self._component_id is not None
 
     def adopt(self, other: "LayoutUniqueId") -> None:
+        self._strings.clear()
+
         if self._plugin_uuid is None and other.get_plugin_uuid() is not None:
             self._plugin_uuid = other.get_plugin_uuid()
 
@@ -132,16 +138,11 @@ class LayoutUniqueId:
         return self.to_string()
 
     def to_string(self) -> str:
-        ids: List[str] = []
-        if self._plugin_uuid:
-            ids.append(self._plugin_uuid)
-        if self._view_id:
-            ids.append(self._view_id)
-        if self._view_element_id:
-            ids.append(self._view_element_id)
-        if self._settings_group_id:
-            ids.append(self._settings_group_id)
-        if self._component_id:
-            ids.append(self._component_id)
-
-        return "-".join(ids)
+        return self._joined(
+            "all",
+            self._plugin_uuid,
+            self._view_id,
+            self._view_element_id,
+            self._settings_group_id,
+            self._component_id,
+        )
@@ -30,6 +30,7 @@ class ViewElementABC(LayoutBaseABC):
         self._add_download_button = False
 
         self._settings: List[SettingsGroupABC] = []
+        self._settings_by_id: Dict[str, SettingsGroupABC] = {}
         self._layout_created: bool = False
 
     def _set_plugin_register_id_func(
@@ -76,18 +77,12 @@ class ViewElementABC(LayoutBaseABC):
         settings_group.get_unique_id().set_settings_group_id(settings_group_id)
         settings_group._set_unique_id(self._unique_id)
         self._settings.append(settings_group)
+        self._settings_by_id.setdefault(settings_group_id, settings_group)
 
     def setting_group_unique_id(
         self, settings_id: str, element: Optional[str] = None
     ) -> str:
-        setting = next(
-            (
-                el
-                for el in self.settings_groups()
-                if el.get_unique_id().get_settings_group_id() == settings_id
-            ),
-            None,
-        )
+        setting = self._settings_by_id.get(settings_id)
         if not setting:
             available_ids = [
                 cast(str, el.get_unique_id().get_settings_group_id())
@@ -105,14 +100,7 @@ class ViewElementABC(LayoutBaseABC):
         return uuid.to_string()
 
     def settings_group(self, settings_group_id: str) -> SettingsGroupABC:
-        settings_group = next(
-            (
-                el
-                for el in self.settings_groups()
-                if el.get_unique_id().get_settings_group_id() == settings_group_id
-            ),
-            None,
-        )
+        settings_group = self._settings_by_id.get(settings_group_id)
         if settings_group:
             return settings_group
 
@@ -322,15 +310,25 @@ class ViewLayoutElement(LayoutBaseABC):
 
 # pylint: disable=too-many-public-methods
 class ViewABC(LayoutBaseABC):
+    # Views whose layout does not change after it is first created (i.e. only
+    # callbacks update the components within it) can set this to `True`, such
+    # that the layout is created once, instead of each time the view is shown.
+    STATIC_LAYOUT: bool = False
+
     def __init__(self, name: str) -> None:
         super().__init__()
         self.name = name
+        self._outer_layout: Optional[Type[Component]] = None
 
         self._add_download_button = False
         self._child_elements: List[Union[ViewElementABC, ViewLayoutElement]] = []
         self._view_elements: List[ViewElementABC] = []
         self._layout_elements: List[ViewLayoutElement] = []
         self._settings_groups: List[SettingsGroupABC] = []
+        # View elements, layout elements and settings groups by their ids
+        self._view_elements_by_id: Dict[str, ViewElementABC] = {}
+        self._layout_elements_by_id: Dict[str, ViewLayoutElement] = {}
+        self._settings_groups_by_id: Dict[str, SettingsGroupABC] = {}
         self._plugin_register_id_func: Optional[
             Callable[[Union[str, List[str]]], None]
         ] = None
@@ -437,14 +435,7 @@ class ViewABC(LayoutBaseABC):
     def view_element_unique_id(
         self, view_element_id: str, element: Optional[str] = None
     ) -> str:
-        view_element = next(
-            (
-                el
-                for el in self.view_elements()
-                if el.get_unique_id().get_view_element_id() == view_element_id
-            ),
-            None,
-        )
+        view_element = self._view_elements_by_id.get(view_element_id)
         if not view_element:
             available_ids = [
                 cast(str, el.get_unique_id().get_view_element_id())
@@ -462,14 +453,7 @@ class ViewABC(LayoutBaseABC):
         return uuid.to_string()
 
     def view_element(self, view_element_id: str) -> "ViewElementABC":
-        view_element = next(
-            (
-                el
-                for el in self.view_elements()
-                if el.get_unique_id().get_view_element_id() == view_element_id
-            ),
-            None,
-        )
+        view_element = self._view_elements_by_id.get(view_element_id)
         if view_element:
             return view_element
 
@@ -483,14 +467,7 @@ class ViewABC(LayoutBaseABC):
         )
 
     def layout_element(self, layout_element_id: str) -> "ViewLayoutElement":
-        layout_element = next(
-            (
-                el
-                for el in self.layout_elements()
-                if el.get_unique_id().get_view_element_id() == layout_element_id
-            ),
-            None,
-        )
+        layout_element = self._layout_elements_by_id.get(layout_element_id)
         if layout_element:
             return layout_element
 
@@ -504,14 +481,7 @@ class ViewABC(LayoutBaseABC):
         )
 
     def settings_group(self, settings_group_id: str) -> SettingsGroupABC:
-        settings_group = next(
-            (
-                el
-                for el in self.settings_groups()
-                if el.get_unique_id().get_settings_group_id() == settings_group_id
-            ),
-            None,
-        )
+        settings_group = self._settings_groups_by_id.get(settings_group_id)
         if settings_group:
             return settings_group
 
@@ -527,14 +497,7 @@ class ViewABC(LayoutBaseABC):
     def settings_group_unique_id(
         self, settings_id: str, element: Optional[str] = None
     ) -> str:
-        setting = next(
-            (
-                el
-                for el in self.settings_groups()
-                if el.get_unique_id().get_settings_group_id() == settings_id
-            ),
-            None,
-        )
+        setting = self._settings_groups_by_id.get(settings_id)
         if not setting:
             available_ids = [
                 cast(str, el.get_unique_id().get_settings_group_id())
@@ -559,6 +522,7 @@ class ViewABC(LayoutBaseABC):
         view_element.get_unique_id().set_view_element_id(view_element_id)
         self._child_elements.append(view_element)
         self._view_elements.append(view_element)
+        self._view_elements_by_id.setdefault(view_element_id, view_element)
 
     def _add_view_element(
         self, view_element: ViewElementABC, view_element_id: str
@@ -567,6 +531,7 @@ class ViewABC(LayoutBaseABC):
         view_element._set_unique_id(self._unique_id)
         view_element.get_unique_id().set_view_element_id(view_element_id)
         self._view_elements.append(view_element)
+        self._view_elements_by_id.setdefault(view_element_id, view_element)
 
     def _add_layout_element(
         self, layout_element: ViewLayoutElement, layout_element_id: str
@@ -575,6 +540,7 @@ class ViewABC(LayoutBaseABC):
         layout_element._set_unique_id(self._unique_id)
         layout_element.get_unique_id().set_view_element_id(layout_element_id)
         self._layout_elements.append(layout_element)
+        self._layout_elements_by_id.setdefault(layout_element_id, layout_element)
 
     def add_row(
         self, layout_element_id: Optional[str] = None, flex_grow: int = 1
@@ -585,6 +551,7 @@ class ViewABC(LayoutBaseABC):
         )
         row.get_unique_id().set_view_element_id(layout_element_id)
         self._layout_elements.append(row)
+        self._layout_elements_by_id.setdefault(layout_element_id, row)
         self._child_elements.append(row)
         return row
 
@@ -597,6 +564,7 @@ class ViewABC(LayoutBaseABC):
         )
         column.get_unique_id().set_view_element_id(layout_element_id)
         self._layout_elements.append(column)
+        self._layout_elements_by_id.setdefault(layout_element_id, column)
         self._child_elements.append(column)
         return column
 
@@ -609,8 +577,9 @@ class ViewABC(LayoutBaseABC):
         self._view_elements = [
             view_element
             for view_element in self._view_elements
-            if view_element.get_unique_id().get_view_element_id() == view_element_id
+            if view_element.get_unique_id().get_view_element_id() != view_element_id
         ]
+        self._view_elements_by_id.pop(view_element_id, None)
         return old_length != len(self._view_elements)
 
     def add_settings_group(
@@ -620,6 +589,7 @@ class ViewABC(LayoutBaseABC):
         settings_group._set_unique_id(self._unique_id)
         settings_group.get_unique_id().set_settings_group_id(settings_group_id)
         self._settings_groups.append(settings_group)
+        self._settings_groups_by_id.setdefault(settings_group_id, settings_group)
 
     def add_settings_groups(self, settings_groups: Dict[str, SettingsGroupABC]) -> None:
         for settings_group_id, settings_group in settings_groups.items():
@@ -658,10 +628,16 @@ class ViewABC(LayoutBaseABC):
         ]
 
     def outer_layout(self) -> Type[Component]:
-        return wcc.WebvizView(
+        if self._outer_layout is not None:
+            return self._outer_layout
+
+        layout = wcc.WebvizView(
             id=str(self.get_unique_id()),
             children=self.inner_layout(),
         )
+        if self.STATIC_LAYOUT:
+            self._outer_layout = layout
+        return layout
 
     def set_callbacks(self) -> None:
         pass
@@ -12,6 +12,8 @@ from typing import Callable, List, Union, Any
 import pandas as pd
 from tqdm import tqdm
 
+from .webviz_tracing import WEBVIZ_TRACING
+
 
 class WebvizStorage:
 
@@ -21,6 +23,7 @@ class WebvizStorage:
         self._use_storage = False
         self.storage_functions: set = set()
         self.storage_function_argvalues: defaultdict = defaultdict(dict)
+        self._read_observers: List[Callable[[str, int], None]] = []
 
     def register_function(self, func: Callable) -> None:
         """This function is automatically called by the function
@@ -52,6 +55,12 @@ class WebvizStorage:
     def use_storage(self, use_storage: bool) -> None:
         self._use_storage = use_storage
 
+    def add_read_observer(self, observer: Callable[[str, int], None]) -> None:
+        """Adds an observer called with the name of the storage function and
+        the size (in bytes) of the stored file, each time stored data is read.
+        """
+        self._read_observers.append(observer)
+
     def register_function_arguments(self, functionarguments: List[tuple]) -> None:
         """The input here is from class functions `add_webvizstore(self)`
         in the different plugins requested from the configuration file.
@@ -158,13 +167,24 @@ class WebvizStorage:
         path = self._unique_path(func, WebvizStorage._dict_to_tuples(kwargs))
 
         try:
+            data: Union[pd.DataFrame, pathlib.Path, io.BytesIO]
             if return_type == pd.DataFrame:
-                return pd.read_parquet(f"{path}.parquet")
-            if return_type == pathlib.Path:
-                return pathlib.Path(glob.glob(f"{path}*")[0])
-            if return_type == io.BytesIO:
-                return io.BytesIO(pathlib.Path(path).read_bytes())
-            raise ValueError(f"Unknown return type {return_type}")
+                stored_file = pathlib.Path(f"{path}.parquet")
+                data = pd.read_parquet(stored_file)
+            elif return_type == pathlib.Path:
+                stored_file = pathlib.Path(glob.glob(f"{path}*")[0])
+                data = stored_file
+            elif return_type == io.BytesIO:
+                stored_file = pathlib.Path(path)
+                data = io.BytesIO(stored_file.read_bytes())
+            else:
+                raise ValueError(f"Unknown return type {return_type}")
+
+            if self._read_observers:
+                size = stored_file.stat().st_size
+                for observer in self._read_observers:
+                    observer(func.__name__, size)
+            return data
 
         except OSError as exc:
             raise OSError(
@@ -213,7 +233,7 @@ def webvizstore(func: Callable) -> Callable:
             return WEBVIZ_STORAGE.get_stored_data(func, *args, **kwargs)
         return func(*args, **kwargs)
 
-    return wrapper_decorator
+    return WEBVIZ_TRACING.traced(wrapper_decorator, f"webvizstore {func.__qualname__}")
 
 
 WEBVIZ_STORAGE = WebvizStorage()
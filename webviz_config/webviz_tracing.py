@@ -0,0 +1,249 @@
+import os
+import sys
+import functools
+import threading
+import contextlib
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import flask
+from dash import Dash
+from dash.exceptions import PreventUpdate
+from opentelemetry import context, trace
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    ConsoleSpanExporter,
+    SpanExportResult,
+)
+
+from .webviz_instrumentation import WEBVIZ_INSTRUMENTATION, CallbackStats
+
+_NO_SPAN: ContextManager[None] = contextlib.nullcontext()
+
+
+class WebvizTracing:
+    """Opt-in OpenTelemetry tracing, enabled by setting the environment variable
+    WEBVIZ_TRACING to either `console` (spans are written to stdout) or a file
+    path (spans are appended to the file, one JSON object per line).
+
+    When enabled, spans are recorded for the application startup phases,
+    initialization, layout and settings of each plugin, each request and
+    callback, and each call to functions decorated with `@webvizstore` and
+    `@CACHE.memoize()` (with a `webviz.cache.hit` attribute). Spans started
+    while another span is active become its children, such that e.g. the
+    memoized function calls of a callback are found below the callback span.
+
+    When not enabled, `span()` returns a no-op context manager, and decorated
+    functions are not wrapped.
+
+    Spans written to a file are flushed after each export, and the file is
+    closed when the tracer provider is shut down, either by `shutdown()` or
+    at the latest when the interpreter exits.
+    """
+
+    def __init__(self) -> None:
+        self._provider: Optional[TracerProvider] = None
+        self._tracer: Optional[trace.Tracer] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def enabled() -> bool:
+        return bool(os.environ.get("WEBVIZ_TRACING", "").strip())
+
+    def span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> ContextManager[Optional[trace.Span]]:
+        """Returns a context manager recording a span, which is the current
+        span while the context is active."""
+        if not self.enabled():
+            return _NO_SPAN
+        return self._get_tracer().start_as_current_span(name, attributes=attributes)
+
+    def start_span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> Optional[Tuple[trace.Span, object]]:
+        """Starts a span, and makes it the current span until it is ended with
+        `end_span()`. For spans not covering a single block of code (e.g. the
+        application startup)."""
+        if not self.enabled():
+            return None
+        span = self._get_tracer().start_span(name, attributes=attributes)
+        return span, context.attach(trace.set_span_in_context(span))
+
+    @staticmethod
+    def end_span(started_span: Optional[Tuple[trace.Span, object]]) -> None:
+        if started_span is not None:
+            span, token = started_span
+            context.detach(token)
+            span.end()
+
+    def instrument(self, app: Dash) -> bool:
+        """Records spans for all requests and callbacks. Should be called before
+        `WEBVIZ_INSTRUMENTATION.instrument()`. Returns False, and does nothing,
+        if tracing is not enabled."""
+        if not self.enabled():
+            return False
+
+        flask.request_started.connect(self._request_started, app.server, weak=False)
+        flask.request_finished.connect(
+            WebvizTracing._request_finished, app.server, weak=False
+        )
+        flask.request_tearing_down.connect(
+            WebvizTracing._request_tearing_down, app.server, weak=False
+        )
+        WEBVIZ_INSTRUMENTATION.add_context(self._callback_span)
+        return True
+
+    def traced(self, func: Callable, name: str) -> Callable:
+        """Wraps a function, such that calls are recorded as spans. Returns the
+        function itself if tracing is not enabled."""
+        if not self.enabled():
+            return func
+
+        @functools.wraps(func)
+        def traced_func(*args: Any, **kwargs: Any) -> Any:
+            with self._get_tracer().start_as_current_span(name):
+                return func(*args, **kwargs)
+
+        return traced_func
+
+    def traced_memoize(self, memoize: Callable) -> Callable:
+        """Wraps a `CACHE.memoize()` decorator, such that calls to the memoized
+        function are recorded as spans, with an attribute telling if the value
+        was found in the cache. Returns the decorator itself if tracing is not
+        enabled."""
+        if not self.enabled():
+            return memoize
+
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def computed(*args: Any, **kwargs: Any) -> Any:
+                # Only called on cache misses, from within the span below
+                trace.get_current_span().set_attribute("webviz.cache.hit", False)
+                return func(*args, **kwargs)
+
+            memoized = memoize(computed)
+
+            @functools.wraps(memoized)
+            def traced_memoized(*args: Any, **kwargs: Any) -> Any:
+                with self._get_tracer().start_as_current_span(
+                    f"memoize {func.__qualname__}",
+                    attributes={"webviz.cache.hit": True},
+                ):
+                    return memoized(*args, **kwargs)
+
+            return traced_memoized
+
+        return decorator
+
+    def force_flush(self) -> None:
+        """Exports all ended spans which have not been exported yet."""
+        if self._provider is not None:
+            self._provider.force_flush()
+
+    def shutdown(self) -> None:
+        """Exports all remaining spans, and closes the span exporter (e.g. the
+        file spans are appended to). No spans are recorded afterwards."""
+        if self._provider is not None:
+            self._provider.shutdown()
+
+    def _get_tracer(self) -> trace.Tracer:
+        if self._tracer is None:
+            with self._lock:
+                if self._tracer is None:
+                    # shutdown_on_exit registers an atexit hook, exporting
+                    # remaining spans and closing the exporter on exit.
+                    self._provider = TracerProvider(
+                        resource=Resource.create({"service.name": "webviz"}),
+                        shutdown_on_exit=True,
+                    )
+                    self._provider.add_span_processor(
+                        BatchSpanProcessor(_span_exporter(os.environ["WEBVIZ_TRACING"]))
+                    )
+                    self._tracer = self._provider.get_tracer(__name__)
+        return self._tracer
+
+    def _request_started(self, _sender: flask.Flask, **_kwargs: Any) -> None:
+        request = flask.request
+        route = request.url_rule.rule if request.url_rule else "<unmatched>"
+        flask.request.environ["webviz.tracing_span"] = self.start_span(
+            f"{request.method} {route}",
+            {"http.request.method": request.method, "http.route": route},
+        )
+
+    @staticmethod
+    def _request_finished(
+        _sender: flask.Flask, response: flask.Response, **_kwargs: Any
+    ) -> None:
+        started_span = flask.request.environ.get("webviz.tracing_span")
+        if started_span is not None:
+            started_span[0].set_attribute(
+                "http.response.status_code", response.status_code
+            )
+
+    @staticmethod
+    def _request_tearing_down(_sender: flask.Flask, **_kwargs: Any) -> None:
+        WebvizTracing.end_span(flask.request.environ.pop("webviz.tracing_span", None))
+
+    @contextlib.contextmanager
+    def _callback_span(self, stats: CallbackStats) -> Iterator[None]:
+        with self._get_tracer().start_as_current_span(
+            f"callback {stats.callback_id}",
+            attributes={
+                "webviz.plugin": stats.plugin_class or "",
+                "webviz.plugin_id": stats.plugin_id or "",
+                "webviz.layout": stats.layout,
+            },
+            record_exception=False,
+            set_status_on_exception=False,
+        ) as span:
+            try:
+                yield
+            except PreventUpdate:
+                span.set_attribute("webviz.callback.prevented", True)
+                raise
+            except Exception as exc:
+                span.record_exception(exc)
+                span.set_status(trace.Status(trace.StatusCode.ERROR, str(exc)))
+                raise
+
+
+class _FileSpanExporter(ConsoleSpanExporter):
+    """Appends spans to a file, one JSON object per line. The file handle is
+    kept open for the lifetime of the exporter, and closed on `shutdown()`."""
+
+    def __init__(self, path: str) -> None:
+        super().__init__(
+            service_name="webviz",
+            out=open(path, "a", encoding="utf-8"),
+            formatter=lambda span: span.to_json(indent=None) + os.linesep,
+        )
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        if self.out.closed:
+            return SpanExportResult.FAILURE
+        result = super().export(spans)
+        self.out.flush()
+        return result
+
+    def shutdown(self) -> None:
+        self.out.close()
+
+
+def _span_exporter(destination: str) -> ConsoleSpanExporter:
+    if destination.strip().lower() == "console":
+        return ConsoleSpanExporter(service_name="webviz", out=sys.stdout)
+    return _FileSpanExporter(destination)
+
+
+WEBVIZ_TRACING = WebvizTracing()